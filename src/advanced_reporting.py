@@ -195,7 +195,8 @@ class AdvancedReportingHub:
                     filepath = self.html_generator.generate_interactive_html(
                         report_data,
                         analytics_dict,
-                        str(self.output_dir / f"interactive_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html")
+                        str(self.output_dir / f"interactive_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"),
+                        interactive=True
                     )
                     result['files_generated'].append(('Interactive HTML', filepath))
                     print(f"  ✓ Interactive HTML: {filepath}")
@@ -251,7 +251,10 @@ async def configure(config: ConfigModel):
 
     try:
         internal_config = convert_config_model_to_config(config)
-        orchestrator = MultibranchOrchestrator(internal_config)
+        previous, orchestrator = orchestrator, MultibranchOrchestrator(internal_config)
+        if previous is not None:
+            # Workflows already running on it keep their queued work
+            previous.close(wait=False)
 
         return {
             "status": "success",
@@ -631,7 +634,11 @@ async def configure_notifications(config: NotificationConfigModel):
             email_password=config.email_password
         )
 
+        previous = notification_manager
         notification_manager = NotificationManager(notification_config)
+        if previous is not None:
+            # Deliver what the old manager still holds and release its threads
+            previous.close()
 
         return {
             "status": "success",
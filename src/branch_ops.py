@@ -20,14 +20,18 @@ Optimizations:
 
 import os
 import logging
+import contextlib
+import threading
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Executor, ThreadPoolExecutor, as_completed
 
 from .utils import (
     execute_git_command,
+    execute_git_command_async,
     retry_with_backoff,
+    retry_with_backoff_async,
     validate_branch_name,
     CommandResult,
     GitCommandError,
@@ -70,6 +74,18 @@ class BranchOperations:
     optimized batch operations and error handling.
     """
 
+    # Operation name -> (method, how it takes the branch): "remote" passes
+    # branch and remote, "merge" the source branch and strategy, "name_only"
+    # just the branch name
+    OPERATION_SPEC: Dict[str, Tuple[str, str]] = {
+        "fetch": ("fetch_branch", "remote"),
+        "pull": ("pull_branch", "remote"),
+        "push": ("push_branch", "remote"),
+        "create": ("create_branch", "name_only"),
+        "switch": ("switch_branch", "name_only"),
+        "merge": ("merge_branch", "merge"),
+    }
+
     def __init__(self, repo_config: RepositoryConfig, retry_attempts: int = 3):
         """
         Initialize branch operations for a repository
@@ -255,20 +271,25 @@ class BranchOperations:
             error=result.stderr if not result.success else None
         )
 
-    def fetch_branch(self, branch_name: str, remote: str = "origin") -> OperationResult:
+    def fetch_branch(self, branch_name: str, remote: str = "origin", jobs: int = 1) -> OperationResult:
         """
         Fetch a branch from remote with retry logic
 
         Args:
             branch_name: Branch name to fetch
             remote: Remote name
+            jobs: Number of submodules git may fetch in parallel
 
         Returns:
             OperationResult with operation details
         """
+        args = ["fetch", remote, branch_name]
+        if jobs > 1:
+            args.insert(1, f"--jobs={jobs}")
+
         def fetch_operation():
             return execute_git_command(
-                ["fetch", remote, branch_name],
+                args,
                 self.repo_path,
                 timeout=60
             )
@@ -287,6 +308,117 @@ class BranchOperations:
             error=result.stderr if not result.success else None
         )
 
+    async def fetch_branch_async(
+        self,
+        branch_name: str,
+        remote: str = "origin",
+        jobs: int = 1
+    ) -> OperationResult:
+        """
+        Async variant of fetch_branch() that waits on git without a thread
+
+        Args:
+            branch_name: Branch name to fetch
+            remote: Remote name
+            jobs: Number of submodules git may fetch in parallel
+
+        Returns:
+            OperationResult with operation details
+        """
+        args = ["fetch", remote, branch_name]
+        if jobs > 1:
+            args.insert(1, f"--jobs={jobs}")
+
+        result = await retry_with_backoff_async(
+            lambda: execute_git_command_async(args, self.repo_path, timeout=60),
+            max_attempts=self.retry_attempts,
+            initial_delay=2.0
+        )
+
+        return OperationResult(
+            success=result.success,
+            branch_name=branch_name,
+            operation="fetch",
+            message=f"Fetched '{branch_name}' from '{remote}'" if result.success else "Failed to fetch branch",
+            error=result.stderr if not result.success else None
+        )
+
+    def fetch_remotes(
+        self,
+        remotes: List[str],
+        jobs: int = 1,
+        prune: bool = False
+    ) -> OperationResult:
+        """
+        Fetch every branch of the given remotes in one call with retry logic
+
+        Args:
+            remotes: Remote names
+            jobs: Number of remotes git may fetch in parallel
+            prune: Remove remote-tracking refs whose remote branch is gone
+
+        Returns:
+            OperationResult with operation details
+        """
+        args = ["fetch", "--prune"] if prune else ["fetch"]
+        if len(remotes) > 1:
+            args += [f"--jobs={max(1, jobs)}", "--multiple"]
+        args += remotes
+
+        def fetch_operation():
+            return execute_git_command(args, self.repo_path, timeout=120)
+
+        result = retry_with_backoff(
+            fetch_operation,
+            max_attempts=self.retry_attempts,
+            initial_delay=2.0
+        )
+
+        names = ", ".join(remotes)
+        return OperationResult(
+            success=result.success,
+            branch_name="*",
+            operation="fetch",
+            message=f"Fetched all branches from '{names}'" if result.success else "Failed to fetch remotes",
+            error=result.stderr if not result.success else None
+        )
+
+    def fast_forward_branch(
+        self,
+        branch_name: str,
+        remote: str = "origin",
+        current_branch: Optional[str] = None
+    ) -> OperationResult:
+        """
+        Fast-forward a local branch to its already fetched remote branch
+
+        The checked-out branch is merged with --ff-only; any other branch is
+        moved without touching the working tree.
+
+        Args:
+            branch_name: Branch name
+            remote: Remote name
+            current_branch: Currently checked-out branch, if known
+
+        Returns:
+            OperationResult with operation details (reported as a pull)
+        """
+        upstream = f"refs/remotes/{remote}/{branch_name}"
+        if branch_name == current_branch:
+            args = ["merge", "--ff-only", upstream]
+        else:
+            args = ["fetch", ".", f"{upstream}:refs/heads/{branch_name}"]
+
+        result = execute_git_command(args, self.repo_path)
+
+        return OperationResult(
+            success=result.success,
+            branch_name=branch_name,
+            operation="pull",
+            message=f"Fast-forwarded '{branch_name}' to '{remote}/{branch_name}'" if result.success else "Failed to fast-forward branch",
+            error=result.stderr if not result.success else None
+        )
+
     def pull_branch(self, branch_name: Optional[str] = None, remote: str = "origin") -> OperationResult:
         """
         Pull updates for a branch with retry logic
@@ -329,6 +461,47 @@ class BranchOperations:
             error=result.stderr if not result.success else None
         )
 
+    async def pull_branch_async(
+        self,
+        branch_name: Optional[str] = None,
+        remote: str = "origin"
+    ) -> OperationResult:
+        """
+        Async variant of pull_branch() that waits on git without a thread
+
+        Args:
+            branch_name: Branch name (None for current branch)
+            remote: Remote name
+
+        Returns:
+            OperationResult with operation details
+        """
+        current = branch_name or self.get_current_branch()
+        if not current:
+            return OperationResult(
+                success=False,
+                branch_name="unknown",
+                operation="pull",
+                message="Cannot determine current branch",
+                error="Detached HEAD state"
+            )
+
+        result = await retry_with_backoff_async(
+            lambda: execute_git_command_async(
+                ["pull", remote, current], self.repo_path, timeout=120
+            ),
+            max_attempts=self.retry_attempts,
+            initial_delay=2.0
+        )
+
+        return OperationResult(
+            success=result.success,
+            branch_name=current,
+            operation="pull",
+            message=f"Pulled updates for '{current}'" if result.success else "Failed to pull updates",
+            error=result.stderr if not result.success else None
+        )
+
     def merge_branch(
         self,
         source_branch: str,
@@ -428,6 +601,52 @@ class BranchOperations:
             error=result.stderr if not result.success else None
         )
 
+    async def push_branch_async(
+        self,
+        branch_name: Optional[str] = None,
+        remote: str = "origin",
+        set_upstream: bool = False
+    ) -> OperationResult:
+        """
+        Async variant of push_branch() that waits on git without a thread
+
+        Args:
+            branch_name: Branch to push (None for current)
+            remote: Remote name
+            set_upstream: Set upstream tracking
+
+        Returns:
+            OperationResult with operation details
+        """
+        current = branch_name or self.get_current_branch()
+        if not current:
+            return OperationResult(
+                success=False,
+                branch_name="unknown",
+                operation="push",
+                message="Cannot determine branch to push",
+                error="Detached HEAD state"
+            )
+
+        args = ["push"]
+        if set_upstream:
+            args.append("-u")
+        args.extend([remote, current])
+
+        result = await retry_with_backoff_async(
+            lambda: execute_git_command_async(args, self.repo_path, timeout=120),
+            max_attempts=self.retry_attempts,
+            initial_delay=2.0
+        )
+
+        return OperationResult(
+            success=result.success,
+            branch_name=current,
+            operation="push",
+            message=f"Pushed '{current}' to '{remote}'" if result.success else "Failed to push branch",
+            error=result.stderr if not result.success else None
+        )
+
     def get_branch_status(self, branch_name: str) -> Dict[str, any]:
         """
         Get detailed status of a branch
@@ -469,6 +688,107 @@ class BranchOperations:
 
         return status
 
+    def execute_operation(
+        self,
+        operation: str,
+        branch_name: str,
+        remote: str = "origin",
+        merge_strategy: str = "merge",
+        **kwargs
+    ) -> OperationResult:
+        """
+        Execute a named operation on a branch
+
+        Args:
+            operation: Operation name (fetch, pull, push, merge, etc.)
+            branch_name: Branch name
+            remote: Remote name for fetch, pull and push
+            merge_strategy: Strategy for merge
+            **kwargs: Additional arguments for the operation
+
+        Returns:
+            OperationResult
+        """
+        spec = self.OPERATION_SPEC.get(operation)
+        if spec is None:
+            return OperationResult(
+                success=False,
+                branch_name=branch_name,
+                operation=operation,
+                message=f"Unknown operation: {operation}",
+                error=f"Operation '{operation}' is not supported"
+            )
+
+        method_name, arg_kind = spec
+        op_func = getattr(self, method_name)
+
+        # Prepare arguments based on operation
+        if arg_kind == "remote":
+            return op_func(branch_name=branch_name, remote=remote, **kwargs)
+        if arg_kind == "merge":
+            return op_func(source_branch=branch_name, strategy=merge_strategy, **kwargs)
+        return op_func(branch_name=branch_name, **kwargs)
+
+    def execute_chain(
+        self,
+        branch_name: str,
+        operations: List[str],
+        remote: str = "origin",
+        merge_strategy: str = "merge",
+        repo_lock: Optional[threading.Lock] = None,
+        fetch_jobs: int = 1
+    ) -> List[OperationResult]:
+        """
+        Execute a chain of operations on one branch
+
+        Every operation runs even if an earlier one failed, so the report
+        covers the whole chain. When a repo_lock is given it is held for the
+        whole chain: fetch and push write FETCH_HEAD and remote-tracking refs
+        just as pull does, so no git write may overlap another in the same
+        repository.
+
+        Args:
+            branch_name: Branch name
+            operations: Operation names, in order
+            remote: Remote name for fetch, pull and push
+            merge_strategy: Strategy for merge
+            repo_lock: Lock serializing git writes in the repository
+            fetch_jobs: Number of submodules git may fetch in parallel
+
+        Returns:
+            List of OperationResults, one per operation
+        """
+        results = []
+
+        with repo_lock if repo_lock is not None else contextlib.nullcontext():
+            for operation in operations:
+                logger.info(
+                    f"Executing {operation} on {branch_name} "
+                    f"in {self.repo_config.name}"
+                )
+
+                kwargs = {"jobs": fetch_jobs} if operation == "fetch" else {}
+                try:
+                    result = self.execute_operation(
+                        operation, branch_name, remote, merge_strategy, **kwargs
+                    )
+                except Exception as e:
+                    logger.error(f"Error executing {operation} on {branch_name}: {e}")
+                    result = OperationResult(
+                        success=False,
+                        branch_name=branch_name,
+                        operation=operation,
+                        message="Operation failed with exception",
+                        error=str(e)
+                    )
+                results.append(result)
+
+                # Continue to next operation anyway for reporting
+                if not result.success:
+                    logger.warning(f"Operation {operation} failed on {branch_name}")
+
+        return results
+
 
 class MultiBranchOperations:
     """
@@ -482,7 +802,8 @@ class MultiBranchOperations:
         self,
         repo_config: RepositoryConfig,
         max_workers: int = 4,
-        retry_attempts: int = 3
+        retry_attempts: int = 3,
+        executor: Optional[Executor] = None
     ):
         """
         Initialize multi-branch operations
@@ -491,9 +812,18 @@ class MultiBranchOperations:
             repo_config: Repository configuration
             max_workers: Maximum concurrent operations
             retry_attempts: Retry attempts for network operations
+            executor: Shared executor to run on; without one each batch
+                creates and tears down its own pool of max_workers threads
         """
         self.branch_ops = BranchOperations(repo_config, retry_attempts)
         self.max_workers = max_workers
+        self.executor = executor
+
+    def _executor_scope(self):
+        """Context manager yielding the shared executor or a per-call pool"""
+        if self.executor is not None:
+            return contextlib.nullcontext(self.executor)
+        return ThreadPoolExecutor(max_workers=self.max_workers)
 
     def fetch_all_branches(
         self,
@@ -512,7 +842,7 @@ class MultiBranchOperations:
         """
         results = []
 
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+        with self._executor_scope() as executor:
             futures = {
                 executor.submit(self.branch_ops.fetch_branch, branch, remote): branch
                 for branch in branch_names
@@ -547,7 +877,7 @@ class MultiBranchOperations:
         """
         statuses = {}
 
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+        with self._executor_scope() as executor:
             futures = {
                 executor.submit(self.branch_ops.get_branch_status, branch): branch
                 for branch in branch_names
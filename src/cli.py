@@ -165,6 +165,12 @@ class NavaOpsCLI:
         if not sys.stdout.isatty():
             Colors.disable()
 
+    def _replace_orchestrator(self, orchestrator: MultibranchOrchestrator):
+        """Switch to a new orchestrator, shutting down the previous one's pool"""
+        if self.orchestrator is not None:
+            self.orchestrator.close()
+        self.orchestrator = orchestrator
+
     def load_config(self, path: Optional[str] = None):
         """Load configuration from file"""
         config_file = path or self.config_path or "config.json"
@@ -173,7 +179,7 @@ class NavaOpsCLI:
             if os.path.exists(config_file):
                 UI.info(f"Loading configuration from: {config_file}")
                 self.config = Config.from_file(config_file)
-                self.orchestrator = MultibranchOrchestrator(self.config)
+                self._replace_orchestrator(MultibranchOrchestrator(self.config))
                 UI.success("Configuration loaded successfully")
                 return True
             else:
@@ -495,7 +501,7 @@ class NavaOpsCLI:
             self.load_config(path)
         elif choice == "2":
             self.config = self.create_interactive_config()
-            self.orchestrator = MultibranchOrchestrator(self.config)
+            self._replace_orchestrator(MultibranchOrchestrator(self.config))
         elif choice == "3":
             if self.config:
                 print(f"\n{Colors.BOLD}Current Configuration:{Colors.RESET}")
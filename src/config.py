@@ -99,6 +99,24 @@ def detect_bom(file_path: str) -> str:
         return 'utf-8'
 
 
+def default_max_workers() -> int:
+    """
+    Pick a worker count for git operations
+
+    Git operations mostly wait on subprocesses and the network, so the pool
+    is sized at four workers per available core, between 4 and 32. On Linux
+    the CPU affinity mask is used so container CPU limits are respected.
+
+    Returns:
+        Number of worker threads
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except (AttributeError, OSError):
+        cpus = os.cpu_count() or 1
+    return max(4, min(32, cpus * 4))
+
+
 # ============================================================================
 # Configuration Dataclasses
 # ============================================================================
@@ -142,7 +160,7 @@ class Config:
     repositories: List[RepositoryConfig] = field(default_factory=list)
     reporting: ReportingConfig = field(default_factory=ReportingConfig)
     parallel_operations: bool = True
-    max_workers: int = 4
+    max_workers: int = 0  # 0 picks default_max_workers()
     retry_attempts: int = 3
     retry_delay: float = 2.0
 
@@ -286,7 +304,7 @@ class Config:
             repositories=repos,
             reporting=reporting,
             parallel_operations=data.get('parallel_operations', True),
-            max_workers=data.get('max_workers', 4),
+            max_workers=data.get('max_workers', 0),
             retry_attempts=data.get('retry_attempts', 3),
             retry_delay=data.get('retry_delay', 2.0)
         )
@@ -321,8 +339,8 @@ class Config:
             if not os.path.exists(repo.path):
                 errors.append(f"Repository path does not exist: {repo.path}")
 
-        if self.max_workers < 1:
-            errors.append("max_workers must be at least 1")
+        if self.max_workers < 0:
+            errors.append("max_workers cannot be negative (use 0 for automatic sizing)")
 
         if self.retry_attempts < 0:
             errors.append("retry_attempts cannot be negative")
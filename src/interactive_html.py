@@ -1,7 +1,8 @@
 """
 Interactive HTML Report Generator with Chart.js Visualizations
 
-Creates next-generation HTML reports with embedded Chart.js charts:
+Creates next-generation HTML reports with static SVG charts, or Chart.js
+charts when interactive output is requested:
 - Success rate pie charts
 - Operation timeline visualizations
 - Branch health gauges
@@ -9,55 +10,246 @@ Creates next-generation HTML reports with embedded Chart.js charts:
 - Repository comparison charts
 """
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Callable, Optional
 from datetime import datetime
 from collections import defaultdict
+import functools
+import gzip
+import hashlib
+import html
+import io
 import json
+import os
+import shutil
+import tempfile
 
+try:
+    import orjson
+except ImportError:  # Optional dependency
+    orjson = None
 
 
+# Buffer size for streaming the report to disk
+_WRITE_BUFFER_SIZE = 64 * 1024
 
-def safe_get(obj, key, default=None):
+# Size limits that keep large reports readable and bounded
+MAX_CHART_REPOSITORIES = 20
+DEFAULT_MAX_TABLE_ROWS = 1000
+
+# Suggested location for the generated report cache
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'nava_ops')
+
+# Branch table row templates, formatted once per row
+_ROW_TMPL = "<tr><td>{repo}</td><td><code>{branch}</code></td><td>{status}</td><td>{ops}</td>{health}</tr>\n"
+_HEALTH_CELL_TMPL = (
+    '<td><span class="badge {badge_class}">{score_text}</span>'
+    '<div class="health-bar"><div class="health-bar-fill {health_class}" style="width: {score}%"></div></div></td>'
+)
+_STATUS_SUCCESS = '<span class="badge badge-success">✓ Success</span>'
+_STATUS_FAILED = '<span class="badge badge-danger">✗ Failed</span>'
+
+# SVG chart colors, matching the Chart.js scripts
+_COLOR_SUCCESS = 'rgba(46, 204, 113, 0.8)'
+_COLOR_WARNING = 'rgba(243, 156, 18, 0.8)'
+_COLOR_FAILED = 'rgba(231, 76, 60, 0.8)'
+_COLOR_PRIMARY = 'rgba(102, 126, 234, 0.8)'
+
+
+def safe_get(obj: Any, key: str, default: Any = None) -> Any:
     """Safely get value from either a dictionary or object attribute"""
     if isinstance(obj, dict):
         return obj.get(key, default)
     else:
         return getattr(obj, key, default)
 
+
+def _format_metric(value: Any) -> str:
+    """Format a metric to one decimal place, skipping the float formatter for ints"""
+    if isinstance(value, int):
+        return str(value)
+    return f"{value:.1f}"
+
+
+@functools.lru_cache(maxsize=4096)
+def _esc(value: str) -> str:
+    """HTML-escape a user-supplied string, caching repeated values"""
+    return html.escape(value)
+
+
+def _json_payload(data: Any) -> str:
+    """Serialize data compactly for embedding in a <script> element"""
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    else:
+        payload = json.dumps(data, separators=(',', ':'))
+    return payload.replace('</', '<\\/')
+
+
+def _generated_label(report: Any, cached: bool) -> Optional[str]:
+    """
+    Generation time shown in the report header
+
+    The report's own timestamp is preferred; it is part of the cache key, so
+    a cached page still shows the right time. Without one the current time
+    is used, unless the page is cached, in which case no time is shown.
+    """
+    timestamp = safe_get(report, 'timestamp')
+    if isinstance(timestamp, str):
+        try:
+            timestamp = datetime.fromisoformat(timestamp)
+        except ValueError:
+            return timestamp
+    if isinstance(timestamp, datetime):
+        return timestamp.strftime('%Y-%m-%d %H:%M:%S')
+    if cached:
+        return None
+    return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+
 class InteractiveHTMLGenerator:
     """
-    Generates interactive HTML reports with Chart.js visualizations
+    Generates interactive HTML reports with chart visualizations
 
-    Chart.js is embedded inline (no external dependencies) for visualizations.
+    Charts are rendered server-side as inline SVG, so reports open offline
+    without external dependencies. Chart.js (loaded from a CDN) is only used
+    for interactive reports with analytics.
     """
 
     @staticmethod
     def generate_interactive_html(
         report: Dict,
         analytics: Dict = None,
-        filename: str = None
+        filename: str = None,
+        max_rows: Optional[int] = DEFAULT_MAX_TABLE_ROWS,
+        interactive: bool = False,
+        cache_dir: Optional[str] = None
     ) -> str:
         """
-        Generate interactive HTML report with embedded Chart.js visualizations
+        Generate an HTML report with charts, static SVG unless interactive is set
+
+        Args:
+            report: Report data (dict or object)
+            analytics: Optional analytics data
+            filename: Output file path (gzip-compressed if it ends in .gz)
+            max_rows: Maximum branch table rows; the remainder is summarized
+                      in a single row (None renders every branch)
+            interactive: Render Chart.js charts instead of static SVG when
+                         analytics are available
+            cache_dir: Directory caching generated reports by a hash of their
+                       inputs, e.g. DEFAULT_CACHE_DIR (None disables caching)
+
+        Returns:
+            Path to the generated file
         """
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"nava_ops_interactive_{timestamp}.html"
 
-        summary = safe_get(report, 'summary', {})
-        branch_reports = safe_get(report, 'branch_reports', [])
+        compress = filename.endswith('.gz')
+
+        cache_path = None
+        if cache_dir:
+            key = InteractiveHTMLGenerator._cache_key(report, analytics, max_rows, interactive)
+            cache_path = os.path.join(cache_dir, f"{key}.html.gz" if compress else f"{key}.html")
+            if os.path.exists(cache_path):
+                shutil.copyfile(cache_path, filename)
+                return filename
+
+        # Stream fragments straight to the file instead of building the whole
+        # document in memory first. The file is opened in binary mode so each
+        # fragment is encoded exactly once and no newline translation happens.
+        if compress:
+            output = gzip.open(filename, 'wb')
+        else:
+            output = open(filename, 'wb', buffering=_WRITE_BUFFER_SIZE)
+
+        with output as f:
+            def write(chunk: str) -> None:
+                f.write(chunk.encode('utf-8'))
+
+            InteractiveHTMLGenerator._write_report(
+                write, report, analytics, max_rows, interactive,
+                _generated_label(report, cached=cache_path is not None)
+            )
+
+        if cache_path:
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+                os.close(fd)
+                try:
+                    shutil.copyfile(filename, tmp_path)
+                    os.replace(tmp_path, cache_path)
+                except OSError:
+                    os.unlink(tmp_path)
+                    raise
+            except OSError:
+                # Caching is best-effort; the report itself was written
+                pass
 
-        # Prepare data for charts
-        chart_data = InteractiveHTMLGenerator._prepare_chart_data(report, analytics)
+        return filename
+
+    @staticmethod
+    def _cache_key(
+        report: Any,
+        analytics: Optional[Dict],
+        max_rows: Optional[int],
+        interactive: bool
+    ) -> str:
+        """Content hash identifying a report's generation inputs"""
+        data = json.dumps(
+            [report, analytics, max_rows, interactive],
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.blake2b(data.encode('utf-8'), digest_size=20).hexdigest()
+
+    @staticmethod
+    def _write_report(
+        write: Callable[[str], Any],
+        report: Dict,
+        analytics: Dict = None,
+        max_rows: Optional[int] = DEFAULT_MAX_TABLE_ROWS,
+        interactive: bool = False,
+        generated: Optional[str] = None
+    ) -> None:
+        """
+        Write the complete HTML document through the ``write`` callable
 
-        html = f"""<!DOCTYPE html>
+        ``generated`` is the generation time shown in the header (omitted
+        when None).
+        """
+        summary = safe_get(report, 'summary', {})
+        branch_reports = safe_get(report, 'branch_reports', [])
+        use_chartjs = interactive and bool(analytics)
+        show_health = bool(analytics) and 'branch_health' in analytics
+        successful = safe_get(summary, 'successful_operations', 0)
+        failed = safe_get(summary, 'failed_operations', 0)
+        generated_html = f"Generated: {_esc(generated)} | " if generated else ""
+
+        table = None
+        if not use_chartjs:
+            # Static charts are rendered above the branch table, so collect
+            # the chart data up front. The table is bounded by max_rows, so
+            # buffering it until its place in the document is cheap.
+            table = io.StringIO()
+            chart_data = InteractiveHTMLGenerator._build_report_parts(
+                branch_reports, analytics, table.write, max_rows
+            )
+
+        write("""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Nava Ops - Interactive Report</title>
-    <script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.min.js"></script>
-    <style>
+""")
+
+        if use_chartjs:
+            write("""    <script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.min.js"></script>
+""")
+
+        write(f"""    <style>
         * {{
             margin: 0;
             padding: 0;
@@ -312,7 +504,7 @@ class InteractiveHTMLGenerator:
         <!-- Header -->
         <div class="header">
             <h1>📊 Nava Ops - Interactive Report</h1>
-            <p>Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} | Next-Generation Git Orchestration</p>
+            <p>{generated_html}Next-Generation Git Orchestration</p>
         </div>
 
         <!-- Dashboard Metrics -->
@@ -324,7 +516,7 @@ class InteractiveHTMLGenerator:
             </div>
             <div class="metric-card">
                 <h3>Success Rate</h3>
-                <div class="value">{safe_get(summary, 'success_rate', 0):.1f}%</div>
+                <div class="value">{_format_metric(safe_get(summary, 'success_rate', 0))}%</div>
                 <div class="label">{safe_get(summary, 'successful_operations', 0)}/{safe_get(summary, 'total_operations', 0)} operations</div>
             </div>
             <div class="metric-card">
@@ -334,78 +526,120 @@ class InteractiveHTMLGenerator:
             </div>
             <div class="metric-card">
                 <h3>Duration</h3>
-                <div class="value">{safe_get(summary, 'duration_seconds', 0):.1f}s</div>
+                <div class="value">{_format_metric(safe_get(summary, 'duration_seconds', 0))}s</div>
                 <div class="label">Total execution time</div>
             </div>
         </div>
 
         <!-- Charts Grid -->
         <div class="charts-grid">
-            <!-- Success Rate Pie Chart -->
-            <div class="chart-card">
-                <h2>📈 Success Distribution</h2>
-                <div class="chart-container">
-                    <canvas id="successChart"></canvas>
-                </div>
-            </div>
-
-            <!-- Operations by Type -->
-            <div class="chart-card">
-                <h2>🔧 Operations by Type</h2>
-                <div class="chart-container">
-                    <canvas id="operationsChart"></canvas>
-                </div>
-            </div>
-
-            <!-- Repository Comparison -->
-            <div class="chart-card full-width-chart">
-                <h2>📁 Repository Comparison</h2>
-                <div class="chart-container">
-                    <canvas id="repositoryChart"></canvas>
-                </div>
-            </div>
-"""
+""")
+
+        if use_chartjs:
+            success_chart = '<canvas id="successChart"></canvas>'
+            operations_chart = '<canvas id="operationsChart"></canvas>'
+            repository_chart = '<canvas id="repositoryChart"></canvas>'
+            health_chart = '<canvas id="healthChart"></canvas>'
+        else:
+            operations = chart_data['operations_by_type']
+            repositories = chart_data['repository_stats']
+            health = chart_data['branch_health']
+
+            success_chart = InteractiveHTMLGenerator._render_svg_doughnut(successful, failed)
+            operations_chart = InteractiveHTMLGenerator._render_svg_bar(
+                list(operations),
+                [('Operations Count', list(operations.values()), _COLOR_PRIMARY)]
+            )
+            repository_chart = InteractiveHTMLGenerator._render_svg_bar(
+                list(repositories),
+                [
+                    ('Successful', [r['success'] for r in repositories.values()], _COLOR_SUCCESS),
+                    ('Failed', [r['failed'] for r in repositories.values()], _COLOR_FAILED)
+                ]
+            )
+            health_chart = InteractiveHTMLGenerator._render_svg_bar(
+                list(health),
+                [('Health Score', list(health.values()), [
+                    _COLOR_SUCCESS if score >= 80 else _COLOR_WARNING if score >= 60 else _COLOR_FAILED
+                    for score in health.values()
+                ])],
+                max_value=100
+            )
+
+        write(InteractiveHTMLGenerator._chart_card(
+            'Success Rate Pie Chart', '📈 Success Distribution', success_chart
+        ))
+        write(InteractiveHTMLGenerator._chart_card(
+            'Operations by Type', '🔧 Operations by Type', operations_chart
+        ))
+        write(InteractiveHTMLGenerator._chart_card(
+            'Repository Comparison', '📁 Repository Comparison', repository_chart, full_width=True
+        ))
 
         # Add branch health chart if analytics available
-        if analytics and 'branch_health' in analytics:
-            html += """
-            <!-- Branch Health -->
-            <div class="chart-card full-width-chart">
-                <h2>🏥 Branch Health Scores</h2>
-                <div class="chart-container">
-                    <canvas id="healthChart"></canvas>
-                </div>
-            </div>
-"""
+        if show_health:
+            write(InteractiveHTMLGenerator._chart_card(
+                'Branch Health', '🏥 Branch Health Scores', health_chart, full_width=True
+            ))
 
-        html += """
+        write("""
         </div>
-"""
+""")
 
         # Add analytics insights if available
         if analytics:
-            html += InteractiveHTMLGenerator._generate_insights_section(analytics)
-
-        # Add detailed branch table
-        html += InteractiveHTMLGenerator._generate_branch_table(branch_reports, analytics)
+            InteractiveHTMLGenerator._generate_insights_section(analytics, write)
+
+        # Add detailed branch table, collecting chart data along the way
+        if table is not None:
+            write(table.getvalue())
+        else:
+            chart_data = InteractiveHTMLGenerator._build_report_parts(
+                branch_reports, analytics, write, max_rows
+            )
+
+        if not use_chartjs:
+            write("""
+        <div class="footer">
+            <p>Powered by Nava Ops v2.0 - Revolutionary Git Orchestration</p>
+        </div>
+    </div>
+</body>
+</html>
+""")
+            return
+
+        # Chart data is emitted once as a JSON payload that the chart
+        # scripts parse, rather than being spliced into the JavaScript
+        payload = {
+            'success': [successful, failed],
+            'ops': chart_data['operations_by_type'],
+            'repos': chart_data['repository_stats'],
+            'health': chart_data['branch_health']
+        }
 
-        # JavaScript for charts
-        html += f"""
+        write("""
         <div class="footer">
             <p>Powered by Nava Ops v2.0 - Revolutionary Git Orchestration</p>
         </div>
     </div>
 
+    <script id="nava-data" type="application/json">""")
+        write(_json_payload(payload))
+        write("""</script>
+
     <script>
+        const D = JSON.parse(document.getElementById('nava-data').textContent);
+
         // Chart.js configuration
         Chart.defaults.font.family = "'Segoe UI', Tahoma, Geneva, Verdana, sans-serif";
         Chart.defaults.color = '#666';
 
         // Success Rate Pie Chart
-        const successData = {{
+        const successData = {
             labels: ['Successful', 'Failed'],
-            datasets: [{{
-                data: [{safe_get(summary, 'successful_operations', 0)}, {safe_get(summary, 'failed_operations', 0)}],
+            datasets: [{
+                data: D.success,
                 backgroundColor: [
                     'rgba(46, 204, 113, 0.8)',
                     'rgba(231, 76, 60, 0.8)'
@@ -415,238 +649,316 @@ class InteractiveHTMLGenerator:
                     'rgba(231, 76, 60, 1)'
                 ],
                 borderWidth: 2
-            }}]
-        }};
+            }]
+        };
 
-        new Chart(document.getElementById('successChart'), {{
+        new Chart(document.getElementById('successChart'), {
             type: 'doughnut',
             data: successData,
-            options: {{
+            options: {
                 responsive: true,
                 maintainAspectRatio: false,
-                plugins: {{
-                    legend: {{
+                plugins: {
+                    legend: {
                         position: 'bottom'
-                    }},
-                    title: {{
+                    },
+                    title: {
                         display: false
-                    }}
-                }}
-            }}
-        }});
+                    }
+                }
+            }
+        });
 
         // Operations by Type Chart
-        const operationsData = {json.dumps(safe_get(chart_data, 'operations_by_type', {}))};
-        new Chart(document.getElementById('operationsChart'), {{
+        const operationsData = D.ops;
+        new Chart(document.getElementById('operationsChart'), {
             type: 'bar',
-            data: {{
+            data: {
                 labels: Object.keys(operationsData),
-                datasets: [{{
+                datasets: [{
                     label: 'Operations Count',
                     data: Object.values(operationsData),
                     backgroundColor: 'rgba(102, 126, 234, 0.8)',
                     borderColor: 'rgba(102, 126, 234, 1)',
                     borderWidth: 2
-                }}]
-            }},
-            options: {{
+                }]
+            },
+            options: {
                 responsive: true,
                 maintainAspectRatio: false,
-                plugins: {{
-                    legend: {{
+                plugins: {
+                    legend: {
                         display: false
-                    }}
-                }},
-                scales: {{
-                    y: {{
+                    }
+                },
+                scales: {
+                    y: {
                         beginAtZero: true,
-                        ticks: {{
+                        ticks: {
                             stepSize: 1
-                        }}
-                    }}
-                }}
-            }}
-        }});
+                        }
+                    }
+                }
+            }
+        });
 
         // Repository Comparison Chart
-        const repositoryData = {json.dumps(safe_get(chart_data, 'repository_stats', {}))};
-        new Chart(document.getElementById('repositoryChart'), {{
+        const repositoryData = D.repos;
+        new Chart(document.getElementById('repositoryChart'), {
             type: 'bar',
-            data: {{
+            data: {
                 labels: Object.keys(repositoryData),
                 datasets: [
-                    {{
+                    {
                         label: 'Successful',
                         data: Object.values(repositoryData).map(r => r.success),
                         backgroundColor: 'rgba(46, 204, 113, 0.8)',
                         borderColor: 'rgba(46, 204, 113, 1)',
                         borderWidth: 2
-                    }},
-                    {{
+                    },
+                    {
                         label: 'Failed',
                         data: Object.values(repositoryData).map(r => r.failed),
                         backgroundColor: 'rgba(231, 76, 60, 0.8)',
                         borderColor: 'rgba(231, 76, 60, 1)',
                         borderWidth: 2
-                    }}
+                    }
                 ]
-            }},
-            options: {{
+            },
+            options: {
                 responsive: true,
                 maintainAspectRatio: false,
-                plugins: {{
-                    legend: {{
+                plugins: {
+                    legend: {
                         position: 'bottom'
-                    }}
-                }},
-                scales: {{
-                    x: {{
+                    }
+                },
+                scales: {
+                    x: {
                         stacked: false
-                    }},
-                    y: {{
+                    },
+                    y: {
                         beginAtZero: true,
-                        ticks: {{
+                        ticks: {
                             stepSize: 1
-                        }}
-                    }}
-                }}
-            }}
-        }});
-"""
+                        }
+                    }
+                }
+            }
+        });
+""")
 
         # Add branch health chart if analytics available
-        if analytics and 'branch_health' in analytics:
-            health_data = safe_get(chart_data, 'branch_health', {})
-            html += f"""
+        if show_health:
+            write("""
         // Branch Health Chart
-        const healthData = {json.dumps(health_data)};
-        new Chart(document.getElementById('healthChart'), {{
+        const healthData = D.health;
+        new Chart(document.getElementById('healthChart'), {
             type: 'horizontalBar',
-            data: {{
+            data: {
                 labels: Object.keys(healthData),
-                datasets: [{{
+                datasets: [{
                     label: 'Health Score',
                     data: Object.values(healthData),
-                    backgroundColor: Object.values(healthData).map(score => {{
+                    backgroundColor: Object.values(healthData).map(score => {
                         if (score >= 80) return 'rgba(46, 204, 113, 0.8)';
                         if (score >= 60) return 'rgba(243, 156, 18, 0.8)';
                         return 'rgba(231, 76, 60, 0.8)';
-                    }}),
-                    borderColor: Object.values(healthData).map(score => {{
+                    }),
+                    borderColor: Object.values(healthData).map(score => {
                         if (score >= 80) return 'rgba(46, 204, 113, 1)';
                         if (score >= 60) return 'rgba(243, 156, 18, 1)';
                         return 'rgba(231, 76, 60, 1)';
-                    }}),
+                    }),
                     borderWidth: 2
-                }}]
-            }},
-            options: {{
+                }]
+            },
+            options: {
                 indexAxis: 'y',
                 responsive: true,
                 maintainAspectRatio: false,
-                plugins: {{
-                    legend: {{
+                plugins: {
+                    legend: {
                         display: false
-                    }}
-                }},
-                scales: {{
-                    x: {{
+                    }
+                },
+                scales: {
+                    x: {
                         beginAtZero: true,
                         max: 100
-                    }}
-                }}
-            }}
-        }});
-"""
+                    }
+                }
+            }
+        });
+""")
 
-        html += """
+        write("""
     </script>
 </body>
 </html>
-"""
-
-        # Write to file
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(html)
-
-        return filename
+""")
 
     @staticmethod
-    def _prepare_chart_data(report: Dict, analytics: Dict = None) -> Dict:
-        """Prepare data for charts"""
-        branch_reports = safe_get(report, 'branch_reports', [])
-
-        # Operations by type
-        operations_by_type = {}
-        for branch_report in branch_reports:
-            for operation in safe_get(branch_report, 'operations', []):
-                op_type = safe_get(operation, 'operation', 'unknown')
-                operations_by_type[op_type] = operations_by_type.get(op_type, 0) + 1
-
-        # Repository stats
-        repository_stats = {}
-        for branch_report in branch_reports:
-            repo = safe_get(branch_report, 'repository', 'unknown')
-            if repo not in repository_stats:
-                repository_stats[repo] = {'success': 0, 'failed': 0}
+    def _chart_card(comment: str, title: str, body: str, full_width: bool = False) -> str:
+        """Wrap a chart body in its card markup"""
+        card_class = "chart-card full-width-chart" if full_width else "chart-card"
+        return f"""
+            <!-- {comment} -->
+            <div class="{card_class}">
+                <h2>{title}</h2>
+                <div class="chart-container">
+                    {body}
+                </div>
+            </div>
+"""
 
-            if safe_get(branch_report, 'success', False):
-                repository_stats[repo]['success'] += 1
-            else:
-                repository_stats[repo]['failed'] += 1
+    @staticmethod
+    def _render_svg_doughnut(successful: int, failed: int) -> str:
+        """Render the success distribution doughnut as inline SVG"""
+        total = successful + failed
+        # A radius of 100 / (2 * pi) makes the circumference exactly 100, so
+        # the dash lengths below are plain percentages
+        ring = 'cx="21" cy="21" r="15.9155" fill="none" stroke-width="6"'
+        parts = [
+            '<svg viewBox="0 0 42 50" width="100%" height="100%" role="img">',
+            f'<circle {ring} stroke="{_COLOR_FAILED if failed else "#eee"}"/>'
+        ]
+
+        if total:
+            success_pct = successful / total * 100
+            parts.append(
+                f'<circle {ring} stroke="{_COLOR_SUCCESS}" '
+                f'stroke-dasharray="{success_pct:.2f} {100 - success_pct:.2f}" stroke-dashoffset="25"/>'
+            )
+            parts.append(
+                f'<text x="21" y="22.5" font-size="5" text-anchor="middle" fill="#333">{success_pct:.1f}%</text>'
+            )
+
+        parts.append(
+            f'<text x="21" y="47" font-size="3" text-anchor="middle" fill="#666">'
+            f'Successful: {successful} · Failed: {failed}</text>'
+        )
+        parts.append('</svg>')
+
+        return ''.join(parts)
 
-        # Branch health (if analytics available)
-        branch_health = {}
-        if analytics and 'branch_health' in analytics:
-            for health in analytics['branch_health'][:10]:  # Top 10
-                branch_name = safe_get(health, 'branch_name', 'unknown')
-                health_score = safe_get(health, 'health_score', 0)
-                branch_health[branch_name] = health_score
+    @staticmethod
+    def _render_svg_bar(labels: List[str], series: List[tuple], max_value: float = None) -> str:
+        """
+        Render a horizontal bar chart as inline SVG
 
-        return {
-            'operations_by_type': operations_by_type,
-            'repository_stats': repository_stats,
-            'branch_health': branch_health
-        }
+        Args:
+            labels: One label per bar
+            series: ``(name, values, color)`` tuples stacked left to right;
+                    ``color`` is either one color or a list with one per bar
+            max_value: Value of a full-width bar (defaults to the largest total)
+        """
+        label_width = 160
+        bar_width = 400
+        row_height = 24
+
+        totals = [sum(values[i] for _, values, _ in series) for i in range(len(labels))]
+        scale = bar_width / (max_value or max(totals, default=0) or 1)
+
+        parts = [
+            f'<svg viewBox="0 0 {label_width + bar_width + 50} {max(row_height * len(labels), row_height)}" '
+            'width="100%" height="100%" preserveAspectRatio="xMinYMin meet" '
+            'font-size="12" fill="#666" role="img">'
+        ]
+
+        for i, label in enumerate(labels):
+            y = i * row_height
+            parts.append(
+                f'<text x="{label_width - 8}" y="{y + 16}" text-anchor="end">{_esc(str(label))}</text>'
+            )
+
+            x = label_width
+            for name, values, color in series:
+                width = values[i] * scale
+                if width > 0:
+                    fill = color[i] if isinstance(color, list) else color
+                    parts.append(
+                        f'<rect x="{x:.1f}" y="{y + 4}" width="{width:.1f}" height="{row_height - 8}" '
+                        f'fill="{fill}"><title>{_esc(name)}: {values[i]}</title></rect>'
+                    )
+                    x += width
+
+            parts.append(f'<text x="{x + 6:.1f}" y="{y + 16}">{totals[i]:g}</text>')
+
+        parts.append('</svg>')
+
+        return ''.join(parts)
 
     @staticmethod
-    def _generate_insights_section(analytics: Dict) -> str:
-        """Generate insights panel HTML"""
-        html = """
+    def _generate_insights_section(analytics: Dict, write: Callable[[str], Any]) -> None:
+        """Write insights panel HTML"""
+        if 'key_insights' not in analytics and 'action_items' not in analytics:
+            return
+
+        write("""
         <!-- Insights Panel -->
         <div class="insights-panel">
             <h2>💡 Key Insights</h2>
-"""
+""")
 
         if 'key_insights' in analytics:
             for insight in analytics['key_insights']:
-                html += f"""
+                write(f"""
             <div class="insight-item">
-                {insight}
+                {_esc(str(insight))}
             </div>
-"""
+""")
 
         if 'action_items' in analytics:
-            html += """
+            write("""
             <h2 style="margin-top: 30px;">✅ Recommended Actions</h2>
-"""
+""")
             for action in analytics['action_items']:
-                html += f"""
+                write(f"""
             <div class="insight-item">
-                {action}
+                {_esc(str(action))}
             </div>
-"""
+""")
 
-        html += """
+        write("""
         </div>
-"""
-
-        return html
+""")
 
     @staticmethod
-    def _generate_branch_table(branch_reports: List[Dict], analytics: Dict = None) -> str:
-        """Generate detailed branch table"""
-        html = """
+    def _build_report_parts(
+        branch_reports: List[Dict],
+        analytics: Dict,
+        write: Callable[[str], Any],
+        max_rows: Optional[int] = DEFAULT_MAX_TABLE_ROWS
+    ) -> Dict:
+        """
+        Write the detailed branch table and collect chart data in a single
+        pass over the branch reports
+
+        Rows beyond ``max_rows`` still count towards the chart data but are
+        collapsed into a single summary row, and repositories beyond the top
+        MAX_CHART_REPOSITORIES are grouped under "Other".
+        """
+        has_health = bool(analytics) and 'branch_health' in analytics
+
+        operations_by_type: Dict[str, int] = {}
+        repository_stats: Dict[str, Dict[str, int]] = {}
+
+        # Branch health (if analytics available) and lookup for table rows
+        branch_health: Dict[str, float] = {}
+        health_lookup: Dict[str, float] = {}
+        if has_health:
+            for health in analytics['branch_health'][:10]:  # Top 10
+                branch_name = safe_get(health, 'branch_name', 'unknown')
+                health_score = safe_get(health, 'health_score', 0)
+                branch_health[branch_name] = health_score
+
+            for health in analytics['branch_health']:
+                key = f"{safe_get(health, 'repository', '')}:{safe_get(health, 'branch_name', '')}"
+                health_lookup[key] = safe_get(health, 'health_score', 0)
+
+        if branch_reports:
+            write("""
         <!-- Branch Details Table -->
         <div class="data-table">
             <h2>📋 Branch Details</h2>
@@ -657,43 +969,47 @@ class InteractiveHTMLGenerator:
                         <th>Branch</th>
                         <th>Status</th>
                         <th>Operations</th>
-"""
+""")
 
-        if analytics and 'branch_health' in analytics:
-            html += """
+            if has_health:
+                write("""
                         <th>Health Score</th>
-"""
+""")
 
-        html += """
+            write("""
                     </tr>
                 </thead>
                 <tbody>
-"""
-
-        # Create health lookup
-        health_lookup = {}
-        if analytics and 'branch_health' in analytics:
-            for health in analytics['branch_health']:
-                key = f"{safe_get(health, 'repository', '')}:{safe_get(health, 'branch_name', '')}"
-                health_lookup[key] = safe_get(health, 'health_score', 0)
+""")
 
+        rows_written: int = 0
         for branch_report in branch_reports:
             repo = safe_get(branch_report, 'repository', 'unknown')
             branch = safe_get(branch_report, 'branch_name', 'unknown')
             success = safe_get(branch_report, 'success', False)
-            op_count = len(safe_get(branch_report, 'operations', []))
+            operations = safe_get(branch_report, 'operations', [])
 
-            status_badge = '<span class="badge badge-success">✓ Success</span>' if success else '<span class="badge badge-danger">✗ Failed</span>'
+            # Chart data: operations by type and repository stats
+            for operation in operations:
+                op_type = safe_get(operation, 'operation', 'unknown')
+                operations_by_type[op_type] = operations_by_type.get(op_type, 0) + 1
 
-            html += f"""
-                    <tr>
-                        <td>{repo}</td>
-                        <td><code>{branch}</code></td>
-                        <td>{status_badge}</td>
-                        <td>{op_count}</td>
-"""
+            stats = repository_stats.get(repo)
+            if stats is None:
+                stats = repository_stats[repo] = {'success': 0, 'failed': 0}
 
-            if analytics and 'branch_health' in analytics:
+            if success:
+                stats['success'] += 1
+            else:
+                stats['failed'] += 1
+
+            if max_rows is not None and rows_written >= max_rows:
+                continue
+            rows_written += 1
+
+            # Table row
+            health_cell = ""
+            if has_health:
                 key = f"{repo}:{branch}"
                 health_score = health_lookup.get(key, 0)
 
@@ -707,23 +1023,52 @@ class InteractiveHTMLGenerator:
                     health_class = "health-poor"
                     badge_class = "badge-danger"
 
-                html += f"""
-                        <td>
-                            <span class="badge {badge_class}">{health_score:.1f}</span>
-                            <div class="health-bar">
-                                <div class="health-bar-fill {health_class}" style="width: {health_score}%"></div>
-                            </div>
-                        </td>
-"""
-
-            html += """
+                health_cell = _HEALTH_CELL_TMPL.format(
+                    badge_class=badge_class,
+                    health_class=health_class,
+                    score=health_score,
+                    score_text=_format_metric(health_score)
+                )
+
+            write(_ROW_TMPL.format(
+                repo=_esc(str(repo)),
+                branch=_esc(str(branch)),
+                status=_STATUS_SUCCESS if success else _STATUS_FAILED,
+                ops=len(operations),
+                health=health_cell
+            ))
+
+        if branch_reports:
+            hidden_rows = len(branch_reports) - rows_written
+            if hidden_rows > 0:
+                write(f"""
+                    <tr>
+                        <td colspan="{5 if has_health else 4}"><em>+ {hidden_rows} more branches</em></td>
                     </tr>
-"""
+""")
 
-        html += """
+            write("""
                 </tbody>
             </table>
         </div>
-"""
+""")
+
+        # Keep the repository chart readable by grouping the long tail
+        if len(repository_stats) > MAX_CHART_REPOSITORIES:
+            ranked = sorted(
+                repository_stats.items(),
+                key=lambda item: item[1]['success'] + item[1]['failed'],
+                reverse=True
+            )
+            repository_stats = dict(ranked[:MAX_CHART_REPOSITORIES])
+            other = {'success': 0, 'failed': 0}
+            for _, stats in ranked[MAX_CHART_REPOSITORIES:]:
+                other['success'] += stats['success']
+                other['failed'] += stats['failed']
+            repository_stats['Other'] = other
 
-        return html
+        return {
+            'operations_by_type': operations_by_type,
+            'repository_stats': repository_stats,
+            'branch_health': branch_health
+        }
@@ -9,26 +9,61 @@ Features:
 - Template-based messages
 - Batch notifications
 - Async delivery
+- Batched webhook delivery over a persistent connection
 - Slack integration with rich formatting
 - Email integration with SMTP support
 """
 
+import asyncio
+import atexit
+import collections
+import concurrent.futures
+import functools
+import hashlib
+import html
+import itertools
 import logging
 import json
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, field
+import queue
+import string
+import sys
+import threading
+import time
+import weakref
+from typing import Callable, Dict, List, Optional, Any, Tuple
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from enum import Enum
 import os
-import urllib.request
-import urllib.error
+import http.client
+import urllib.parse
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 
+try:
+    import orjson
+except ImportError:  # Optional dependency
+    orjson = None
+
 
 logger = logging.getLogger(__name__)
 
+# Delivery attempts per webhook batch
+_WEBHOOK_RETRIES = 3
+
+# Queue marker that stops the webhook worker
+_STOP = object()
+
+# Notification log file buffering: flush after this many records, or this
+# many seconds after the first unflushed record, whichever comes first
+_FILE_BUFFER_SIZE = 64 * 1024
+_FILE_FLUSH_EVERY = 100
+_FILE_FLUSH_INTERVAL = 0.5
+
+# SMTP sessions are recycled after this many messages
+_SMTP_MAX_MESSAGES = 100
+
 
 class NotificationLevel(Enum):
     """Notification severity levels"""
@@ -47,6 +82,144 @@ class NotificationChannel(Enum):
     SLACK = "slack"
 
 
+# Console line prefix (ANSI color, icon and level tag) for each level
+_CONSOLE_PREFIX = {
+    level: f"{color}{icon} [{level.value.upper()}] "
+    for level, color, icon in (
+        (NotificationLevel.INFO, "\033[36m", "ℹ"),      # Cyan
+        (NotificationLevel.WARNING, "\033[33m", "⚠"),   # Yellow
+        (NotificationLevel.ERROR, "\033[31m", "✗"),     # Red
+        (NotificationLevel.SUCCESS, "\033[32m", "✓"),   # Green
+    )
+}
+_CONSOLE_RESET = "\033[0m\n"
+
+# Same prefixes without ANSI codes, for output that isn't a terminal
+_CONSOLE_PLAIN_PREFIX = {
+    level: prefix[prefix.index("m") + 1:] for level, prefix in _CONSOLE_PREFIX.items()
+}
+
+# Severity order used by NotificationConfig.min_level
+_LEVEL_RANK = {
+    NotificationLevel.INFO: 0,
+    NotificationLevel.SUCCESS: 0,
+    NotificationLevel.WARNING: 1,
+    NotificationLevel.ERROR: 2,
+}
+
+# Slack message emoji and attachment colors per level
+_SLACK_EMOJI = {
+    NotificationLevel.INFO: ":information_source:",
+    NotificationLevel.WARNING: ":warning:",
+    NotificationLevel.ERROR: ":x:",
+    NotificationLevel.SUCCESS: ":white_check_mark:",
+}
+_SLACK_COLORS = {
+    NotificationLevel.INFO: "#36a64f",      # Green
+    NotificationLevel.WARNING: "#ff9900",   # Orange
+    NotificationLevel.ERROR: "#ff0000",     # Red
+    NotificationLevel.SUCCESS: "#00ff00",   # Bright green
+}
+
+
+def _json_str(value: str) -> bytes:
+    """Encode one string as a JSON literal"""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value).encode('utf-8')
+
+
+@functools.lru_cache(maxsize=8)
+def _slack_encoder(
+    has_repository: bool,
+    has_branch: bool,
+    has_operation: bool
+) -> Callable[["Notification"], bytes]:
+    """
+    Build a Slack payload encoder for one combination of optional fields
+
+    The returned function writes the JSON bytes directly from precomputed
+    fragments, so the per-notification work is escaping the variable strings.
+    """
+    fields = tuple(
+        (attr, b'{"title":"' + label + b'","value":')
+        for attr, label, present in (
+            ("repository", b"Repository", has_repository),
+            ("branch", b"Branch", has_branch),
+            ("operation", b"Operation", has_operation),
+        ) if present
+    )
+
+    def encode(notification: "Notification") -> bytes:
+        level = notification.level
+        parts = [
+            b'{"text":',
+            _json_str(f"{_SLACK_EMOJI.get(level, ':bell:')} *{notification.title}*"),
+            b',"attachments":[{"color":"',
+            _SLACK_COLORS.get(level, "#808080").encode('ascii'),
+            b'","text":',
+            _json_str(notification.message),
+            b',"fields":[',
+            b','.join(
+                prefix + _json_str(getattr(notification, attr)) + b',"short":true}'
+                for attr, prefix in fields
+            ),
+            b'],"footer":"Nava Ops","ts":',
+            str(notification.epoch_seconds).encode('ascii'),
+            b'}]}',
+        ]
+        return b''.join(parts)
+
+    return encode
+
+
+# Email header background per level
+_EMAIL_LEVEL_COLORS = {
+    NotificationLevel.INFO: "#17a2b8",
+    NotificationLevel.WARNING: "#ffc107",
+    NotificationLevel.ERROR: "#dc3545",
+    NotificationLevel.SUCCESS: "#28a745",
+}
+
+# Email HTML body; values are substituted already escaped
+_EMAIL_HTML_TMPL = string.Template("""
+            <html>
+              <head></head>
+              <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
+                <div style="max-width: 600px; margin: 0 auto; padding: 20px;">
+                  <div style="background: ${color}; color: white; padding: 15px; border-radius: 5px 5px 0 0;">
+                    <h2 style="margin: 0;">${title}</h2>
+                  </div>
+                  <div style="background: #f8f9fa; padding: 20px; border: 1px solid #dee2e6; border-top: none;">
+                    <p style="font-size: 16px;">${message}</p>
+                    <hr style="border: none; border-top: 1px solid #dee2e6; margin: 20px 0;">
+                    <table style="width: 100%; font-size: 14px;">
+                      <tr>
+                        <td style="padding: 5px; font-weight: bold;">Level:</td>
+                        <td style="padding: 5px;">${level}</td>
+                      </tr>
+                      <tr>
+                        <td style="padding: 5px; font-weight: bold;">Timestamp:</td>
+                        <td style="padding: 5px;">${timestamp}</td>
+                      </tr>
+${rows}
+                    </table>
+                  </div>
+                  <div style="background: #e9ecef; padding: 10px; text-align: center; font-size: 12px; color: #6c757d; border-radius: 0 0 5px 5px;">
+                    Sent by Nava Ops Notification System
+                  </div>
+                </div>
+              </body>
+            </html>
+            """)
+_EMAIL_ROW_TMPL = string.Template("""
+                      <tr>
+                        <td style="padding: 5px; font-weight: bold;">${label}:</td>
+                        <td style="padding: 5px;">${value}</td>
+                      </tr>
+""")
+
+
 @dataclass
 class NotificationConfig:
     """Configuration for notification manager"""
@@ -54,10 +227,50 @@ class NotificationConfig:
     file_enabled: bool = False
     slack_enabled: bool = False
     email_enabled: bool = False
+    webhook_enabled: bool = False
+
+    # Console configuration: flush after every notification, and use ANSI
+    # colors (None uses them only when stdout is a terminal)
+    console_flush: bool = True
+    console_color: Optional[bool] = None
 
     # File configuration
     file_path: str = "nava-ops-notifications.log"
 
+    # Generic webhook configuration (events are POSTed in JSON batches, or
+    # as newline-delimited JSON with webhook_ndjson; webhook_linger waits up
+    # to that many seconds for a batch to fill before posting it)
+    webhook_url: Optional[str] = None
+    webhook_batch_size: int = 64
+    webhook_timeout: float = 10.0
+    webhook_ndjson: bool = False
+    webhook_linger: float = 0.0
+
+    # Flood protection: drop identical notifications seen within dedup_window
+    # seconds, and cap deliveries per minute (0 disables either gate)
+    dedup_window: float = 0.0
+    rate_limit_per_minute: int = 0
+
+    # Deliver from a background thread so send() never waits on a channel;
+    # notifications beyond dispatch_queue_size pending ones are dropped
+    background_dispatch: bool = False
+    dispatch_queue_size: int = 10000
+
+    # Merge notifications sharing level, title, repository, branch and
+    # operation that arrive within coalesce_window_ms into one delivery
+    coalesce_enabled: bool = False
+    coalesce_window_ms: int = 500
+
+    # Number of recent notifications kept in memory (0 keeps none)
+    history_size: int = 10000
+
+    # Notifications below this level are dropped before any work is done
+    min_level: NotificationLevel = NotificationLevel.INFO
+
+    # Worker threads for delivering to non-console channels in parallel
+    # (0 delivers to each channel in turn on the calling thread)
+    channel_workers: int = 0
+
     # Slack configuration
     slack_webhook_url: Optional[str] = None
 
@@ -69,19 +282,402 @@ class NotificationConfig:
     email_username: Optional[str] = None
     email_password: Optional[str] = None
     email_use_tls: bool = True
+    # Send an HTML alternative alongside the plain-text body
+    email_html_enabled: bool = True
 
 
-@dataclass
 class Notification:
     """Represents a notification message"""
-    level: NotificationLevel
-    title: str
-    message: str
-    timestamp: datetime
-    repository: Optional[str] = None
-    branch: Optional[str] = None
-    operation: Optional[str] = None
-    metadata: Optional[Dict[str, Any]] = None
+
+    # Slots instead of a per-instance __dict__; one of these is built per send()
+    __slots__ = (
+        'level', 'title', 'message', 'repository', 'branch', 'operation', 'metadata',
+        'timestamp_ns', '_timestamp', '_iso_timestamp', '_human_timestamp', '_payload_bytes'
+    )
+
+    def __init__(
+        self,
+        level: NotificationLevel,
+        title: str,
+        message: str,
+        repository: Optional[str] = None,
+        branch: Optional[str] = None,
+        operation: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        timestamp_ns: Optional[int] = None
+    ):
+        self.level = level
+        self.title = title
+        self.message = message
+        self.repository = repository
+        self.branch = branch
+        self.operation = operation
+        self.metadata = metadata
+        # Captured cheaply as epoch nanoseconds; datetime/ISO forms are derived on demand
+        self.timestamp_ns = time.time_ns() if timestamp_ns is None else timestamp_ns
+        self._timestamp: Optional[datetime] = None
+        self._iso_timestamp: Optional[str] = None
+        self._human_timestamp: Optional[str] = None
+        self._payload_bytes: Optional[bytes] = None
+
+    def __repr__(self) -> str:
+        return (
+            f"Notification(level={self.level!r}, title={self.title!r}, "
+            f"message={self.message!r}, repository={self.repository!r}, "
+            f"branch={self.branch!r}, operation={self.operation!r}, "
+            f"metadata={self.metadata!r}, timestamp_ns={self.timestamp_ns!r})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    __hash__ = None
+
+    def _fields(self) -> tuple:
+        """Field values, in constructor order"""
+        return (
+            self.level, self.title, self.message, self.repository,
+            self.branch, self.operation, self.metadata, self.timestamp_ns
+        )
+
+    @property
+    def timestamp(self) -> datetime:
+        """Local time the notification was created"""
+        if self._timestamp is None:
+            self._timestamp = datetime.fromtimestamp(self.timestamp_ns / 1e9)
+        return self._timestamp
+
+    @property
+    def iso_timestamp(self) -> str:
+        """ISO 8601 form of timestamp"""
+        if self._iso_timestamp is None:
+            self._iso_timestamp = self.timestamp.isoformat()
+        return self._iso_timestamp
+
+    @property
+    def human_timestamp(self) -> str:
+        """Timestamp as shown to people, e.g. 2024-01-31 12:00:00"""
+        if self._human_timestamp is None:
+            self._human_timestamp = self.timestamp.strftime('%Y-%m-%d %H:%M:%S')
+        return self._human_timestamp
+
+    @property
+    def epoch_seconds(self) -> int:
+        """Whole seconds since the epoch"""
+        return self.timestamp_ns // 1_000_000_000
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Build the JSON-serializable representation of this notification"""
+        return {
+            "timestamp": self.iso_timestamp,
+            "level": self.level.value,
+            "title": self.title,
+            "message": self.message,
+            "repository": self.repository,
+            "branch": self.branch,
+            "operation": self.operation,
+            "metadata": self.metadata
+        }
+
+    @property
+    def payload_bytes(self) -> bytes:
+        """
+        JSON encoding of to_dict(), computed once and shared by all channels
+
+        Unset optional fields are left out rather than written as null.
+        """
+        if self._payload_bytes is None:
+            payload = {key: value for key, value in self.to_dict().items() if value is not None}
+            if orjson is not None:
+                self._payload_bytes = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+            else:
+                self._payload_bytes = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+        return self._payload_bytes
+
+
+class _PersistentHTTPConnection:
+    """
+    Single keep-alive HTTP(S) connection to one URL, reused across POSTs
+    """
+
+    def __init__(self, url: str, timeout: float = 10.0):
+        parts = urllib.parse.urlsplit(url)
+        self._connection_class = (
+            http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+        )
+        self._host = parts.netloc
+        self._path = (parts.path or '/') + (f"?{parts.query}" if parts.query else '')
+        self._timeout = timeout
+        self._conn: Optional[http.client.HTTPConnection] = None
+        self._lock = threading.Lock()
+
+    def post(self, body: bytes, headers: Dict[str, str]) -> int:
+        """
+        POST body and return the response status
+
+        If a reused connection turns out to have been closed by the server
+        while idle, the request is retried once on a fresh connection.
+        """
+        headers = dict(headers, Connection='keep-alive')
+        with self._lock:
+            reused = self._conn is not None
+            try:
+                return self._post_locked(body, headers)
+            except (http.client.RemoteDisconnected, http.client.BadStatusLine,
+                    ConnectionResetError, BrokenPipeError):
+                if not reused:
+                    raise
+            return self._post_locked(body, headers)
+
+    def _post_locked(self, body: bytes, headers: Dict[str, str]) -> int:
+        """Send one request; caller must hold _lock"""
+        if self._conn is None:
+            self._conn = self._connection_class(self._host, timeout=self._timeout)
+        try:
+            self._conn.request('POST', self._path, body, headers)
+            response = self._conn.getresponse()
+            # The body must be drained before the connection can be reused
+            response.read()
+            return response.status
+        except Exception:
+            self._conn.close()
+            self._conn = None
+            raise
+
+    def close(self):
+        """Close the underlying connection"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def _wait_for_queue(work_queue: queue.Queue, deadline: Optional[float]) -> bool:
+    """Queue.join() with an optional monotonic deadline; False if it passed first"""
+    with work_queue.all_tasks_done:
+        while work_queue.unfinished_tasks:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+            work_queue.all_tasks_done.wait(remaining)
+    return True
+
+
+class _LogFileSink:
+    """
+    Buffered append-only notification log, shared by every manager writing to one path
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = None
+        self._unflushed = 0
+        self._flush_timer: Optional[threading.Timer] = None
+
+    def write(self, line: bytes):
+        """Append one encoded record, flushing every _FILE_FLUSH_EVERY records or shortly after"""
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, 'ab', buffering=_FILE_BUFFER_SIZE)
+
+            self._file.write(line)
+            self._unflushed += 1
+
+            if self._unflushed >= _FILE_FLUSH_EVERY:
+                self._flush_locked()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(_FILE_FLUSH_INTERVAL, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush(self):
+        """Flush buffered records to disk"""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        """Flush the log; caller must hold _lock"""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+        if self._file is not None:
+            self._file.flush()
+        self._unflushed = 0
+
+    def close(self):
+        """Flush and close the file; it is reopened on the next write"""
+        with self._lock:
+            self._flush_locked()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class _WebhookSink:
+    """
+    Background batching queue for one webhook URL, shared by every manager posting to it
+    """
+
+    def __init__(self, url: str, timeout: float):
+        self.batch_size = 64
+        self.ndjson = False
+        self.linger = 0.0
+        self._client = _PersistentHTTPConnection(url, timeout)
+        self._lock = threading.Lock()
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+
+    def put(self, event: bytes):
+        """Queue an encoded event, starting the delivery thread if needed"""
+        if self._thread is None:
+            self._start()
+        self._queue.put(event)
+
+    def _start(self):
+        """Start the background thread that delivers webhook batches"""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._worker,
+                name="nava-ops-webhook",
+                daemon=True
+            )
+            self._thread.start()
+
+    def _worker(self):
+        """Drain the queue, posting up to batch_size events per request"""
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.linger
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    if remaining > 0 and batch[-1] is not _STOP:
+                        batch.append(self._queue.get(timeout=remaining))
+                    else:
+                        batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            events = [event for event in batch if event is not _STOP]
+            if events:
+                self._deliver(events)
+
+            for _ in batch:
+                self._queue.task_done()
+
+            if len(events) != len(batch):
+                return
+
+    def _deliver(self, events: List[bytes]):
+        """POST a batch of encoded events to the webhook, retrying failed attempts"""
+        if self.ndjson:
+            body = b'\n'.join(events) + b'\n'
+            headers = {'Content-Type': 'application/x-ndjson'}
+        else:
+            body = b'{"events": [' + b', '.join(events) + b']}'
+            headers = {'Content-Type': 'application/json'}
+
+        for attempt in range(1, _WEBHOOK_RETRIES + 1):
+            try:
+                status = self._client.post(body, headers)
+                if 200 <= status < 300:
+                    logger.debug(f"Webhook batch of {len(events)} notification(s) delivered")
+                    return
+                logger.warning(f"Webhook returned status {status} (attempt {attempt})")
+            except (OSError, http.client.HTTPException) as e:
+                logger.warning(f"Webhook delivery failed (attempt {attempt}): {e}")
+
+            if attempt < _WEBHOOK_RETRIES:
+                time.sleep(0.1 * attempt)
+
+        logger.error(f"Dropped {len(events)} webhook notification(s) after {_WEBHOOK_RETRIES} attempts")
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until everything queued has been processed; False on timeout"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        return _wait_for_queue(self._queue, deadline)
+
+    def close(self):
+        """Deliver queued events and stop the thread; it restarts on the next put"""
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+
+        if thread is not None and thread.is_alive():
+            self._queue.put(_STOP)
+            thread.join()
+
+        self._client.close()
+
+
+# Shared sinks keyed by file path / webhook URL
+_sinks_lock = threading.Lock()
+_log_files: Dict[str, _LogFileSink] = {}
+_webhook_sinks: Dict[str, _WebhookSink] = {}
+_http_clients: Dict[str, _PersistentHTTPConnection] = {}
+
+
+def _get_http_client(url: str, timeout: float = 10.0) -> _PersistentHTTPConnection:
+    """Get the shared keep-alive connection for a URL"""
+    with _sinks_lock:
+        client = _http_clients.get(url)
+        if client is None:
+            client = _http_clients[url] = _PersistentHTTPConnection(url, timeout)
+        return client
+
+
+def _get_log_file(path: str) -> _LogFileSink:
+    """Get the shared log file sink for a path"""
+    with _sinks_lock:
+        sink = _log_files.get(path)
+        if sink is None:
+            sink = _log_files[path] = _LogFileSink(path)
+        return sink
+
+
+def _get_webhook_sink(config: NotificationConfig) -> _WebhookSink:
+    """Get the shared batching sink for the configured webhook URL"""
+    with _sinks_lock:
+        sink = _webhook_sinks.get(config.webhook_url)
+        if sink is None:
+            sink = _webhook_sinks[config.webhook_url] = _WebhookSink(
+                config.webhook_url, config.webhook_timeout
+            )
+        sink.batch_size = config.webhook_batch_size
+        sink.ndjson = config.webhook_ndjson
+        sink.linger = config.webhook_linger
+        return sink
+
+
+@atexit.register
+def _close_sinks():
+    """Deliver buffered file and webhook output and close connections at exit"""
+    with _sinks_lock:
+        sinks = list(_webhook_sinks.values()) + list(_log_files.values())
+        sinks += list(_http_clients.values())
+    for sink in sinks:
+        sink.close()
+
+
+# Managers with coalesced notifications, a dispatcher thread or an SMTP session
+# to shut down at exit; held weakly so a discarded manager can still be
+# garbage collected
+_live_managers: "weakref.WeakSet[NotificationManager]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_managers():
+    """Deliver coalesced and queued notifications of live managers at exit"""
+    for manager in list(_live_managers):
+        manager._flush_pending()
+        manager._stop_dispatcher()
+        manager._close_smtp()
 
 
 class NotificationManager:
@@ -97,26 +693,68 @@ class NotificationManager:
             config: Notification configuration (default: console only)
         """
         self.config = config or NotificationConfig()
-        self.notifications: List[Notification] = []
+        self.notifications: "collections.deque[Notification]" = collections.deque(
+            maxlen=self.config.history_size
+        )
+        # Per-level views of the history, so level queries don't scan it all;
+        # they hold exactly the entries of self.notifications, which are only
+        # changed under self._lock (see _append_history)
+        self._by_level: Dict[NotificationLevel, "collections.deque[Notification]"] = {
+            level: collections.deque() for level in NotificationLevel
+        }
+        self._min_level_rank = _LEVEL_RANK[self.config.min_level]
+
+        use_color = self.config.console_color
+        if use_color is None:
+            isatty = getattr(sys.stdout, "isatty", None)
+            use_color = bool(isatty and isatty())
+        self._console_prefix = _CONSOLE_PREFIX if use_color else _CONSOLE_PLAIN_PREFIX
+        self._console_reset = _CONSOLE_RESET if use_color else "\n"
 
         # Determine enabled channels
-        self.channels = []
-        if self.config.console_enabled:
-            self.channels.append(NotificationChannel.CONSOLE)
-        if self.config.file_enabled:
-            self.channels.append(NotificationChannel.FILE)
-        if self.config.slack_enabled:
-            self.channels.append(NotificationChannel.SLACK)
-        if self.config.email_enabled:
-            self.channels.append(NotificationChannel.EMAIL)
-
-        self.handlers = {
-            NotificationChannel.CONSOLE: self._handle_console,
-            NotificationChannel.FILE: self._handle_file,
-            NotificationChannel.WEBHOOK: self._handle_webhook,
-            NotificationChannel.EMAIL: self._handle_email,
-            NotificationChannel.SLACK: self._handle_slack,
-        }
+        self.channels: Tuple[NotificationChannel, ...] = ()
+        self._channel_set = set()
+        for channel, enabled in (
+            (NotificationChannel.CONSOLE, self.config.console_enabled),
+            (NotificationChannel.FILE, self.config.file_enabled),
+            (NotificationChannel.SLACK, self.config.slack_enabled),
+            (NotificationChannel.EMAIL, self.config.email_enabled),
+            (NotificationChannel.WEBHOOK, self.config.webhook_enabled),
+        ):
+            if enabled:
+                self._add_channel(channel)
+
+        # Process-wide sinks, looked up on first use so managers on different
+        # threads share one log file writer and one webhook queue per target
+        self._lock = threading.Lock()
+        self._file_sink: Optional[_LogFileSink] = None
+        self._webhook_sink: Optional[_WebhookSink] = None
+
+        self._channel_pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+        # Notifications held for coalescing, keyed by
+        # (level, title, repository, branch, operation)
+        self._pending_lock = threading.Lock()
+        self._pending: Dict[tuple, List[Notification]] = {}
+        self._pending_timer: Optional[threading.Timer] = None
+
+        # Background dispatcher (background_dispatch only, started on first send)
+        self._dispatch_queue: Optional[queue.Queue] = None
+        self._dispatch_thread: Optional[threading.Thread] = None
+
+        # SMTP session reused across email notifications
+        self._smtp_lock = threading.Lock()
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._smtp_sent = 0
+
+        # Dedup/rate-limit gate state: notification hash -> last send time,
+        # and the send times within the last minute
+        self._gate_lock = threading.Lock()
+        self._dedup: "collections.OrderedDict[bytes, float]" = collections.OrderedDict()
+        self._rate: collections.deque = collections.deque()
+
+        self._active_handlers: Tuple[Tuple[NotificationChannel, Callable[[Notification], None]], ...] = ()
+        self._rebuild_dispatch()
 
     def send(
         self,
@@ -140,27 +778,331 @@ class NotificationManager:
             operation: Optional operation name
             metadata: Optional metadata dict
         """
+        notification = self._record(level, title, message, repository, branch, operation, metadata)
+        if notification is None:
+            return
+
+        if self.config.coalesce_enabled:
+            self._coalesce(notification)
+        else:
+            self._submit(notification)
+
+    def _submit(self, notification: Notification):
+        """Deliver now, or hand off to the dispatcher thread with background_dispatch"""
+        if self.config.background_dispatch:
+            if self._dispatch_queue is None:
+                self._start_dispatcher()
+            try:
+                self._dispatch_queue.put_nowait(notification)
+            except queue.Full:
+                logger.warning(f"Notification queue full, dropped notification: {notification.title}")
+            return
+
+        self._deliver(notification)
+
+    def _coalesce(self, notification: Notification):
+        """Hold a notification until the coalescing window closes"""
+        key = (
+            notification.level, notification.title, notification.repository,
+            notification.branch, notification.operation
+        )
+        with self._pending_lock:
+            group = self._pending.get(key)
+            if group is None:
+                self._pending[key] = [notification]
+            else:
+                group.append(notification)
+
+            if self._pending_timer is None:
+                self._pending_timer = threading.Timer(
+                    self.config.coalesce_window_ms / 1000, self._flush_pending
+                )
+                self._pending_timer.daemon = True
+                self._pending_timer.start()
+                # The timer is a daemon thread; flush at exit instead
+                _live_managers.add(self)
+
+    def _flush_pending(self):
+        """Deliver coalesced groups, one notification per group"""
+        with self._pending_lock:
+            if self._pending_timer is not None:
+                self._pending_timer.cancel()
+                self._pending_timer = None
+            groups, self._pending = self._pending, {}
+
+        for group in groups.values():
+            first = group[0]
+            if len(group) == 1:
+                self._submit(first)
+                continue
+
+            metadata = dict(first.metadata or {})
+            metadata["count"] = len(group)
+            self._submit(Notification(
+                level=first.level,
+                title=first.title,
+                message=(
+                    f"{first.message}\n"
+                    f"(+{len(group) - 1} more in {self.config.coalesce_window_ms}ms)"
+                ),
+                repository=first.repository,
+                branch=first.branch,
+                operation=first.operation,
+                metadata=metadata
+            ))
+
+    async def asend(
+        self,
+        level: NotificationLevel,
+        title: str,
+        message: str,
+        repository: Optional[str] = None,
+        branch: Optional[str] = None,
+        operation: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Send a notification from a coroutine without blocking the event loop
+
+        Each channel is delivered in the loop's default executor and all of
+        them run concurrently; the console is written directly on the loop.
+        Takes the same arguments as send().
+        """
+        notification = self._record(level, title, message, repository, branch, operation, metadata)
+        if notification is None:
+            return
+
+        loop = asyncio.get_running_loop()
+        pending = []
+        for channel, handler in self._active_handlers:
+            if channel is NotificationChannel.CONSOLE:
+                self._dispatch(channel, handler, notification)
+            else:
+                pending.append(loop.run_in_executor(None, handler, notification))
+
+        results = await asyncio.gather(*pending, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Failed to send notification: {result}")
+
+    def _record(
+        self,
+        level: NotificationLevel,
+        title: str,
+        message: str,
+        repository: Optional[str],
+        branch: Optional[str],
+        operation: Optional[str],
+        metadata: Optional[Dict[str, Any]]
+    ) -> Optional[Notification]:
+        """Build a notification and add it to history; None if the gate suppressed it"""
+        if _LEVEL_RANK[level] < self._min_level_rank:
+            return None
+        if not self._active_handlers and not self.config.history_size:
+            # Nothing would see it, so don't build it
+            return None
+
+        if not self._should_dispatch(level, title, message, repository, branch):
+            logger.debug(f"Suppressed duplicate or rate-limited notification: {title}")
+            return None
+
         notification = Notification(
             level=level,
             title=title,
             message=message,
-            timestamp=datetime.now(),
             repository=repository,
             branch=branch,
             operation=operation,
-            metadata=metadata or {}
+            metadata=metadata
         )
 
-        self.notifications.append(notification)
+        if self.config.history_size:
+            with self._lock:
+                self._append_history(notification)
+        return notification
+
+    def _append_history(self, notification: Notification):
+        """Add a notification to history and its level view; caller must hold _lock"""
+        history = self.notifications
+        if len(history) == history.maxlen:
+            # The append below evicts the oldest entry; drop it from its view
+            self._by_level[history[0].level].popleft()
+        history.append(notification)
+        self._by_level[notification.level].append(notification)
+
+    def _deliver(self, notification: Notification):
+        """Send a notification to all enabled channels"""
+        errors = None
+
+        if self.config.channel_workers > 0 and len(self._active_handlers) > 1:
+            # Slow channels (webhook, Slack, email) overlap each other; the
+            # console stays on the calling thread to keep its output ordered
+            pool = self._get_channel_pool()
+            futures = [
+                (channel, pool.submit(handler, notification))
+                for channel, handler in self._active_handlers
+                if channel is not NotificationChannel.CONSOLE
+            ]
+            for channel, handler in self._active_handlers:
+                if channel is NotificationChannel.CONSOLE:
+                    try:
+                        handler(notification)
+                    except Exception as e:
+                        errors = [(channel, e)]
+            for channel, future in futures:
+                e = future.exception()
+                if e is not None:
+                    errors = errors or []
+                    errors.append((channel, e))
+        else:
+            for channel, handler in self._active_handlers:
+                try:
+                    handler(notification)
+                except Exception as e:
+                    errors = errors or []
+                    errors.append((channel, e))
+
+        if errors:
+            logger.error(
+                "Failed to send notification via "
+                + "; ".join(f"{channel.value}: {e}" for channel, e in errors)
+            )
+
+    def _start_dispatcher(self):
+        """Start the background thread that delivers queued notifications"""
+        with self._lock:
+            if self._dispatch_queue is not None:
+                return
+            self._dispatch_queue = queue.Queue(maxsize=self.config.dispatch_queue_size)
+            self._dispatch_thread = threading.Thread(
+                target=self._dispatch_loop,
+                name="nava-ops-dispatch",
+                daemon=True
+            )
+            self._dispatch_thread.start()
 
-        # Send to all enabled channels
-        for channel in self.channels:
+        _live_managers.add(self)
+
+    def _dispatch_loop(self):
+        """Deliver queued notifications until the stop sentinel arrives"""
+        dispatch_queue = self._dispatch_queue
+        while True:
+            notification = dispatch_queue.get()
             try:
-                handler = self.handlers.get(channel)
-                if handler:
-                    handler(notification)
-            except Exception as e:
-                logger.error(f"Failed to send notification via {channel.value}: {e}")
+                if notification is _STOP:
+                    return
+                self._deliver(notification)
+            finally:
+                dispatch_queue.task_done()
+
+    def _stop_dispatcher(self):
+        """Deliver everything queued and stop the dispatcher thread"""
+        with self._lock:
+            thread, dispatch_queue = self._dispatch_thread, self._dispatch_queue
+            self._dispatch_thread = self._dispatch_queue = None
+
+        if thread is not None and thread.is_alive():
+            dispatch_queue.put(_STOP)
+            thread.join()
+
+    @staticmethod
+    def _dispatch(
+        channel: NotificationChannel,
+        handler: Callable[[Notification], None],
+        notification: Notification
+    ):
+        """Deliver a notification to one channel, logging any failure"""
+        try:
+            handler(notification)
+        except Exception as e:
+            logger.error(f"Failed to send notification via {channel.value}: {e}")
+
+    def _add_channel(self, channel: NotificationChannel):
+        """Enable a channel, keeping channels in the order they were added"""
+        if channel not in self._channel_set:
+            self._channel_set.add(channel)
+            self.channels += (channel,)
+
+    def _rebuild_dispatch(self):
+        """
+        Bind the handlers of the enabled channels; call whenever channels change
+
+        Channels that are enabled but not fully configured are left out, so
+        they cost nothing per notification.
+        """
+        active = []
+        for channel in self.channels:
+            if self._channel_configured(channel):
+                active.append((channel, self._HANDLER_MAP[channel].__get__(self)))
+            else:
+                logger.debug(f"{channel.value} channel enabled but not configured, skipping it")
+        self._active_handlers = tuple(active)
+
+    def _channel_configured(self, channel: NotificationChannel) -> bool:
+        """Check that a channel has the settings its handler needs"""
+        if channel is NotificationChannel.WEBHOOK:
+            return bool(self.config.webhook_url)
+        if channel is NotificationChannel.SLACK:
+            return bool(self.config.slack_webhook_url)
+        if channel is NotificationChannel.EMAIL:
+            return bool(self.config.email_smtp_host and self.config.email_from and self.config.email_to)
+        return True
+
+    def _get_channel_pool(self) -> concurrent.futures.ThreadPoolExecutor:
+        """Lazily create the thread pool used for parallel channel delivery"""
+        if self._channel_pool is None:
+            with self._lock:
+                if self._channel_pool is None:
+                    self._channel_pool = concurrent.futures.ThreadPoolExecutor(
+                        max_workers=self.config.channel_workers,
+                        thread_name_prefix="nava-ops-notify"
+                    )
+        return self._channel_pool
+
+    def _should_dispatch(
+        self,
+        level: NotificationLevel,
+        title: str,
+        message: str,
+        repository: Optional[str],
+        branch: Optional[str]
+    ) -> bool:
+        """Apply the dedup window and per-minute rate limit"""
+        window = self.config.dedup_window
+        limit = self.config.rate_limit_per_minute
+        if not window and not limit:
+            return True
+
+        now = time.monotonic()
+        key = None
+
+        with self._gate_lock:
+            if window:
+                # Entries are kept in send order, so expired ones are at the front
+                while self._dedup:
+                    oldest = next(iter(self._dedup.values()))
+                    if now - oldest < window:
+                        break
+                    self._dedup.popitem(last=False)
+
+                key = hashlib.blake2b(
+                    f"{level.value}|{title}|{message}|{repository}|{branch}".encode('utf-8'),
+                    digest_size=8
+                ).digest()
+                if key in self._dedup:
+                    return False
+
+            if limit:
+                while self._rate and now - self._rate[0] >= 60:
+                    self._rate.popleft()
+                if len(self._rate) >= limit:
+                    return False
+                self._rate.append(now)
+
+            if key is not None:
+                self._dedup[key] = now
+
+        return True
 
     def info(self, title: str, message: str, **kwargs):
         """Send info notification"""
@@ -180,255 +1122,184 @@ class NotificationManager:
 
     def _handle_console(self, notification: Notification):
         """Handle console notifications"""
-        # ANSI color codes
-        colors = {
-            NotificationLevel.INFO: "\033[36m",      # Cyan
-            NotificationLevel.WARNING: "\033[33m",   # Yellow
-            NotificationLevel.ERROR: "\033[31m",     # Red
-            NotificationLevel.SUCCESS: "\033[32m",   # Green
-        }
-        reset = "\033[0m"
-
-        color = colors.get(notification.level, "")
-        icon = {
-            NotificationLevel.INFO: "ℹ",
-            NotificationLevel.WARNING: "⚠",
-            NotificationLevel.ERROR: "✗",
-            NotificationLevel.SUCCESS: "✓",
-        }.get(notification.level, "•")
-
-        print(f"{color}{icon} [{notification.level.value.upper()}] {notification.title}{reset}")
-        print(f"  {notification.message}")
+        parts = [
+            self._console_prefix[notification.level],
+            notification.title,
+            self._console_reset,
+            "  ",
+            notification.message,
+            "\n"
+        ]
 
         if notification.repository:
-            print(f"  Repository: {notification.repository}")
+            parts.append(f"  Repository: {notification.repository}\n")
         if notification.branch:
-            print(f"  Branch: {notification.branch}")
+            parts.append(f"  Branch: {notification.branch}\n")
 
-        print()  # Empty line
+        parts.append("\n")  # Empty line
+
+        # One write per notification instead of a print() per line
+        sys.stdout.write("".join(parts))
+        if self.config.console_flush:
+            sys.stdout.flush()
 
     def _handle_file(self, notification: Notification):
         """Handle file-based notifications"""
         try:
-            log_entry = {
-                "timestamp": notification.timestamp.isoformat(),
-                "level": notification.level.value,
-                "title": notification.title,
-                "message": notification.message,
-                "repository": notification.repository,
-                "branch": notification.branch,
-                "operation": notification.operation,
-                "metadata": notification.metadata
-            }
-
-            # Append to log file
-            with open(self.config.file_path, 'a') as f:
-                f.write(json.dumps(log_entry) + '\n')
-
+            if self._file_sink is None:
+                self._file_sink = _get_log_file(self.config.file_path)
+            self._file_sink.write(notification.payload_bytes + b'\n')
         except Exception as e:
             logger.error(f"Failed to write notification to file: {e}")
 
     def _handle_webhook(self, notification: Notification):
-        """Handle generic webhook notifications"""
-        # Kept for backward compatibility
-        logger.debug("Generic webhook handler - use Slack handler for Slack webhooks")
+        """Queue notification for batched delivery to the generic webhook"""
+        if self._webhook_sink is None:
+            self._webhook_sink = _get_webhook_sink(self.config)
+        self._webhook_sink.put(notification.payload_bytes)
 
     def _handle_slack(self, notification: Notification):
         """Handle Slack notifications with rich formatting"""
-        if not self.config.slack_webhook_url:
-            logger.debug("Slack webhook URL not configured, skipping Slack notification")
-            return
-
         try:
-            # Emoji mapping for levels
-            emoji_map = {
-                NotificationLevel.INFO: ":information_source:",
-                NotificationLevel.WARNING: ":warning:",
-                NotificationLevel.ERROR: ":x:",
-                NotificationLevel.SUCCESS: ":white_check_mark:",
-            }
-
-            # Color mapping for Slack attachments
-            color_map = {
-                NotificationLevel.INFO: "#36a64f",      # Green
-                NotificationLevel.WARNING: "#ff9900",   # Orange
-                NotificationLevel.ERROR: "#ff0000",     # Red
-                NotificationLevel.SUCCESS: "#00ff00",   # Bright green
-            }
-
-            # Build fields for attachment
-            fields = []
-            if notification.repository:
-                fields.append({
-                    "title": "Repository",
-                    "value": notification.repository,
-                    "short": True
-                })
-            if notification.branch:
-                fields.append({
-                    "title": "Branch",
-                    "value": notification.branch,
-                    "short": True
-                })
-            if notification.operation:
-                fields.append({
-                    "title": "Operation",
-                    "value": notification.operation,
-                    "short": True
-                })
-
-            # Prepare Slack payload
-            payload = {
-                "text": f"{emoji_map.get(notification.level, ':bell:')} *{notification.title}*",
-                "attachments": [
-                    {
-                        "color": color_map.get(notification.level, "#808080"),
-                        "text": notification.message,
-                        "fields": fields,
-                        "footer": "Nava Ops",
-                        "ts": int(notification.timestamp.timestamp())
-                    }
-                ]
-            }
-
-            # Send to Slack
-            data = json.dumps(payload).encode('utf-8')
-            req = urllib.request.Request(
-                self.config.slack_webhook_url,
-                data=data,
-                headers={'Content-Type': 'application/json'}
+            # Encode with the builder specialized for which optional fields are set
+            encode = _slack_encoder(
+                bool(notification.repository),
+                bool(notification.branch),
+                bool(notification.operation)
             )
+            data = encode(notification)
 
-            with urllib.request.urlopen(req, timeout=10) as response:
-                if response.status == 200:
-                    logger.info("Slack notification sent successfully")
-                else:
-                    logger.warning(f"Slack notification returned status {response.status}")
+            # Send to Slack over the shared keep-alive connection
+            client = _get_http_client(self.config.slack_webhook_url)
+            status = client.post(data, {'Content-Type': 'application/json'})
 
-        except urllib.error.URLError as e:
+            if status == 200:
+                logger.info("Slack notification sent successfully")
+            else:
+                logger.warning(f"Slack notification returned status {status}")
+
+        except (OSError, http.client.HTTPException) as e:
             logger.error(f"Failed to send Slack notification (network error): {e}")
         except Exception as e:
             logger.error(f"Failed to send Slack notification: {e}")
 
     def _handle_email(self, notification: Notification):
         """Handle email notifications via SMTP"""
-        if not self.config.email_smtp_host or not self.config.email_from or not self.config.email_to:
-            logger.debug("Email not fully configured, skipping email notification")
-            return
-
         try:
-            # Create message
-            msg = MIMEMultipart('alternative')
+            timestamp = notification.human_timestamp
+            level = notification.level.value.upper()
+            optional_fields = [
+                (label, value) for label, value in (
+                    ("Repository", notification.repository),
+                    ("Branch", notification.branch),
+                    ("Operation", notification.operation),
+                ) if value
+            ]
+
+            text_content = (
+                f"\n{notification.title}\n\n{notification.message}\n\n"
+                f"Level: {level}\nTimestamp: {timestamp}\n"
+                + "".join(f"{label}: {value}\n" for label, value in optional_fields)
+                + "\n---\nSent by Nava Ops Notification System"
+            )
+
+            if self.config.email_html_enabled:
+                # Plain text and HTML alternatives
+                html_content = _EMAIL_HTML_TMPL.substitute(
+                    color=_EMAIL_LEVEL_COLORS.get(notification.level, '#6c757d'),
+                    title=html.escape(notification.title),
+                    message=html.escape(notification.message),
+                    level=level,
+                    timestamp=timestamp,
+                    rows="".join(
+                        _EMAIL_ROW_TMPL.substitute(label=label, value=html.escape(value))
+                        for label, value in optional_fields
+                    )
+                )
+
+                msg = MIMEMultipart('alternative')
+                msg.attach(MIMEText(text_content, 'plain'))
+                msg.attach(MIMEText(html_content, 'html'))
+            else:
+                msg = MIMEText(text_content, 'plain')
+
             msg['Subject'] = f"[Nava Ops] {notification.title}"
             msg['From'] = self.config.email_from
             msg['To'] = ', '.join(self.config.email_to)
 
-            # Create both plain text and HTML versions
-            text_content = f"""
-{notification.title}
-
-{notification.message}
-
-Level: {notification.level.value.upper()}
-Timestamp: {notification.timestamp.strftime('%Y-%m-%d %H:%M:%S')}
-"""
-
-            if notification.repository:
-                text_content += f"Repository: {notification.repository}\n"
-            if notification.branch:
-                text_content += f"Branch: {notification.branch}\n"
-            if notification.operation:
-                text_content += f"Operation: {notification.operation}\n"
-
-            text_content += "\n---\nSent by Nava Ops Notification System"
-
-            # HTML version
-            level_colors = {
-                NotificationLevel.INFO: "#17a2b8",
-                NotificationLevel.WARNING: "#ffc107",
-                NotificationLevel.ERROR: "#dc3545",
-                NotificationLevel.SUCCESS: "#28a745",
-            }
-
-            html_content = f"""
-            <html>
-              <head></head>
-              <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-                <div style="max-width: 600px; margin: 0 auto; padding: 20px;">
-                  <div style="background: {level_colors.get(notification.level, '#6c757d')}; color: white; padding: 15px; border-radius: 5px 5px 0 0;">
-                    <h2 style="margin: 0;">{notification.title}</h2>
-                  </div>
-                  <div style="background: #f8f9fa; padding: 20px; border: 1px solid #dee2e6; border-top: none;">
-                    <p style="font-size: 16px;">{notification.message}</p>
-                    <hr style="border: none; border-top: 1px solid #dee2e6; margin: 20px 0;">
-                    <table style="width: 100%; font-size: 14px;">
-                      <tr>
-                        <td style="padding: 5px; font-weight: bold;">Level:</td>
-                        <td style="padding: 5px;">{notification.level.value.upper()}</td>
-                      </tr>
-                      <tr>
-                        <td style="padding: 5px; font-weight: bold;">Timestamp:</td>
-                        <td style="padding: 5px;">{notification.timestamp.strftime('%Y-%m-%d %H:%M:%S')}</td>
-                      </tr>
-"""
-
-            if notification.repository:
-                html_content += f"""
-                      <tr>
-                        <td style="padding: 5px; font-weight: bold;">Repository:</td>
-                        <td style="padding: 5px;">{notification.repository}</td>
-                      </tr>
-"""
-
-            if notification.branch:
-                html_content += f"""
-                      <tr>
-                        <td style="padding: 5px; font-weight: bold;">Branch:</td>
-                        <td style="padding: 5px;">{notification.branch}</td>
-                      </tr>
-"""
-
-            if notification.operation:
-                html_content += f"""
-                      <tr>
-                        <td style="padding: 5px; font-weight: bold;">Operation:</td>
-                        <td style="padding: 5px;">{notification.operation}</td>
-                      </tr>
-"""
-
-            html_content += """
-                    </table>
-                  </div>
-                  <div style="background: #e9ecef; padding: 10px; text-align: center; font-size: 12px; color: #6c757d; border-radius: 0 0 5px 5px;">
-                    Sent by Nava Ops Notification System
-                  </div>
-                </div>
-              </body>
-            </html>
-            """
-
-            # Attach parts
-            part1 = MIMEText(text_content, 'plain')
-            part2 = MIMEText(html_content, 'html')
-            msg.attach(part1)
-            msg.attach(part2)
-
-            # Send email
-            with smtplib.SMTP(self.config.email_smtp_host, self.config.email_smtp_port) as server:
-                if self.config.email_use_tls:
-                    server.starttls()
-
-                if self.config.email_username and self.config.email_password:
-                    server.login(self.config.email_username, self.config.email_password)
-
-                server.send_message(msg)
-                logger.info(f"Email notification sent to {', '.join(self.config.email_to)}")
+            # Send email over the shared session
+            with self._smtp_lock:
+                server = self._get_smtp()
+                try:
+                    server.send_message(msg)
+                except Exception:
+                    self._close_smtp_locked()
+                    raise
+                self._smtp_sent += 1
+            logger.info(f"Email notification sent to {', '.join(self.config.email_to)}")
 
         except smtplib.SMTPException as e:
             logger.error(f"Failed to send email notification (SMTP error): {e}")
         except Exception as e:
             logger.error(f"Failed to send email notification: {e}")
 
+    def _get_smtp(self) -> smtplib.SMTP:
+        """
+        Return a live SMTP session, connecting and logging in only when needed
+
+        Caller must hold _smtp_lock. The cached session is checked with NOOP
+        and replaced if the server dropped it or it reached _SMTP_MAX_MESSAGES.
+        """
+        if self._smtp is not None:
+            if self._smtp_sent >= _SMTP_MAX_MESSAGES:
+                self._close_smtp_locked()
+            else:
+                try:
+                    if self._smtp.noop()[0] == 250:
+                        return self._smtp
+                except (smtplib.SMTPException, OSError):
+                    pass
+                self._close_smtp_locked()
+
+        server = smtplib.SMTP(self.config.email_smtp_host, self.config.email_smtp_port)
+        try:
+            if self.config.email_use_tls:
+                server.starttls()
+
+            if self.config.email_username and self.config.email_password:
+                server.login(self.config.email_username, self.config.email_password)
+        except Exception:
+            server.close()
+            raise
+
+        self._smtp = server
+        self._smtp_sent = 0
+        _live_managers.add(self)
+        return server
+
+    def _close_smtp(self):
+        """Quit the cached SMTP session, if any"""
+        with self._smtp_lock:
+            self._close_smtp_locked()
+
+    def _close_smtp_locked(self):
+        """Quit the cached SMTP session; caller must hold _smtp_lock"""
+        server, self._smtp = self._smtp, None
+        if server is not None:
+            try:
+                server.quit()
+            except (smtplib.SMTPException, OSError):
+                server.close()
+
+    # Channel -> handler function, bound per instance by _rebuild_dispatch
+    _HANDLER_MAP = {
+        NotificationChannel.CONSOLE: _handle_console,
+        NotificationChannel.FILE: _handle_file,
+        NotificationChannel.WEBHOOK: _handle_webhook,
+        NotificationChannel.EMAIL: _handle_email,
+        NotificationChannel.SLACK: _handle_slack,
+    }
+
     def notify(self, title: str, message: str, level: NotificationLevel = NotificationLevel.INFO, **kwargs):
         """
         Send a simple notification (convenience method)
@@ -443,17 +1314,33 @@ Timestamp: {notification.timestamp.strftime('%Y-%m-%d %H:%M:%S')}
 
     def configure_file(self, file_path: str):
         """Configure file notification channel"""
+        if file_path != self.config.file_path and self._file_sink is not None:
+            self._file_sink.flush()
+            self._file_sink = None
         self.config.file_path = file_path
         self.config.file_enabled = True
-        if NotificationChannel.FILE not in self.channels:
-            self.channels.append(NotificationChannel.FILE)
+        self._add_channel(NotificationChannel.FILE)
+        self._rebuild_dispatch()
+
+    def configure_webhook(self, url: str, batch_size: Optional[int] = None,
+                          ndjson: Optional[bool] = None):
+        """Configure generic webhook notification channel"""
+        self.config.webhook_url = url
+        if batch_size is not None:
+            self.config.webhook_batch_size = batch_size
+        if ndjson is not None:
+            self.config.webhook_ndjson = ndjson
+        self._webhook_sink = None
+        self.config.webhook_enabled = True
+        self._add_channel(NotificationChannel.WEBHOOK)
+        self._rebuild_dispatch()
 
     def configure_slack(self, webhook_url: str):
         """Configure Slack notification channel"""
         self.config.slack_webhook_url = webhook_url
         self.config.slack_enabled = True
-        if NotificationChannel.SLACK not in self.channels:
-            self.channels.append(NotificationChannel.SLACK)
+        self._add_channel(NotificationChannel.SLACK)
+        self._rebuild_dispatch()
 
     def configure_email(self, smtp_host: str, smtp_port: int,
                        from_addr: str, to_addrs: List[str],
@@ -469,8 +1356,9 @@ Timestamp: {notification.timestamp.strftime('%Y-%m-%d %H:%M:%S')}
         self.config.email_password = password
         self.config.email_use_tls = use_tls
         self.config.email_enabled = True
-        if NotificationChannel.EMAIL not in self.channels:
-            self.channels.append(NotificationChannel.EMAIL)
+        self._close_smtp()
+        self._add_channel(NotificationChannel.EMAIL)
+        self._rebuild_dispatch()
 
     def get_notifications(
         self,
@@ -485,26 +1373,111 @@ Timestamp: {notification.timestamp.strftime('%Y-%m-%d %H:%M:%S')}
             limit: Maximum number to return
 
         Returns:
-            List of notifications
+            List of notifications, oldest first
         """
-        notifications = self.notifications
+        history = self._by_level[level] if level else self.notifications
 
-        if level:
-            notifications = [n for n in notifications if n.level == level]
+        if not limit:
+            # Copying the deque is a single C-level operation, safe against
+            # concurrent appends from dispatcher or producer threads
+            return list(history)
 
-        if limit:
-            notifications = notifications[-limit:]
-
-        return notifications
+        try:
+            return self._newest(history, limit)
+        except RuntimeError:
+            # History was appended to mid-walk; query a snapshot instead
+            return self._newest(tuple(history), limit)
+
+    @staticmethod
+    def _newest(history, limit: int) -> List[Notification]:
+        """Return the last `limit` entries of history, oldest first"""
+        # Walk from the newest entry so only `limit` entries are visited
+        result = list(itertools.islice(reversed(history), limit))
+        result.reverse()
+        return result
 
     def clear_notifications(self):
         """Clear all stored notifications"""
-        self.notifications = []
+        with self._lock:
+            self.notifications.clear()
+            for bucket in self._by_level.values():
+                bucket.clear()
         logger.info("Cleared all notifications")
 
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for queued notifications to be delivered
+
+        Args:
+            timeout: Maximum seconds to wait (default: wait indefinitely)
+
+        Returns:
+            True if everything queued was processed, False on timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        if self._pending:
+            self._flush_pending()
+
+        dispatch_queue = self._dispatch_queue
+        if dispatch_queue is not None and not _wait_for_queue(dispatch_queue, deadline):
+            return False
+
+        if self._file_sink is not None:
+            self._file_sink.flush()
+        if self._webhook_sink is None:
+            return True
+        return self._webhook_sink.flush(None if deadline is None else max(0.0, deadline - time.monotonic()))
+
+    def merge(self, other: "NotificationManager") -> int:
+        """
+        Move another manager's notification history into this one
+
+        Args:
+            other: Manager whose history is drained (typically a per-thread one)
+
+        Returns:
+            Number of notifications moved
+        """
+        # The owning thread may keep sending meanwhile; its _record waits
+        with other._lock:
+            drained = list(other.notifications)
+            other.notifications.clear()
+            for bucket in other._by_level.values():
+                bucket.clear()
+
+        if drained and self.config.history_size:
+            with self._lock:
+                for notification in drained:
+                    self._append_history(notification)
+        return len(drained)
+
+    def close(self):
+        """Deliver pending notifications, stop background workers and close open files"""
+        self._flush_pending()
+        self._stop_dispatcher()
+
+        if self._webhook_sink is not None:
+            self._webhook_sink.close()
 
-# Global notification manager
-_global_notifier = NotificationManager()
+        if self._channel_pool is not None:
+            self._channel_pool.shutdown(wait=True)
+            self._channel_pool = None
+
+        if self._file_sink is not None:
+            self._file_sink.close()
+
+        self._close_smtp()
+
+
+# Global notification manager, created on first use by get_notifier()
+_global_notifier: Optional[NotificationManager] = None
+_global_notifier_lock = threading.Lock()
+
+# Per-thread managers handed out by get_thread_notifier()
+_notifier_local = threading.local()
+_thread_notifiers: List[Tuple[threading.Thread, NotificationManager]] = []
+_thread_notifiers_lock = threading.Lock()
 
 
 def send_notification(
@@ -514,34 +1487,77 @@ def send_notification(
     **kwargs
 ):
     """Send a global notification"""
-    _global_notifier.send(level, title, message, **kwargs)
+    get_notifier().send(level, title, message, **kwargs)
 
 
 def info(title: str, message: str, **kwargs):
     """Send info notification"""
-    _global_notifier.info(title, message, **kwargs)
+    get_notifier().info(title, message, **kwargs)
 
 
 def warning(title: str, message: str, **kwargs):
     """Send warning notification"""
-    _global_notifier.warning(title, message, **kwargs)
+    get_notifier().warning(title, message, **kwargs)
 
 
 def error(title: str, message: str, **kwargs):
     """Send error notification"""
-    _global_notifier.error(title, message, **kwargs)
+    get_notifier().error(title, message, **kwargs)
 
 
 def success(title: str, message: str, **kwargs):
     """Send success notification"""
-    _global_notifier.success(title, message, **kwargs)
+    get_notifier().success(title, message, **kwargs)
 
 
 def get_notifier() -> NotificationManager:
     """Get the global notification manager"""
+    global _global_notifier
+    if _global_notifier is None:
+        with _global_notifier_lock:
+            if _global_notifier is None:
+                _global_notifier = NotificationManager()
     return _global_notifier
 
 
+def get_thread_notifier() -> NotificationManager:
+    """
+    Get the calling thread's notification manager
+
+    Each thread gets its own manager (created on first use with the global
+    configuration), so concurrent producers don't contend on one history.
+    File and webhook output still go through the shared process-wide sinks.
+    Call merge_thread_notifications() to collect their histories.
+    """
+    manager = getattr(_notifier_local, 'manager', None)
+    if manager is None:
+        # A copy, so configure_*() on this manager leaves the others alone
+        manager = NotificationManager(replace(get_notifier().config))
+        _notifier_local.manager = manager
+        with _thread_notifiers_lock:
+            _thread_notifiers.append((threading.current_thread(), manager))
+    return manager
+
+
+def merge_thread_notifications() -> int:
+    """
+    Drain per-thread notification histories into the global manager
+
+    Returns:
+        Number of notifications merged
+    """
+    merged = 0
+    notifier = get_notifier()
+    with _thread_notifiers_lock:
+        for thread, manager in _thread_notifiers:
+            merged += notifier.merge(manager)
+        # Forget managers whose thread has finished; their history is drained
+        _thread_notifiers[:] = [
+            (thread, manager) for thread, manager in _thread_notifiers if thread.is_alive()
+        ]
+    return merged
+
+
 # Integration with operations
 
 def notify_operation_start(repository: str, branch: str, operation: str):
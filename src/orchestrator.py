@@ -19,23 +19,38 @@ Optimizations:
 - Efficient resource utilization
 """
 
+import asyncio
+import collections
 import logging
-from typing import List, Dict, Optional, Callable
+import threading
+from typing import Any, Iterable, List, Dict, Optional, Callable, Set, Tuple
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
-from .config import Config, RepositoryConfig, BranchConfig
+from .config import Config, RepositoryConfig, BranchConfig, default_max_workers
 from .branch_ops import (
     BranchOperations,
-    MultiBranchOperations,
     OperationResult
 )
 from .reporting import ReportGenerator, BranchReport, Report
-from .utils import is_git_repository
+from .utils import execute_git_command, is_git_repository, GitCommandError
 
 
 logger = logging.getLogger(__name__)
 
+# for-each-ref format giving every local branch's tip and last commit in one
+# call; fields are NUL-separated so commit subjects can't break parsing
+_BRANCH_STATUS_FORMAT = "%00".join((
+    "%(refname:short)", "%(objectname)", "%(authorname)",
+    "%(authoremail)", "%(authordate)", "%(subject)",
+))
+
+# Operations after which a branch's cached status must be dropped
+_WRITE_OPERATIONS = frozenset({"pull", "push", "create", "switch", "merge"})
+
+# Most branches whose last seen status is kept; least recently used go first
+_STATUS_CACHE_SIZE = 1024
+
 
 class MultibranchOrchestrator:
     """
@@ -56,11 +71,48 @@ class MultibranchOrchestrator:
         self.report_generator = ReportGenerator(config.reporting)
         self.errors = []
 
+        # Worker threads buffer their errors here and hand them back with
+        # their results, so only the coordinating thread touches self.errors
+        self._thread_errors = threading.local()
+
+        # Worker pool shared by every workflow run on this orchestrator;
+        # created on first use and shut down by close()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+        # Per-repository locks serializing working-tree operations when
+        # branches of the same repository are processed concurrently
+        self._repo_locks: Dict[str, threading.Lock] = {}
+
+        # Latest (tip commit, status) per (repository path, branch), in LRU
+        # order; a new tip replaces the old entry instead of adding one
+        self._status_cache: "collections.OrderedDict[Tuple[str, str], Tuple[str, Dict]]" = (
+            collections.OrderedDict()
+        )
+        self._status_lock = threading.Lock()
+
+        # One BranchOperations per repository path for the current workflow;
+        # constructing one validates the repository with a git subprocess
+        self._branch_ops_cache: Dict[str, BranchOperations] = {}
+        self._branch_ops_lock = threading.Lock()
+
         # Validate configuration
         validation_errors = config.validate()
+        if not validation_errors:
+            # Fail fast on misconfigured paths instead of failing every
+            # operation on them with its own git subprocess
+            validation_errors = [
+                f"Not a git repository: {repo.path}"
+                for repo in config.repositories
+                if not is_git_repository(repo.path)
+            ]
         if validation_errors:
             raise ValueError(f"Configuration errors: {', '.join(validation_errors)}")
 
+        if not self.config.max_workers:
+            self.config.max_workers = default_max_workers()
+            logger.debug(f"Using {self.config.max_workers} workers")
+
     def execute_operation_on_branch(
         self,
         repo_config: RepositoryConfig,
@@ -81,49 +133,21 @@ class MultibranchOrchestrator:
             OperationResult
         """
         try:
-            branch_ops = BranchOperations(repo_config, self.config.retry_attempts)
-
-            # Map operation names to methods
-            operations_map = {
-                "fetch": branch_ops.fetch_branch,
-                "pull": branch_ops.pull_branch,
-                "push": branch_ops.push_branch,
-                "create": branch_ops.create_branch,
-                "switch": branch_ops.switch_branch,
-                "merge": branch_ops.merge_branch,
-            }
-
-            if operation not in operations_map:
-                return OperationResult(
-                    success=False,
-                    branch_name=branch_config.name,
-                    operation=operation,
-                    message=f"Unknown operation: {operation}",
-                    error=f"Operation '{operation}' is not supported"
-                )
+            if operation == "fetch":
+                kwargs.setdefault("jobs", self.config.max_workers)
+
+            result = self._get_branch_ops(repo_config).execute_operation(
+                operation,
+                branch_config.name,
+                branch_config.remote,
+                branch_config.merge_strategy,
+                **kwargs
+            )
 
-            # Execute the operation
-            op_func = operations_map[operation]
+            if result.success and operation in _WRITE_OPERATIONS:
+                self._invalidate_status(repo_config, branch_config.name)
 
-            # Prepare arguments based on operation
-            if operation in ["fetch", "pull", "push"]:
-                return op_func(
-                    branch_name=branch_config.name,
-                    remote=branch_config.remote,
-                    **kwargs
-                )
-            elif operation == "create":
-                return op_func(branch_name=branch_config.name, **kwargs)
-            elif operation == "switch":
-                return op_func(branch_name=branch_config.name, **kwargs)
-            elif operation == "merge":
-                return op_func(
-                    source_branch=branch_config.name,
-                    strategy=branch_config.merge_strategy,
-                    **kwargs
-                )
-            else:
-                return op_func(branch_config.name, **kwargs)
+            return result
 
         except Exception as e:
             logger.error(f"Error executing {operation} on {branch_config.name}: {e}")
@@ -135,11 +159,130 @@ class MultibranchOrchestrator:
                 error=str(e)
             )
 
+    def __enter__(self) -> "MultibranchOrchestrator":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self, wait: bool = True):
+        """
+        Shut down the shared worker pool; a later workflow recreates it
+
+        Args:
+            wait: Block until queued branch operations have finished
+        """
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Lazily create the worker pool shared across workflows"""
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.config.max_workers,
+                        thread_name_prefix="nava-ops"
+                    )
+        return self._executor
+
+    def _record_error(self, message: str):
+        """Record a workflow error, buffered per thread inside _call_with_errors()"""
+        buffer = getattr(self._thread_errors, "buffer", None)
+        if buffer is not None:
+            buffer.append(message)
+        else:
+            self.errors.append(message)
+
+    def _call_with_errors(
+        self,
+        func: Callable,
+        *args
+    ) -> Tuple[Any, List[str], Optional[Exception]]:
+        """
+        Run func on a worker thread, collecting the errors it records
+
+        Returns:
+            Tuple of (result, recorded errors, exception raised or None)
+        """
+        errors: List[str] = []
+        self._thread_errors.buffer = errors
+        try:
+            return func(*args), errors, None
+        except Exception as e:
+            return None, errors, e
+        finally:
+            self._thread_errors.buffer = None
+
+    def _get_branch_ops(self, repo_config: RepositoryConfig) -> BranchOperations:
+        """Return the cached BranchOperations for a repository, creating it once"""
+        with self._branch_ops_lock:
+            branch_ops = self._branch_ops_cache.get(repo_config.path)
+        if branch_ops is not None:
+            return branch_ops
+
+        # Construct outside the lock so repositories validate concurrently
+        branch_ops = BranchOperations(repo_config, self.config.retry_attempts)
+        with self._branch_ops_lock:
+            return self._branch_ops_cache.setdefault(repo_config.path, branch_ops)
+
+    def _unavailable_repository_reports(
+        self,
+        repo_config: RepositoryConfig,
+        target_branches: List[BranchConfig],
+        operations: List[str]
+    ) -> Optional[List[BranchReport]]:
+        """
+        Check once that a repository can be operated on
+
+        Args:
+            repo_config: Repository configuration
+            target_branches: Branches the workflow would run on
+            operations: Operations the workflow would run
+
+        Returns:
+            None when the repository is usable, otherwise failed reports for
+            every target branch (the error is recorded once)
+        """
+        try:
+            self._get_branch_ops(repo_config)
+            return None
+        except GitCommandError as e:
+            logger.error(f"Skipping repository {repo_config.name}: {e}")
+            self._record_error(f"Repository {repo_config.name} failed: {str(e)}")
+
+        return [
+            BranchReport(
+                branch_name=branch_config.name,
+                repository=repo_config.name,
+                operations=[
+                    OperationResult(
+                        success=False,
+                        branch_name=branch_config.name,
+                        operation=operation,
+                        message="Repository unavailable",
+                        error=f"Not a git repository: {repo_config.path}"
+                    )
+                    for operation in operations
+                ],
+                status={},
+                success=False
+            )
+            for branch_config in target_branches
+        ]
+
+    def _clear_branch_ops(self):
+        """Drop the BranchOperations cached for the finished workflow"""
+        with self._branch_ops_lock:
+            self._branch_ops_cache.clear()
+
     def execute_workflow_on_repository(
         self,
         repo_config: RepositoryConfig,
         operations: List[str],
-        branches: Optional[List[str]] = None
+        branches: Optional[Iterable[str]] = None
     ) -> List[BranchReport]:
         """
         Execute a workflow on a single repository
@@ -152,77 +295,263 @@ class MultibranchOrchestrator:
         Returns:
             List of BranchReport objects
         """
-        branch_reports = []
-
-        # Determine which branches to operate on
-        target_branches = []
-        if branches:
-            # Filter configured branches
-            target_branches = [
-                bc for bc in repo_config.branches
-                if bc.name in branches
-            ]
-        else:
-            target_branches = repo_config.branches
+        target_branches = self._select_branches(repo_config, branches)
 
         if not target_branches:
             logger.warning(f"No branches configured for repository: {repo_config.name}")
-            return branch_reports
+            return []
 
-        # Create multi-branch operations handler
-        multi_ops = MultiBranchOperations(
-            repo_config,
-            max_workers=self.config.max_workers,
-            retry_attempts=self.config.retry_attempts
+        unavailable = self._unavailable_repository_reports(
+            repo_config, target_branches, operations
         )
+        if unavailable is not None:
+            return unavailable
+
+        branch_reports = [
+            self._run_branch_ops(repo_config, branch_config, operations, with_status=False)
+            for branch_config in target_branches
+        ]
+        self._attach_statuses(repo_config, branch_reports)
+        return branch_reports
 
-        # Execute operations for each branch
-        for branch_config in target_branches:
-            operation_results = []
+    def _nothing_to_do(
+        self,
+        target_repos: List[RepositoryConfig],
+        branch_filter: Optional[Iterable[str]],
+        operations: Optional[List[str]] = None
+    ) -> bool:
+        """
+        Check whether a workflow has no (branch, operation) pair to run
 
-            for operation in operations:
-                logger.info(
-                    f"Executing {operation} on {branch_config.name} "
-                    f"in {repo_config.name}"
-                )
+        Lets empty workflows return an empty report without creating any
+        tasks or touching the worker pool; logs the reason once.
 
-                result = self.execute_operation_on_branch(
-                    repo_config,
-                    branch_config,
-                    operation
-                )
-                operation_results.append(result)
+        Args:
+            target_repos: Repositories the workflow targets
+            branch_filter: Branch names to keep (None for all)
+            operations: Requested operations (None when the workflow
+                doesn't take an operation list)
+        """
+        if operations is not None and not operations:
+            logger.warning("No operations requested; nothing to execute")
+            return True
+        if not any(self._select_branches(repo, branch_filter) for repo in target_repos):
+            logger.warning("No branches selected in the target repositories; nothing to execute")
+            return True
+        return False
+
+    def _select_repositories(
+        self,
+        repositories: Optional[List[str]]
+    ) -> List[RepositoryConfig]:
+        """Return the configured repositories, optionally filtered by name"""
+        if not repositories:
+            return self.config.repositories
+        repo_filter = frozenset(repositories)
+        return [repo for repo in self.config.repositories if repo.name in repo_filter]
+
+    def _select_branches(
+        self,
+        repo_config: RepositoryConfig,
+        branches: Optional[Iterable[str]]
+    ) -> List[BranchConfig]:
+        """
+        Return the configured branches of a repository, optionally filtered by name
 
-                # Stop if operation failed and we're not continuing on errors
-                if not result.success:
-                    logger.warning(
-                        f"Operation {operation} failed on {branch_config.name}"
-                    )
-                    # Continue to next operation anyway for reporting
+        Callers filtering many repositories should pass a frozenset built
+        once; it is used as is, anything else is converted per call.
+        """
+        if not branches:
+            return repo_config.branches
+        branch_filter = frozenset(branches)
+        return [bc for bc in repo_config.branches if bc.name in branch_filter]
 
-            # Get branch status
-            branch_status = {}
-            try:
-                branch_status = multi_ops.branch_ops.get_branch_status(
-                    branch_config.name
-                )
-            except Exception as e:
-                logger.error(f"Error getting status for {branch_config.name}: {e}")
-                self.errors.append(
-                    f"Failed to get status for {branch_config.name}: {str(e)}"
-                )
+    def _run_branch_ops(
+        self,
+        repo_config: RepositoryConfig,
+        branch_config: BranchConfig,
+        operations: List[str],
+        with_status: bool = True
+    ) -> BranchReport:
+        """
+        Run the operation chain on one branch and collect its report
 
-            # Create branch report
-            branch_report = BranchReport(
-                branch_name=branch_config.name,
-                repository=repo_config.name,
-                operations=operation_results,
-                status=branch_status,
-                success=all(op.success for op in operation_results)
+        The chain runs through BranchOperations.execute_chain(), which takes
+        the repository's lock once for its working-tree operations, so
+        branches of one repository can be processed on different threads
+        safely.
+
+        Args:
+            repo_config: Repository configuration
+            branch_config: Branch configuration
+            operations: List of operations to execute in order
+            with_status: Read the branch status now; pass False when the
+                caller fills it in for the whole repository afterwards
+
+        Returns:
+            BranchReport for the branch
+        """
+        repo_lock = self._repo_locks.setdefault(repo_config.path, threading.Lock())
+        operation_results = self._get_branch_ops(repo_config).execute_chain(
+            branch_config.name,
+            operations,
+            remote=branch_config.remote,
+            merge_strategy=branch_config.merge_strategy,
+            repo_lock=repo_lock,
+            fetch_jobs=self.config.max_workers
+        )
+
+        if any(op.success and op.operation in _WRITE_OPERATIONS for op in operation_results):
+            self._invalidate_status(repo_config, branch_config.name)
+
+        # Get branch status
+        branch_status = {}
+        if with_status:
+            branch_status = self._safe_branch_status(repo_config, branch_config.name)
+
+        return BranchReport(
+            branch_name=branch_config.name,
+            repository=repo_config.name,
+            operations=operation_results,
+            status=branch_status,
+            success=all(op.success for op in operation_results)
+        )
+
+    def _branch_status(self, repo_config: RepositoryConfig, branch_name: str) -> Dict:
+        """
+        Get a branch's status, reusing the last result while its tip is unchanged
+
+        Args:
+            repo_config: Repository configuration
+            branch_name: Branch name
+
+        Returns:
+            Branch status dictionary (a copy callers may modify)
+        """
+        head = execute_git_command(
+            ["rev-parse", "--verify", "--quiet", f"{branch_name}^{{commit}}"],
+            repo_config.path
+        )
+        commit = head.stdout.strip() if head.success else None
+
+        if commit is not None:
+            cached = self._cached_status(repo_config.path, branch_name, commit)
+            if cached is not None:
+                return dict(cached)
+
+        status = self._get_branch_ops(repo_config).get_branch_status(branch_name)
+
+        if commit is not None:
+            self._cache_status(repo_config.path, branch_name, commit, dict(status))
+        return status
+
+    def _cached_status(self, path: str, branch_name: str, commit: str) -> Optional[Dict]:
+        """Cached status of a branch if its tip is still at commit"""
+        key = (path, branch_name)
+        with self._status_lock:
+            entry = self._status_cache.get(key)
+            if entry is None or entry[0] != commit:
+                return None
+            self._status_cache.move_to_end(key)
+            return entry[1]
+
+    def _cache_status(self, path: str, branch_name: str, commit: str, status: Dict):
+        """Remember a branch's status at commit, evicting the least recently used"""
+        key = (path, branch_name)
+        with self._status_lock:
+            self._status_cache[key] = (commit, status)
+            self._status_cache.move_to_end(key)
+            while len(self._status_cache) > _STATUS_CACHE_SIZE:
+                self._status_cache.popitem(last=False)
+
+    def _safe_branch_status(self, repo_config: RepositoryConfig, branch_name: str) -> Dict:
+        """_branch_status(), recording failures as workflow errors"""
+        try:
+            return self._branch_status(repo_config, branch_name)
+        except Exception as e:
+            logger.error(f"Error getting status for {branch_name}: {e}")
+            self._record_error(
+                f"Failed to get status for {branch_name}: {str(e)}"
             )
-            branch_reports.append(branch_report)
+            return {}
 
-        return branch_reports
+    def _bulk_branch_status(
+        self,
+        repo_config: RepositoryConfig,
+        branch_names: Optional[Set[str]] = None
+    ) -> Dict[str, Dict]:
+        """
+        Get the status of local branches with a single for-each-ref
+
+        Only branches whose tip changed since the last call need an extra
+        rev-list for their commit count.
+
+        Args:
+            repo_config: Repository configuration
+            branch_names: Branches of interest (None for all local branches)
+
+        Returns:
+            Branch name -> status dictionary; empty if the refs couldn't be read
+        """
+        result = execute_git_command(
+            ["for-each-ref", f"--format={_BRANCH_STATUS_FORMAT}", "refs/heads"],
+            repo_config.path
+        )
+        if not result.success:
+            return {}
+
+        statuses = {}
+        for line in result.stdout.splitlines():
+            fields = line.split("\0")
+            if len(fields) != 6:
+                logger.debug(f"Unexpected for-each-ref output in {repo_config.name}: {line!r}")
+                return {}
+            name, commit, author_name, author_email, date, subject = fields
+            if branch_names is not None and name not in branch_names:
+                continue
+
+            status = self._cached_status(repo_config.path, name, commit)
+
+            if status is None:
+                count_result = execute_git_command(
+                    ["rev-list", "--count", commit],
+                    repo_config.path
+                )
+                status = {
+                    "branch": name,
+                    "exists": True,
+                    "commit_count": int(count_result.stdout) if count_result.success else 0,
+                    "last_commit_hash": commit,
+                    "last_author_name": author_name,
+                    "last_author_email": author_email.strip("<>"),
+                    "last_commit_date": date,
+                    "last_commit_message": subject,
+                }
+                self._cache_status(repo_config.path, name, commit, status)
+
+            statuses[name] = dict(status)
+
+        return statuses
+
+    def _attach_statuses(self, repo_config: RepositoryConfig, branch_reports: List[BranchReport]):
+        """Fill in the status of a repository's branch reports after its operations ran"""
+        if not branch_reports:
+            return
+
+        bulk = self._bulk_branch_status(
+            repo_config, {branch_report.branch_name for branch_report in branch_reports}
+        )
+        for branch_report in branch_reports:
+            status = bulk.get(branch_report.branch_name)
+            if status is None:
+                # Not a local branch, or bulk lookup failed; query it directly
+                status = self._safe_branch_status(repo_config, branch_report.branch_name)
+            branch_report.status = status
+
+    def _invalidate_status(self, repo_config: RepositoryConfig, branch_name: str):
+        """Forget cached status for a branch after an operation changed it"""
+        with self._status_lock:
+            self._status_cache.pop((repo_config.path, branch_name), None)
 
     def execute_workflow(
         self,
@@ -244,91 +573,348 @@ class MultibranchOrchestrator:
         Returns:
             Complete Report object
         """
-        start_time = datetime.now()
-        all_branch_reports = []
-
-        # Determine which repositories to operate on
-        target_repos = []
-        if repositories:
-            target_repos = [
-                repo for repo in self.config.repositories
-                if repo.name in repositories
+        # A plain fetch of every branch is one repository-wide fetch per
+        # repository, letting git fetch several remotes in parallel
+        if operations == ["fetch"] and not branches:
+            return self._sync_repositories(repositories, fast_forward=False)
+
+        try:
+            start_time = datetime.now()
+            builder = self.report_generator.begin_report(start_time)
+
+            # Determine which repositories to operate on
+            target_repos = self._select_repositories(repositories)
+            branch_filter = frozenset(branches) if branches else None
+
+            if not target_repos:
+                logger.error("No repositories to operate on")
+                self.errors.append("No repositories configured or specified")
+                return builder.finish(errors=self.errors)
+
+            if self._nothing_to_do(target_repos, branch_filter, operations):
+                return builder.finish(errors=self.errors)
+
+            # One task per (repository, branch) so branches of a single large
+            # repository are spread across the pool as well
+            tasks = [
+                (repo, branch_config)
+                for repo in target_repos
+                for branch_config in self._select_branches(repo, branch_filter)
             ]
-        else:
-            target_repos = self.config.repositories
-
-        if not target_repos:
-            logger.error("No repositories to operate on")
-            self.errors.append("No repositories configured or specified")
-            end_time = datetime.now()
-            return self.report_generator.create_report(
-                [], start_time, end_time, self.errors
-            )
 
-        # Execute operations
-        if self.config.parallel_operations and len(target_repos) > 1:
-            # Parallel execution across repositories
-            logger.info(
-                f"Executing operations in parallel across {len(target_repos)} repositories"
-            )
+            # Execute operations
+            if self.config.parallel_operations and len(tasks) > 1:
+                # Parallel execution across repositories and branches
+                logger.info(
+                    f"Executing operations in parallel on {len(tasks)} branches "
+                    f"across {len(target_repos)} repositories"
+                )
 
-            with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
+                # Check each repository once up front; unusable ones are
+                # reported as failed without queueing any of their branches
+                skipped: Set[str] = set()
+                for repo in target_repos:
+                    repo_branches = self._select_branches(repo, branch_filter)
+                    if not repo_branches:
+                        continue
+                    unavailable = self._unavailable_repository_reports(
+                        repo, repo_branches, operations
+                    )
+                    if unavailable is not None:
+                        skipped.add(repo.path)
+                        builder.add_branch_reports(unavailable)
+                if skipped:
+                    tasks = [task for task in tasks if task[0].path not in skipped]
+
+                executor = self._get_executor()
                 futures = {
                     executor.submit(
-                        self.execute_workflow_on_repository,
+                        self._call_with_errors,
+                        self._run_branch_ops,
                         repo,
+                        branch_config,
                         operations,
-                        branches
-                    ): repo
-                    for repo in target_repos
+                        False
+                    ): (repo, branch_config)
+                    for repo, branch_config in tasks
                 }
 
-                for future in as_completed(futures):
-                    repo = futures[future]
+                reports_by_repo: Dict[str, List[BranchReport]] = {}
+                remaining: Dict[str, int] = {}
+                for repo, _ in tasks:
+                    remaining[repo.path] = remaining.get(repo.path, 0) + 1
+                for repo in target_repos:
+                    if repo.path not in remaining and repo.path not in skipped:
+                        logger.warning(f"No branches configured for repository: {repo.name}")
+
+                pending = set(futures)
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        repo, branch_config = futures[future]
+                        branch_report, errors, e = future.result()
+                        self.errors.extend(errors)
+                        if e is None:
+                            reports_by_repo.setdefault(repo.path, []).append(branch_report)
+                        else:
+                            logger.error(
+                                f"Error processing branch {branch_config.name} "
+                                f"in repository {repo.name}: {e}"
+                            )
+                            self.errors.append(
+                                f"Branch {branch_config.name} in repository "
+                                f"{repo.name} failed: {str(e)}"
+                            )
+
+                        # Once a repository's last branch is done, read its
+                        # statuses and hand its reports to the builder while
+                        # other repositories are still running
+                        remaining[repo.path] -= 1
+                        if remaining[repo.path] == 0:
+                            repo_reports = reports_by_repo.pop(repo.path, [])
+                            self._attach_statuses(repo, repo_reports)
+                            builder.add_branch_reports(repo_reports)
+            else:
+                # Sequential execution
+                logger.info("Executing operations sequentially")
+                for repo in target_repos:
                     try:
-                        branch_reports = future.result()
-                        all_branch_reports.extend(branch_reports)
-                        logger.info(
-                            f"Completed operations on repository: {repo.name}"
+                        branch_reports = self.execute_workflow_on_repository(
+                            repo,
+                            operations,
+                            branch_filter
                         )
+                        builder.add_branch_reports(branch_reports)
+                        logger.info(f"Completed operations on repository: {repo.name}")
                     except Exception as e:
                         logger.error(f"Error processing repository {repo.name}: {e}")
-                        self.errors.append(
-                            f"Repository {repo.name} failed: {str(e)}"
-                        )
-        else:
-            # Sequential execution
-            logger.info("Executing operations sequentially")
+                        self.errors.append(f"Repository {repo.name} failed: {str(e)}")
+
+            # Generate report
+            report = builder.finish(errors=self.errors)
+
+            logger.info(
+                f"Workflow completed: {report.summary.successful_operations}/"
+                f"{report.summary.total_operations} operations succeeded "
+                f"({report.summary.success_rate:.1f}%)"
+            )
+
+            return report
+        finally:
+            self._clear_branch_ops()
+
+    async def execute_workflow_async(
+        self,
+        operations: List[str],
+        repositories: Optional[List[str]] = None,
+        branches: Optional[List[str]] = None
+    ) -> Report:
+        """
+        Execute a workflow across multiple repositories on the event loop
+
+        Async counterpart of execute_workflow(). Fetch, pull and push run
+        as asyncio subprocesses, so many branches can wait on the network
+        without a thread each; at most max_workers branches run at once.
+        Local operations and status reads run in the loop's default
+        executor.
+
+        Args:
+            operations: List of operations to execute (fetch, pull, push, etc.)
+            repositories: List of repository names (None for all)
+            branches: List of branch names (None for all)
+
+        Returns:
+            Complete Report object
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            start_time = datetime.now()
+            builder = self.report_generator.begin_report(start_time)
+
+            target_repos = self._select_repositories(repositories)
+            branch_filter = frozenset(branches) if branches else None
+
+            if not target_repos:
+                logger.error("No repositories to operate on")
+                self.errors.append("No repositories configured or specified")
+                return builder.finish(errors=self.errors)
+
+            if self._nothing_to_do(target_repos, branch_filter, operations):
+                return builder.finish(errors=self.errors)
+
+            # Check each repository once, off the loop, before queueing its
+            # branches
+            tasks = []
             for repo in target_repos:
-                try:
-                    branch_reports = self.execute_workflow_on_repository(
-                        repo,
-                        operations,
-                        branches
+                repo_branches = self._select_branches(repo, branch_filter)
+                if not repo_branches:
+                    logger.warning(f"No branches configured for repository: {repo.name}")
+                    continue
+                unavailable, errors, _ = await loop.run_in_executor(
+                    None,
+                    self._call_with_errors,
+                    self._unavailable_repository_reports,
+                    repo,
+                    repo_branches,
+                    operations
+                )
+                self.errors.extend(errors)
+                if unavailable is not None:
+                    builder.add_branch_reports(unavailable)
+                else:
+                    tasks.extend((repo, branch_config) for branch_config in repo_branches)
+
+            logger.info(
+                f"Executing operations asynchronously on {len(tasks)} branches "
+                f"across {len(target_repos)} repositories"
+            )
+
+            semaphore = asyncio.Semaphore(self.config.max_workers)
+            repo_locks = {repo.path: asyncio.Lock() for repo, _ in tasks}
+            results = await asyncio.gather(
+                *[
+                    self._run_branch_ops_async(
+                        repo, branch_config, operations, semaphore, repo_locks[repo.path]
                     )
-                    all_branch_reports.extend(branch_reports)
-                    logger.info(f"Completed operations on repository: {repo.name}")
-                except Exception as e:
-                    logger.error(f"Error processing repository {repo.name}: {e}")
-                    self.errors.append(f"Repository {repo.name} failed: {str(e)}")
-
-        end_time = datetime.now()
-
-        # Generate report
-        report = self.report_generator.create_report(
-            all_branch_reports,
-            start_time,
-            end_time,
-            self.errors
-        )
+                    for repo, branch_config in tasks
+                ],
+                return_exceptions=True
+            )
 
-        logger.info(
-            f"Workflow completed: {report.summary.successful_operations}/"
-            f"{report.summary.total_operations} operations succeeded "
-            f"({report.summary.success_rate:.1f}%)"
+            reports_by_repo: Dict[str, List[BranchReport]] = {}
+            for (repo, branch_config), result in zip(tasks, results):
+                if isinstance(result, Exception):
+                    logger.error(
+                        f"Error processing branch {branch_config.name} "
+                        f"in repository {repo.name}: {result}"
+                    )
+                    self.errors.append(
+                        f"Branch {branch_config.name} in repository "
+                        f"{repo.name} failed: {str(result)}"
+                    )
+                else:
+                    reports_by_repo.setdefault(repo.path, []).append(result)
+
+            for repo in target_repos:
+                repo_reports = reports_by_repo.get(repo.path)
+                if not repo_reports:
+                    continue
+                _, errors, _ = await loop.run_in_executor(
+                    None, self._call_with_errors, self._attach_statuses, repo, repo_reports
+                )
+                self.errors.extend(errors)
+                builder.add_branch_reports(repo_reports)
+
+            # Generate report
+            report = builder.finish(errors=self.errors)
+
+            logger.info(
+                f"Workflow completed: {report.summary.successful_operations}/"
+                f"{report.summary.total_operations} operations succeeded "
+                f"({report.summary.success_rate:.1f}%)"
+            )
+
+            return report
+        finally:
+            self._clear_branch_ops()
+
+    async def _run_branch_ops_async(
+        self,
+        repo_config: RepositoryConfig,
+        branch_config: BranchConfig,
+        operations: List[str],
+        semaphore: asyncio.Semaphore,
+        repo_lock: asyncio.Lock
+    ) -> BranchReport:
+        """
+        Async counterpart of _run_branch_ops(); the status is left empty
+
+        Args:
+            repo_config: Repository configuration
+            branch_config: Branch configuration
+            operations: List of operations to execute in order
+            semaphore: Limits how many branches run at once
+            repo_lock: Serializes git operations in the repository
+
+        Returns:
+            BranchReport for the branch
+        """
+        operation_results = []
+
+        async with semaphore:
+            for operation in operations:
+                logger.info(
+                    f"Executing {operation} on {branch_config.name} "
+                    f"in {repo_config.name}"
+                )
+
+                # Every operation writes FETCH_HEAD, refs or the working
+                # tree, so none may overlap another in the same repository
+                async with repo_lock:
+                    result = await self._execute_operation_async(
+                        repo_config, branch_config, operation
+                    )
+                operation_results.append(result)
+
+                if not result.success:
+                    logger.warning(
+                        f"Operation {operation} failed on {branch_config.name}"
+                    )
+
+        return BranchReport(
+            branch_name=branch_config.name,
+            repository=repo_config.name,
+            operations=operation_results,
+            status={},
+            success=all(op.success for op in operation_results)
         )
 
-        return report
+    async def _execute_operation_async(
+        self,
+        repo_config: RepositoryConfig,
+        branch_config: BranchConfig,
+        operation: str
+    ) -> OperationResult:
+        """
+        Run one operation, awaiting git directly for network operations
+
+        Operations without an async variant go through
+        execute_operation_on_branch() in the default executor.
+        """
+        spec = BranchOperations.OPERATION_SPEC.get(operation)
+        if spec is None or spec[1] != "remote":
+            return await asyncio.get_running_loop().run_in_executor(
+                None,
+                self.execute_operation_on_branch,
+                repo_config,
+                branch_config,
+                operation
+            )
+
+        try:
+            branch_ops = self._get_branch_ops(repo_config)
+            op_func = getattr(branch_ops, f"{spec[0]}_async")
+            kwargs = {"jobs": self.config.max_workers} if operation == "fetch" else {}
+            result = await op_func(
+                branch_name=branch_config.name,
+                remote=branch_config.remote,
+                **kwargs
+            )
+
+            if result.success and operation in _WRITE_OPERATIONS:
+                self._invalidate_status(repo_config, branch_config.name)
+
+            return result
+
+        except Exception as e:
+            logger.error(f"Error executing {operation} on {branch_config.name}: {e}")
+            return OperationResult(
+                success=False,
+                branch_name=branch_config.name,
+                operation=operation,
+                message="Operation failed with exception",
+                error=str(e)
+            )
 
     def sync_all_branches(
         self,
@@ -346,10 +932,163 @@ class MultibranchOrchestrator:
             Complete Report object
         """
         logger.info("Starting sync workflow for all branches")
-        return self.execute_workflow(
-            operations=["fetch", "pull"],
-            repositories=repositories
+        return self._sync_repositories(repositories, fast_forward=True)
+
+    def _sync_repositories(
+        self,
+        repositories: Optional[List[str]],
+        fast_forward: bool
+    ) -> Report:
+        """
+        Run _sync_repository() over the target repositories
+
+        Args:
+            repositories: List of repository names (None for all)
+            fast_forward: Fast-forward branches after fetching
+
+        Returns:
+            Complete Report object
+        """
+        start_time = datetime.now()
+        builder = self.report_generator.begin_report(start_time)
+
+        try:
+            target_repos = self._select_repositories(repositories)
+
+            if not target_repos:
+                logger.error("No repositories to operate on")
+                self.errors.append("No repositories configured or specified")
+                return builder.finish(errors=self.errors)
+
+            if self._nothing_to_do(target_repos, None):
+                return builder.finish(errors=self.errors)
+
+            if self.config.parallel_operations and len(target_repos) > 1:
+                executor = self._get_executor()
+                futures = {
+                    executor.submit(
+                        self._call_with_errors,
+                        self._sync_repository,
+                        repo,
+                        fast_forward
+                    ): repo
+                    for repo in target_repos
+                }
+                pending = set(futures)
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        repo = futures[future]
+                        branch_reports, errors, e = future.result()
+                        self.errors.extend(errors)
+                        if e is None:
+                            builder.add_branch_reports(branch_reports)
+                        else:
+                            logger.error(f"Error processing repository {repo.name}: {e}")
+                            self.errors.append(f"Repository {repo.name} failed: {str(e)}")
+            else:
+                for repo in target_repos:
+                    try:
+                        builder.add_branch_reports(self._sync_repository(repo, fast_forward))
+                    except Exception as e:
+                        logger.error(f"Error processing repository {repo.name}: {e}")
+                        self.errors.append(f"Repository {repo.name} failed: {str(e)}")
+
+            report = builder.finish(errors=self.errors)
+            logger.info(
+                f"Workflow completed: {report.summary.successful_operations}/"
+                f"{report.summary.total_operations} operations succeeded "
+                f"({report.summary.success_rate:.1f}%)"
+            )
+            return report
+        finally:
+            self._clear_branch_ops()
+
+    def _sync_repository(
+        self,
+        repo_config: RepositoryConfig,
+        fast_forward: bool = True
+    ) -> List[BranchReport]:
+        """
+        Fetch and fast-forward every configured branch of one repository
+
+        Instead of a fetch and a pull per branch, the repository's remotes
+        are fetched once and each branch is then fast-forwarded to its
+        already fetched remote branch.
+
+        Args:
+            repo_config: Repository configuration
+            fast_forward: Fast-forward branches after fetching; when False
+                only the fetch is run and reported
+
+        Returns:
+            List of BranchReport objects, reported as fetch (and pull)
+        """
+        operations = ["fetch", "pull"] if fast_forward else ["fetch"]
+        target_branches = repo_config.branches
+        if not target_branches:
+            logger.warning(f"No branches configured for repository: {repo_config.name}")
+            return []
+
+        unavailable = self._unavailable_repository_reports(
+            repo_config, target_branches, operations
         )
+        if unavailable is not None:
+            return unavailable
+
+        branch_ops = self._get_branch_ops(repo_config)
+        remotes = sorted({bc.remote for bc in target_branches})
+        repo_lock = self._repo_locks.setdefault(repo_config.path, threading.Lock())
+        # Held across the fetch and the fast-forwards so no other git write
+        # in the repository lands in between
+        with repo_lock:
+            logger.info(f"Fetching {', '.join(remotes)} in {repo_config.name}")
+            # Only a sync prunes; a plain fetch leaves stale remote-tracking refs
+            fetch_result = branch_ops.fetch_remotes(
+                remotes, jobs=self.config.max_workers, prune=fast_forward
+            )
+            if not fetch_result.success:
+                logger.warning(f"Fetch failed in {repo_config.name}: {fetch_result.error}")
+
+            branch_reports = [
+                BranchReport(
+                    branch_name=branch_config.name,
+                    repository=repo_config.name,
+                    operations=[OperationResult(
+                        success=fetch_result.success,
+                        branch_name=branch_config.name,
+                        operation="fetch",
+                        message=fetch_result.message,
+                        error=fetch_result.error
+                    )],
+                    status={},
+                    success=fetch_result.success
+                )
+                for branch_config in target_branches
+            ]
+
+            if fast_forward:
+                current_branch = branch_ops.get_current_branch()
+
+                for branch_config, branch_report in zip(target_branches, branch_reports):
+                    logger.info(
+                        f"Executing pull on {branch_config.name} in {repo_config.name}"
+                    )
+                    pull_op = branch_ops.fast_forward_branch(
+                        branch_config.name,
+                        branch_config.remote,
+                        current_branch
+                    )
+                    if pull_op.success:
+                        self._invalidate_status(repo_config, branch_config.name)
+                    else:
+                        logger.warning(f"Operation pull failed on {branch_config.name}")
+
+                    branch_report.operations.append(pull_op)
+                    branch_report.success = branch_report.success and pull_op.success
+
+        self._attach_statuses(repo_config, branch_reports)
+        return branch_reports
 
     def fetch_all_branches(
         self,
@@ -390,62 +1129,50 @@ class MultibranchOrchestrator:
         Returns:
             Complete Report object
         """
-        start_time = datetime.now()
-        all_branch_reports = []
-
-        # Determine target repositories
-        target_repos = []
-        if repositories:
-            target_repos = [
-                repo for repo in self.config.repositories
-                if repo.name in repositories
-            ]
-        else:
-            target_repos = self.config.repositories
-
-        # Execute custom workflow
-        for repo_config in target_repos:
-            target_branches = []
-            if branches:
-                target_branches = [
-                    bc for bc in repo_config.branches
-                    if bc.name in branches
-                ]
-            else:
-                target_branches = repo_config.branches
+        try:
+            start_time = datetime.now()
+            builder = self.report_generator.begin_report(start_time)
 
-            branch_ops = BranchOperations(repo_config, self.config.retry_attempts)
+            # Determine target repositories
+            target_repos = self._select_repositories(repositories)
+            branch_filter = frozenset(branches) if branches else None
 
-            for branch_config in target_branches:
-                try:
-                    operation_results = workflow_func(branch_ops, branch_config)
+            if self._nothing_to_do(target_repos, branch_filter):
+                return builder.finish(errors=self.errors)
 
-                    # Get branch status
-                    branch_status = branch_ops.get_branch_status(branch_config.name)
+            # Execute custom workflow
+            for repo_config in target_repos:
+                target_branches = self._select_branches(repo_config, branch_filter)
 
-                    branch_report = BranchReport(
-                        branch_name=branch_config.name,
-                        repository=repo_config.name,
-                        operations=operation_results,
-                        status=branch_status,
-                        success=all(op.success for op in operation_results)
-                    )
-                    all_branch_reports.append(branch_report)
+                branch_ops = self._get_branch_ops(repo_config)
+                repo_reports = []
 
-                except Exception as e:
-                    logger.error(
-                        f"Error in custom workflow for {branch_config.name}: {e}"
-                    )
-                    self.errors.append(
-                        f"Custom workflow failed for {branch_config.name}: {str(e)}"
-                    )
+                for branch_config in target_branches:
+                    try:
+                        operation_results = workflow_func(branch_ops, branch_config)
+
+                        branch_report = BranchReport(
+                            branch_name=branch_config.name,
+                            repository=repo_config.name,
+                            operations=operation_results,
+                            status={},
+                            success=all(op.success for op in operation_results)
+                        )
+                        repo_reports.append(branch_report)
+
+                    except Exception as e:
+                        logger.error(
+                            f"Error in custom workflow for {branch_config.name}: {e}"
+                        )
+                        self.errors.append(
+                            f"Custom workflow failed for {branch_config.name}: {str(e)}"
+                        )
 
-        end_time = datetime.now()
+                # Get branch statuses for the repository in one pass
+                self._attach_statuses(repo_config, repo_reports)
+                builder.add_branch_reports(repo_reports)
 
-        # Generate report
-        return self.report_generator.create_report(
-            all_branch_reports,
-            start_time,
-            end_time,
-            self.errors
-        )
+            # Generate report
+            return builder.finish(errors=self.errors)
+        finally:
+            self._clear_branch_ops()
@@ -2,7 +2,7 @@
 Report History & Comparison Module
 
 Features:
-- Store report history in JSON database
+- Store report history in an append-only JSON lines file
 - Compare current vs previous reports
 - Trend detection over time
 - Anomaly detection
@@ -10,22 +10,124 @@ Features:
 - Performance tracking
 """
 
+import atexit
+import bisect
+import functools
 import json
+import mmap
 import os
-from typing import Dict, List, Optional, Tuple
+import statistics
+from typing import Deque, Dict, Iterable, List, Optional, Sequence, Tuple
+from array import array
+from collections import deque
+from itertools import islice
 from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # Optional dependency
+    orjson = None
+
 
 class DateTimeEncoder(json.JSONEncoder):
-    """Custom JSON encoder that handles datetime objects"""
+    """Custom JSON encoder that handles datetime objects (used without orjson)"""
     def default(self, obj):
         if isinstance(obj, datetime):
             return obj.isoformat()
         return super().default(obj)
 
 
+def _dump_json(data, pretty: bool = True) -> bytes:
+    """Serialize to indented or compact JSON, with orjson's C encoder when installed"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if pretty:
+        return json.dumps(data, indent=2, cls=DateTimeEncoder).encode('utf-8')
+    return json.dumps(data, separators=(',', ':'), cls=DateTimeEncoder).encode('utf-8')
+
+
+def _dump_json_line(data) -> bytes:
+    """Serialize to one compact, newline-terminated JSON line"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(data, separators=(',', ':'), cls=DateTimeEncoder).encode('utf-8') + b'\n'
+
+
+# Summary fields copied to the top level of each history entry, so the
+# analytics loops read them with a single lookup
+_METRIC_FIELDS = ('success_rate', 'duration_seconds', 'total_operations')
+
+
+def _metric_value(value) -> float:
+    """A summary metric as a float; anything that isn't a number counts as 0"""
+    if isinstance(value, (int, float)):
+        return float(value)
+    return 0.0
+
+
+def _promote_metrics(entry: Dict) -> Dict:
+    """Copy the summary metrics of a history entry to its top level as floats"""
+    summary = entry.get('summary', {})
+    for field in _METRIC_FIELDS:
+        entry[field] = _metric_value(entry[field] if field in entry else summary.get(field, 0))
+    return entry
+
+
+def _half_averages(values: Sequence[float]) -> Tuple[float, float, float]:
+    """
+    Averages of the older half, the newer half and all of at least two values
+
+    The total is summed once and the newer half derived from it, rather
+    than summing each slice separately.
+
+    Returns:
+        Tuple of (previous_average, recent_average, average)
+    """
+    count = len(values)
+    mid = count // 2
+    first_sum = sum(values[:mid])
+    total = sum(values)
+    return first_sum / mid, (total - first_sum) / (count - mid), total / count
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_timestamp(timestamp: str) -> datetime:
+    """Parse an ISO timestamp, caching results for entries seen repeatedly"""
+    return datetime.fromisoformat(timestamp)
+
+
+def _load_json(data: bytes):
+    """Parse JSON, with orjson when installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _robust_spread(values: Sequence[float]) -> Tuple[float, float]:
+    """
+    Median and a robust, standard-deviation-scaled spread of values
+
+    The spread is 1.4826 x the median absolute deviation (MAD), which a
+    single outlier can't inflate. When more than half the values are equal
+    the MAD is zero, so 1.2533 x the mean absolute deviation from the median
+    is used instead; it is zero only if every value is equal.
+
+    Returns:
+        Tuple of (median, spread)
+    """
+    median = statistics.median(values)
+    deviations = [abs(value - median) for value in values]
+    mad = statistics.median(deviations)
+    if mad > 0:
+        return median, 1.4826 * mad
+    return median, 1.2533 * sum(deviations) / len(deviations)
+
+
 @dataclass
 class HistoricalTrend:
     """Represents a trend over time"""
@@ -36,6 +138,17 @@ class HistoricalTrend:
     previous_value: float
     confidence: str  # low, medium, high
 
+    def to_dict(self) -> Dict:
+        """Convert trend to dictionary"""
+        return {
+            'metric_name': self.metric_name,
+            'direction': self.direction,
+            'change_percent': self.change_percent,
+            'current_value': self.current_value,
+            'previous_value': self.previous_value,
+            'confidence': self.confidence
+        }
+
 
 @dataclass
 class Anomaly:
@@ -46,6 +159,16 @@ class Anomaly:
     severity: str  # low, medium, high
     description: str
 
+    def to_dict(self) -> Dict:
+        """Convert anomaly to dictionary"""
+        return {
+            'metric_name': self.metric_name,
+            'current_value': self.current_value,
+            'expected_range': self.expected_range,
+            'severity': self.severity,
+            'description': self.description
+        }
+
 
 @dataclass
 class ComparisonResult:
@@ -58,43 +181,262 @@ class ComparisonResult:
     regressions: List[str]
     summary: str
 
+    def to_dict(self) -> Dict:
+        """Convert comparison to dictionary, including nested trends and anomalies"""
+        return {
+            'timestamp_current': self.timestamp_current,
+            'timestamp_previous': self.timestamp_previous,
+            'trends': [trend.to_dict() for trend in self.trends],
+            'anomalies': [anomaly.to_dict() for anomaly in self.anomalies],
+            'improvements': list(self.improvements),
+            'regressions': list(self.regressions),
+            'summary': self.summary
+        }
+
+
+# Trends reported by compare_summaries, in argument order: metric name,
+# significant change (%), high-confidence change (%), whether higher is
+# better (None: neither), and for improvement/regression messages a label,
+# unit and the verb for a change for the worse (label None: no messages)
+_TREND_SPECS = (
+    ("Success Rate", 1.0, 10.0, True, "Success rate", "%", "declined"),
+    ("Execution Duration", 5.0, 20.0, False, "Execution time", "s", "increased"),
+    ("Total Operations", 10.0, None, None, None, None, None),
+)
+
+
+def _compute_trend(
+    metric_name: str,
+    current: float,
+    previous: float,
+    threshold: float,
+    high_cut: Optional[float],
+    higher_is_better: Optional[bool]
+) -> Optional[HistoricalTrend]:
+    """
+    Trend between two values of a metric, if the change is significant
+
+    Args:
+        metric_name: Name reported on the trend
+        current: Current value
+        previous: Previous value; no trend is reported unless it is positive
+        threshold: Percent change at or below which nothing is reported
+        high_cut: Percent change above which confidence is high (None: never)
+        higher_is_better: Whether an increase is an improvement (None: the
+            metric is reported as stable either way)
+
+    Returns:
+        The trend, or None when the change is not significant
+    """
+    if previous <= 0:
+        return None
+    change = ((current - previous) / previous) * 100
+    if abs(change) <= threshold:
+        return None
+
+    if higher_is_better is None:
+        direction = "stable"
+    elif (change > 0) == higher_is_better:
+        direction = "improving"
+    else:
+        direction = "declining"
+    confidence = "high" if high_cut is not None and abs(change) > high_cut else "medium"
+
+    return HistoricalTrend(
+        metric_name=metric_name,
+        direction=direction,
+        change_percent=change,
+        current_value=current,
+        previous_value=previous,
+        confidence=confidence
+    )
+
 
 class ReportHistoryManager:
     """
     Manages report history and provides comparison & trend analysis
     """
 
-    def __init__(self, history_dir: str = "./reports/history"):
+    # Number of most recent reports kept
+    _MAX_ENTRIES = 100
+
+    # Default number of most recent reports anomalies are measured against
+    _ANOMALY_WINDOW = 10
+
+    def __init__(
+        self,
+        history_dir: str = "./reports/history",
+        autosave: bool = True,
+        flush_every: int = 1
+    ):
         """
         Initialize report history manager
 
         Args:
             history_dir: Directory to store report history
+            autosave: Write added reports to disk automatically; if False they
+                are only written by flush() or close()
+            flush_every: Number of added reports to batch into one write
         """
         self.history_dir = Path(history_dir)
         self.history_dir.mkdir(parents=True, exist_ok=True)
-        self.history_file = self.history_dir / "report_history.json"
-        self.history = self._load_history()
+        self.history_file = self.history_dir / "report_history.jsonl"
+        self._legacy_history_file = self.history_dir / "report_history.json"
+
+        # Lines currently in the history file; entries are appended and the
+        # file is compacted once it holds twice the retained history
+        self._file_entries = 0
+
+        # Added entries not yet written to the history file
+        self._pending: List[Dict] = []
+        self._autosave = autosave
+        self._flush_every = max(1, flush_every)
+        if not autosave or self._flush_every > 1:
+            # Writes can be deferred, so make sure they happen at exit
+            atexit.register(self.close)
+
+        # History is read from disk on first use, so callers that only add
+        # a report or look at the latest one don't parse the whole file
+        self._history: Optional[Deque[Dict]] = None
+        self._timestamps: Optional[List[float]] = None
+        self._metrics: Dict[str, array] = {}
+
+    @property
+    def history(self) -> Deque[Dict]:
+        """
+        Retained history entries, oldest first
+
+        A deque bounded to _MAX_ENTRIES, so appending evicts the oldest
+        entry; use itertools.islice rather than slicing it.
+        """
+        self._ensure_loaded()
+        return self._history
+
+    @history.setter
+    def history(self, history: Iterable[Dict]):
+        self._set_history(history)
+
+    def _ensure_loaded(self):
+        """Load history and build its indexes if that hasn't happened yet"""
+        if self._history is None:
+            self._set_history(self._load_history())
+
+    def _set_history(self, history: Iterable[Dict]):
+        """Replace the retained history and rebuild the indexes parallel to it"""
+        entries = deque(
+            (_promote_metrics(entry) for entry in history), maxlen=self._MAX_ENTRIES
+        )
+
+        # Metric columns parallel to self.history, so analytics slice
+        # contiguous arrays instead of collecting values from each entry;
+        # built first so a failure leaves the previous state intact
+        self._metrics = {
+            field: array('d', [r[field] for r in entries])
+            for field in _METRIC_FIELDS
+        }
+        self._history = entries
+        self._timestamps = self._index_timestamps()
 
     def _load_history(self) -> List[Dict]:
         """Load report history from file"""
         if self.history_file.exists():
             try:
-                with open(self.history_file, 'r') as f:
-                    return json.load(f)
+                data = self.history_file.read_bytes()
+            except Exception as e:
+                print(f"Error loading history: {e}")
+                return []
+
+            history = []
+            damaged = bool(data) and not data.endswith(b'\n')
+            for line in data.splitlines():
+                if not line.strip():
+                    continue
+                try:
+                    history.append(_promote_metrics(_load_json(line)))
+                except ValueError as e:
+                    # Most likely a write cut short; keep the other entries
+                    print(f"Skipping unreadable history entry: {e}")
+                    damaged = True
+            self._file_entries = len(history)
+            history = history[-self._MAX_ENTRIES:]
+
+            if damaged:
+                # Rewrite so later appends don't land after a partial line
+                self._write_history_file(history)
+            return history
+
+        if self._legacy_history_file.exists():
+            # History written by earlier versions as a single JSON array
+            try:
+                history = _load_json(self._legacy_history_file.read_bytes())
             except Exception as e:
                 print(f"Error loading history: {e}")
                 return []
+            history = [_promote_metrics(entry) for entry in history[-self._MAX_ENTRIES:]]
+            self._write_history_file(history)
+            return history
+
         return []
 
+    def _index_timestamps(self) -> Optional[List[float]]:
+        """
+        Epoch seconds of every history entry, for bisecting time ranges
+
+        Returns:
+            Sorted timestamps parallel to self.history, or None when an entry
+            has no parseable timestamp or entries are out of order (range
+            queries then fall back to a scan)
+        """
+        timestamps = []
+        for report in self.history:
+            try:
+                timestamps.append(_parse_timestamp(report.get('timestamp', '')).timestamp())
+            except (ValueError, TypeError):
+                return None
+        if any(a > b for a, b in zip(timestamps, timestamps[1:])):
+            return None
+        return timestamps
+
+    def _write_history_file(self, history: Iterable[Dict]):
+        """Atomically replace the history file with the given entries"""
+        tmp_file = self.history_file.with_name(self.history_file.name + '.tmp')
+        try:
+            with open(tmp_file, 'wb') as f:
+                f.write(b''.join(_dump_json_line(entry) for entry in history))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.history_file)
+            self._file_entries = len(history)
+        except Exception as e:
+            print(f"Error saving history: {e}")
+
     def _save_history(self):
-        """Save report history to file"""
+        """Rewrite the history file with the retained history (compaction)"""
+        self._write_history_file(self.history)
+
+    def _append_entries(self, entries: List[Dict]):
+        """Append entries to the history file, compacting it when it has grown"""
+        if self._file_entries >= 2 * self._MAX_ENTRIES:
+            self._save_history()
+            return
         try:
-            with open(self.history_file, 'w') as f:
-                json.dump(self.history, f, indent=2, cls=DateTimeEncoder)
+            with open(self.history_file, 'ab') as f:
+                f.write(b''.join(_dump_json_line(entry) for entry in entries))
+            self._file_entries += len(entries)
         except Exception as e:
             print(f"Error saving history: {e}")
 
+    def flush(self):
+        """Write reports added since the last write to the history file"""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        self._append_entries(pending)
+
+    def close(self):
+        """Flush pending reports; the manager stays usable afterwards"""
+        self.flush()
+
     def add_report(self, report: Dict, analytics: Optional[Dict] = None):
         """
         Add a report to history
@@ -103,24 +445,75 @@ class ReportHistoryManager:
             report: Report data
             analytics: Optional analytics data
         """
+        now = datetime.now()
+        summary = report.get('summary', {})
         history_entry = {
-            'timestamp': datetime.now().isoformat(),
-            'summary': report.get('summary', {}),
+            'timestamp': now.isoformat(),
+            'summary': summary,
             'analytics': analytics or {},
             'branch_count': len(report.get('branch_reports', [])),
-            'error_count': len(report.get('errors', []))
+            'error_count': len(report.get('errors', [])),
+            'success_rate': _metric_value(summary.get('success_rate', 0)),
+            'duration_seconds': _metric_value(summary.get('duration_seconds', 0)),
+            'total_operations': _metric_value(summary.get('total_operations', 0))
         }
 
-        self.history.append(history_entry)
+        # The bounded history evicts the oldest entry itself; the indexes
+        # are trimmed to stay parallel to it. Columns are appended first so
+        # the entry only joins the history once they accept it
+        history = self.history
+        for field, column in self._metrics.items():
+            column.append(history_entry[field])
+        history.append(history_entry)
+        if self._timestamps is not None:
+            if self._timestamps and now.timestamp() < self._timestamps[-1]:
+                # Clock went backwards; the index would no longer be sorted
+                self._timestamps = None
+            else:
+                self._timestamps.append(now.timestamp())
+
+        if len(self._metrics['success_rate']) > self._MAX_ENTRIES:
+            if self._timestamps is not None:
+                del self._timestamps[:-self._MAX_ENTRIES]
+            for column in self._metrics.values():
+                del column[:-self._MAX_ENTRIES]
 
-        # Keep only last 100 reports
-        if len(self.history) > 100:
-            self.history = self.history[-100:]
+        self._pending.append(history_entry)
+        if self._autosave and len(self._pending) >= self._flush_every:
+            self.flush()
 
-        self._save_history()
+    def _read_latest_entry(self) -> Optional[Dict]:
+        """
+        Parse only the last entry of the history file
+
+        Returns:
+            The entry, or None when it can't be read on its own (no file, an
+            empty file, or a damaged last line)
+        """
+        try:
+            with open(self.history_file, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size == 0:
+                    return None
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    if data[size - 1:size] != b'\n':
+                        return None
+                    start = data.rfind(b'\n', 0, size - 1) + 1
+                    line = data[start:size - 1]
+        except (OSError, ValueError):
+            return None
+
+        try:
+            return _promote_metrics(_load_json(line))
+        except ValueError:
+            return None
 
     def get_latest_report(self) -> Optional[Dict]:
         """Get the most recent report from history"""
+        if self._history is None:
+            latest = self._read_latest_entry()
+            if latest is not None:
+                return latest
         if self.history:
             return self.history[-1]
         return None
@@ -132,19 +525,46 @@ class ReportHistoryManager:
                 return report
         return None
 
+    def _range_bounds(
+        self,
+        start_time: datetime,
+        end_time: datetime
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Slice of self.history within a time range, found by bisection
+
+        Returns:
+            Tuple of (start, stop) indices, or None when there is no usable
+            timestamp index
+        """
+        self._ensure_loaded()
+        if self._timestamps is None:
+            return None
+        try:
+            lo = bisect.bisect_left(self._timestamps, start_time.timestamp())
+            hi = bisect.bisect_right(self._timestamps, end_time.timestamp())
+        except (OverflowError, OSError, ValueError):
+            return None
+        return lo, hi
+
     def get_reports_in_range(
         self,
         start_time: datetime,
         end_time: datetime
     ) -> List[Dict]:
         """Get all reports within a time range"""
+        bounds = self._range_bounds(start_time, end_time)
+        if bounds is not None:
+            lo, hi = bounds
+            return list(islice(self.history, lo, hi))
+
         filtered = []
         for report in self.history:
             try:
-                report_time = datetime.fromisoformat(report.get('timestamp', ''))
+                report_time = _parse_timestamp(report.get('timestamp', ''))
                 if start_time <= report_time <= end_time:
                     filtered.append(report)
-            except:
+            except (ValueError, TypeError):
                 continue
         return filtered
 
@@ -185,89 +605,14 @@ class ReportHistoryManager:
         previous_summary = previous_report.get('summary', {})
 
         # Detect trends
-        trends = []
-        improvements = []
-        regressions = []
-
-        # Success rate trend
-        current_success = current_summary.get('success_rate', 0)
-        previous_success = previous_summary.get('success_rate', 0)
-
-        if previous_success > 0:
-            success_change = ((current_success - previous_success) / previous_success) * 100
-
-            if abs(success_change) > 1:  # Significant change
-                direction = "improving" if success_change > 0 else "declining"
-                confidence = "high" if abs(success_change) > 10 else "medium"
-
-                trends.append(HistoricalTrend(
-                    metric_name="Success Rate",
-                    direction=direction,
-                    change_percent=success_change,
-                    current_value=current_success,
-                    previous_value=previous_success,
-                    confidence=confidence
-                ))
-
-                if success_change > 0:
-                    improvements.append(
-                        f"Success rate improved by {success_change:.1f}% "
-                        f"({previous_success:.1f}% → {current_success:.1f}%)"
-                    )
-                else:
-                    regressions.append(
-                        f"Success rate declined by {abs(success_change):.1f}% "
-                        f"({previous_success:.1f}% → {current_success:.1f}%)"
-                    )
-
-        # Duration trend
-        current_duration = current_summary.get('duration_seconds', 0)
-        previous_duration = previous_summary.get('duration_seconds', 0)
-
-        if previous_duration > 0:
-            duration_change = ((current_duration - previous_duration) / previous_duration) * 100
-
-            if abs(duration_change) > 5:  # Significant change
-                direction = "declining" if duration_change > 0 else "improving"
-                confidence = "high" if abs(duration_change) > 20 else "medium"
-
-                trends.append(HistoricalTrend(
-                    metric_name="Execution Duration",
-                    direction=direction,
-                    change_percent=duration_change,
-                    current_value=current_duration,
-                    previous_value=previous_duration,
-                    confidence=confidence
-                ))
-
-                if duration_change < 0:
-                    improvements.append(
-                        f"Execution time improved by {abs(duration_change):.1f}% "
-                        f"({previous_duration:.1f}s → {current_duration:.1f}s)"
-                    )
-                else:
-                    regressions.append(
-                        f"Execution time increased by {duration_change:.1f}% "
-                        f"({previous_duration:.1f}s → {current_duration:.1f}s)"
-                    )
-
-        # Operations count trend
-        current_ops = current_summary.get('total_operations', 0)
-        previous_ops = previous_summary.get('total_operations', 0)
-
-        if previous_ops > 0:
-            ops_change = ((current_ops - previous_ops) / previous_ops) * 100
-
-            if abs(ops_change) > 10:
-                direction = "stable"  # More ops isn't necessarily better or worse
-                trends.append(HistoricalTrend(
-                    metric_name="Total Operations",
-                    direction=direction,
-                    change_percent=ops_change,
-                    current_value=current_ops,
-                    previous_value=previous_ops,
-                    confidence="medium"
-                ))
+        trends, improvements, regressions = self.compare_summaries(
+            current_summary.get('success_rate', 0),
+            previous_summary.get('success_rate', 0),
+            current_summary.get('duration_seconds', 0),
+            previous_summary.get('duration_seconds', 0),
+            current_summary.get('total_operations', 0),
+            previous_summary.get('total_operations', 0)
+        )
 
         # Detect anomalies
         anomalies = self._detect_anomalies(current_summary)
@@ -286,8 +631,12 @@ class ReportHistoryManager:
         else:
             summary = "No significant changes detected"
 
+        timestamp_current = current_report.get('timestamp')
+        if timestamp_current is None:
+            timestamp_current = datetime.now().isoformat()
+
         return ComparisonResult(
-            timestamp_current=current_report.get('timestamp', datetime.now().isoformat()),
+            timestamp_current=timestamp_current,
             timestamp_previous=previous_report.get('timestamp', 'N/A'),
             trends=trends,
             anomalies=anomalies,
@@ -296,73 +645,103 @@ class ReportHistoryManager:
             summary=summary
         )
 
-    def _detect_anomalies(self, current_summary: Dict) -> List[Anomaly]:
+    @staticmethod
+    def compare_summaries(
+        current_success: float,
+        previous_success: float,
+        current_duration: float,
+        previous_duration: float,
+        current_ops: float,
+        previous_ops: float
+    ) -> Tuple[List[HistoricalTrend], List[str], List[str]]:
         """
-        Detect anomalies based on historical data
+        Compare the headline metrics of two reports
 
-        Uses statistical analysis to identify unusual values
-        """
-        anomalies = []
+        Args:
+            current_success: Current success rate (%)
+            previous_success: Previous success rate (%)
+            current_duration: Current duration in seconds
+            previous_duration: Previous duration in seconds
+            current_ops: Current total operation count
+            previous_ops: Previous total operation count
 
-        if len(self.history) < 5:  # Need enough history
-            return anomalies
+        Returns:
+            Tuple of (trends, improvements, regressions)
+        """
+        trends = []
+        improvements = []
+        regressions = []
 
-        # Calculate historical statistics
-        historical_success_rates = []
-        historical_durations = []
+        values = (
+            (current_success, previous_success),
+            (current_duration, previous_duration),
+            (current_ops, previous_ops),
+        )
+        for spec, (current, previous) in zip(_TREND_SPECS, values):
+            metric_name, threshold, high_cut, higher_is_better, label, unit, worse = spec
+            trend = _compute_trend(metric_name, current, previous, threshold, high_cut, higher_is_better)
+            if trend is None:
+                continue
+            trends.append(trend)
+            if label is None:
+                continue
 
-        for report in self.history[-10:]:  # Last 10 reports
-            summary = report.get('summary', {})
-            historical_success_rates.append(summary.get('success_rate', 0))
-            historical_durations.append(summary.get('duration_seconds', 0))
+            change = (f"by {abs(trend.change_percent):.1f}% "
+                      f"({previous:.1f}{unit} → {current:.1f}{unit})")
+            if trend.direction == "improving":
+                improvements.append(f"{label} improved {change}")
+            else:
+                regressions.append(f"{label} {worse} {change}")
 
-        # Success rate anomaly
-        if historical_success_rates:
-            avg_success = sum(historical_success_rates) / len(historical_success_rates)
-            std_success = (
-                sum((x - avg_success) ** 2 for x in historical_success_rates) /
-                len(historical_success_rates)
-            ) ** 0.5
+        return trends, improvements, regressions
 
-            current_success = current_summary.get('success_rate', 0)
+    def _detect_anomalies(
+        self,
+        current_summary: Dict,
+        window: Optional[int] = None
+    ) -> List[Anomaly]:
+        """
+        Detect anomalies based on historical data
 
-            # Check if current value is outside 2 standard deviations
-            if std_success > 0:
-                z_score = abs(current_success - avg_success) / std_success
+        Uses statistical analysis to identify unusual values
 
-                if z_score > 2:  # Significant anomaly
-                    severity = "high" if z_score > 3 else "medium"
-                    anomalies.append(Anomaly(
-                        metric_name="Success Rate",
-                        current_value=current_success,
-                        expected_range=(avg_success - 2*std_success, avg_success + 2*std_success),
-                        severity=severity,
-                        description=f"Success rate {current_success:.1f}% is unusual "
-                                  f"(expected {avg_success:.1f}% ± {2*std_success:.1f}%)"
-                    ))
+        Args:
+            current_summary: Summary of the report being checked
+            window: Number of most recent reports to compare against
+                (default: _ANOMALY_WINDOW)
+        """
+        anomalies = []
+        window = window or self._ANOMALY_WINDOW
 
-        # Duration anomaly
-        if historical_durations:
-            avg_duration = sum(historical_durations) / len(historical_durations)
-            std_duration = (
-                sum((x - avg_duration) ** 2 for x in historical_durations) /
-                len(historical_durations)
-            ) ** 0.5
+        if len(self.history) < 5:  # Need enough history
+            return anomalies
 
-            current_duration = current_summary.get('duration_seconds', 0)
+        # Robust statistics over the last reports (median and MAD), so an
+        # earlier outlier in the window can't mask a new one
+        metrics = (
+            ("Success Rate", 'success_rate', "Success rate", "%"),
+            ("Execution Duration", 'duration_seconds', "Duration", "s"),
+        )
+        for metric_name, key, label, unit in metrics:
+            values = self._metrics[key][-window:]
+            if not values:
+                continue
+            median, spread = _robust_spread(values)
+            current = current_summary.get(key, 0)
 
-            if std_duration > 0:
-                z_score = abs(current_duration - avg_duration) / std_duration
+            # Check if current value is more than 2 robust deviations away
+            if spread > 0:
+                score = abs(current - median) / spread
 
-                if z_score > 2:
-                    severity = "high" if z_score > 3 else "medium"
+                if score > 2:  # Significant anomaly
+                    severity = "high" if score > 3 else "medium"
                     anomalies.append(Anomaly(
-                        metric_name="Execution Duration",
-                        current_value=current_duration,
-                        expected_range=(avg_duration - 2*std_duration, avg_duration + 2*std_duration),
+                        metric_name=metric_name,
+                        current_value=current,
+                        expected_range=(median - 2*spread, median + 2*spread),
                         severity=severity,
-                        description=f"Duration {current_duration:.1f}s is unusual "
-                                  f"(expected {avg_duration:.1f}s ± {2*std_duration:.1f}s)"
+                        description=f"{label} {current:.1f}{unit} is unusual "
+                                  f"(expected {median:.1f}{unit} ± {2*spread:.1f}{unit})"
                     ))
 
         return anomalies
@@ -377,88 +756,91 @@ class ReportHistoryManager:
         Returns:
             Trend analysis summary
         """
-        cutoff_time = datetime.now() - timedelta(days=days)
-        recent_reports = self.get_reports_in_range(cutoff_time, datetime.now())
+        now = datetime.now()
+        cutoff_time = now - timedelta(days=days)
+
+        # Metrics over time, sliced from the metric columns when the range
+        # can be bisected
+        bounds = self._range_bounds(cutoff_time, now)
+        if bounds is not None:
+            lo, hi = bounds
+            success_rates = self._metrics['success_rate'][lo:hi]
+            durations = self._metrics['duration_seconds'][lo:hi]
+            operation_counts = self._metrics['total_operations'][lo:hi]
+        else:
+            recent_reports = self.get_reports_in_range(cutoff_time, now)
+            success_rates = array('d', [r['success_rate'] for r in recent_reports])
+            durations = array('d', [r['duration_seconds'] for r in recent_reports])
+            operation_counts = array('d', [r['total_operations'] for r in recent_reports])
+        report_count = len(success_rates)
 
-        if len(recent_reports) < 2:
+        if report_count < 2:
             return {
                 'period_days': days,
-                'report_count': len(recent_reports),
+                'report_count': report_count,
                 'trends': [],
                 'summary': "Insufficient data for trend analysis"
             }
 
-        # Extract metrics over time
-        success_rates = []
-        durations = []
-        operation_counts = []
-
-        for report in recent_reports:
-            summary = report.get('summary', {})
-            success_rates.append(summary.get('success_rate', 0))
-            durations.append(summary.get('duration_seconds', 0))
-            operation_counts.append(summary.get('total_operations', 0))
-
         # Calculate trends
         trends = []
 
         # Success rate trend
         if success_rates:
-            avg_first_half = sum(success_rates[:len(success_rates)//2]) / (len(success_rates)//2)
-            avg_second_half = sum(success_rates[len(success_rates)//2:]) / (len(success_rates) - len(success_rates)//2)
+            avg_first_half, avg_second_half, average = _half_averages(success_rates)
 
             if avg_first_half > 0:
                 trend_direction = "improving" if avg_second_half > avg_first_half else "declining" if avg_second_half < avg_first_half else "stable"
                 trends.append({
                     'metric': 'Success Rate',
                     'direction': trend_direction,
-                    'average': sum(success_rates) / len(success_rates),
+                    'average': average,
                     'recent_average': avg_second_half,
                     'previous_average': avg_first_half
                 })
 
         # Duration trend
         if durations:
-            avg_first_half = sum(durations[:len(durations)//2]) / (len(durations)//2)
-            avg_second_half = sum(durations[len(durations)//2:]) / (len(durations) - len(durations)//2)
+            avg_first_half, avg_second_half, average = _half_averages(durations)
 
             trend_direction = "improving" if avg_second_half < avg_first_half else "declining" if avg_second_half > avg_first_half else "stable"
             trends.append({
                 'metric': 'Execution Duration',
                 'direction': trend_direction,
-                'average': sum(durations) / len(durations),
+                'average': average,
                 'recent_average': avg_second_half,
                 'previous_average': avg_first_half
             })
 
         return {
             'period_days': days,
-            'report_count': len(recent_reports),
+            'report_count': report_count,
             'trends': trends,
             'success_rate_range': (min(success_rates), max(success_rates)) if success_rates else (0, 0),
             'duration_range': (min(durations), max(durations)) if durations else (0, 0),
-            'summary': f"Analyzed {len(recent_reports)} reports over {days} days"
+            'summary': f"Analyzed {report_count} reports over {days} days"
         }
 
-    def export_history(self, filename: str = None) -> str:
+    def export_history(self, filename: str = None, pretty: bool = True) -> str:
         """
         Export complete history to JSON file
 
         Args:
             filename: Output filename (auto-generated if None)
+            pretty: Indent the JSON for reading; False writes compact JSON
 
         Returns:
             Path to exported file
         """
+        now = datetime.now()
         if filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
             filename = f"nava_ops_history_export_{timestamp}.json"
 
-        with open(filename, 'w') as f:
-            json.dump({
-                'export_timestamp': datetime.now().isoformat(),
-                'report_count': len(self.history),
-                'reports': self.history
-            }, f, indent=2, cls=DateTimeEncoder)
+        Path(filename).write_bytes(_dump_json({
+            'export_timestamp': now.isoformat(),
+            'report_count': len(self.history),
+            'reports': list(self.history)
+        }, pretty))
 
         return filename
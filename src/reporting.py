@@ -18,21 +18,230 @@ Optimizations:
 - Caching for repeated queries
 """
 
+import html
 import json
 import os
-from typing import List, Dict, Any, Optional
-from datetime import datetime
-from dataclasses import dataclass, asdict
-from collections import defaultdict
+import time
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple, Union
+from array import array
+from datetime import datetime, timedelta
+from dataclasses import dataclass
+from collections import Counter, defaultdict
+from itertools import compress
+from functools import lru_cache
 
 from .branch_ops import OperationResult, BranchInfo
 from .config import ReportingConfig
 from .utils import format_duration
 
+try:
+    import orjson
+except ImportError:  # Optional dependency
+    orjson = None
+
+
+# Reports are written through one large buffer, so even big documents take
+# only a handful of write syscalls
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Status badges used in HTML reports
+_BADGE_SUCCESS = '<span class="badge success">Success</span>'
+_BADGE_FAILED = '<span class="badge failed">Failed</span>'
+
+# Static start of HTML reports, through the opening <body> tag; encoded
+# once so exports write it as-is instead of re-formatting the stylesheet
+_HTML_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Multi-Branch Operations Report</title>
+    <style>
+        body {
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            max-width: 1200px;
+            margin: 0 auto;
+            padding: 20px;
+            background-color: #f5f5f5;
+        }
+        .header {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 30px;
+            border-radius: 10px;
+            margin-bottom: 30px;
+        }
+        .summary {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 20px;
+            margin-bottom: 30px;
+        }
+        .summary-card {
+            background: white;
+            padding: 20px;
+            border-radius: 8px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+        .summary-card h3 {
+            margin: 0 0 10px 0;
+            color: #666;
+            font-size: 14px;
+            text-transform: uppercase;
+        }
+        .summary-card .value {
+            font-size: 32px;
+            font-weight: bold;
+            color: #333;
+        }
+        .repo-section {
+            background: white;
+            padding: 25px;
+            border-radius: 8px;
+            margin-bottom: 20px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+        .branch {
+            border-left: 4px solid #667eea;
+            padding-left: 20px;
+            margin: 20px 0;
+        }
+        .branch.failed {
+            border-left-color: #e74c3c;
+        }
+        .operation {
+            padding: 10px;
+            margin: 10px 0;
+            background: #f8f9fa;
+            border-radius: 4px;
+        }
+        .operation.success {
+            border-left: 3px solid #2ecc71;
+        }
+        .operation.failed {
+            border-left: 3px solid #e74c3c;
+        }
+        .error {
+            background: #ffe6e6;
+            padding: 10px;
+            border-left: 3px solid #e74c3c;
+            margin: 5px 0;
+            border-radius: 4px;
+            font-family: monospace;
+            font-size: 12px;
+        }
+        .badge {
+            display: inline-block;
+            padding: 4px 8px;
+            border-radius: 4px;
+            font-size: 12px;
+            font-weight: bold;
+        }
+        .badge.success {
+            background: #d4edda;
+            color: #155724;
+        }
+        .badge.failed {
+            background: #f8d7da;
+            color: #721c24;
+        }
+        table {
+            width: 100%;
+            border-collapse: collapse;
+            margin: 20px 0;
+            background: white;
+            box-shadow: 0 1px 3px rgba(0,0,0,0.1);
+        }
+        th {
+            background: #667eea;
+            color: white;
+            padding: 12px;
+            text-align: left;
+            font-weight: 600;
+        }
+        td {
+            padding: 10px 12px;
+            border-bottom: 1px solid #e0e0e0;
+        }
+        tr:hover {
+            background: #f8f9fa;
+        }
+        .table-container {
+            overflow-x: auto;
+            background: white;
+            border-radius: 8px;
+            margin: 20px 0;
+        }
+    </style>
+</head>
+<body>
+""".encode("utf-8")
+
+
+# Markdown lines joined per write, bounding the size of intermediate strings
+_MARKDOWN_CHUNK_LINES = 4096
+
+
+def _write_report_file(filepath: str, content: Union[str, bytes, Iterable[Union[str, bytes]]]):
+    """
+    Write a rendered report
+
+    Content is either a whole document or an iterable of text or already
+    encoded fragments; fragments are written as they come, so a large
+    report is never held as one joined string.
+    """
+    if isinstance(content, (str, bytes)):
+        content = (content,)
+    with open(filepath, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+        for chunk in content:
+            f.write(chunk.encode("utf-8") if isinstance(chunk, str) else chunk)
+
+
+@lru_cache(maxsize=4096)
+def _escape_html(text: str) -> str:
+    """HTML-escape text, caching names that repeat across report rows"""
+    return html.escape(text)
+
+
+@lru_cache(maxsize=4096)
+def _escape_markdown_cell(text: str) -> str:
+    """Escape pipes so text can sit inside a Markdown table cell"""
+    return text.replace('|', '\\|')
+
+
+def _format_clock(timestamp: datetime) -> str:
+    """Format a timestamp as HH:MM:SS, sharing the result within each second"""
+    # Keyed on the whole second so operations run close together hit the
+    # cache; the tzinfo is part of the key because aware datetimes in
+    # different zones compare (and hash) equal for the same instant
+    return _format_second(timestamp.replace(microsecond=0), timestamp.tzinfo)
+
+
+@lru_cache(maxsize=4096)
+def _format_second(second: datetime, tzinfo: Any) -> str:
+    """strftime() behind _format_clock's cache"""
+    return second.strftime('%H:%M:%S')
+
+
+def _join_lines_chunked(lines: List[str]) -> Iterator[str]:
+    """Yield '\n'.join(lines) in pieces of at most _MARKDOWN_CHUNK_LINES lines"""
+    for start in range(0, len(lines), _MARKDOWN_CHUNK_LINES):
+        piece = '\n'.join(lines[start:start + _MARKDOWN_CHUNK_LINES])
+        yield piece if start == 0 else '\n' + piece
+
 
 @dataclass
 class ReportSummary:
     """Summary statistics for a report"""
+
+    # Reports can hold many instances; slots drop the per-instance __dict__
+    # (dataclass(slots=True) needs Python 3.10)
+    __slots__ = (
+        'total_operations', 'successful_operations', 'failed_operations',
+        'total_branches', 'total_repositories', 'start_time', 'end_time',
+        'duration_seconds'
+    )
+
     total_operations: int
     successful_operations: int
     failed_operations: int
@@ -49,28 +258,208 @@ class ReportSummary:
             return 0.0
         return (self.successful_operations / self.total_operations) * 100
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert summary to dictionary"""
+        return {
+            "total_operations": self.total_operations,
+            "successful_operations": self.successful_operations,
+            "failed_operations": self.failed_operations,
+            "total_branches": self.total_branches,
+            "total_repositories": self.total_repositories,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "duration_seconds": self.duration_seconds
+        }
+
 
 @dataclass
 class BranchReport:
     """Report for a single branch"""
+
+    __slots__ = ('branch_name', 'repository', 'operations', 'status', 'success', '_columns')
+
     branch_name: str
     repository: str
     operations: List[OperationResult]
     status: Dict[str, Any]
     success: bool
 
+    @property
+    def operation_columns(self) -> Tuple[List[str], array]:
+        """
+        Operation names and success flags as parallel columns
+
+        Built in one pass on first use, so aggregations run over a flat
+        array instead of reading attributes from each OperationResult.
+
+        Returns:
+            Tuple of (operation names, array of 0/1 success flags)
+        """
+        try:
+            return self._columns
+        except AttributeError:
+            operations = self.operations
+            self._columns = (
+                [op.operation for op in operations],
+                array('b', [op.success for op in operations])
+            )
+            return self._columns
+
+    @property
+    def success_count(self) -> int:
+        """Number of successful operations, reused by exporters"""
+        return sum(self.operation_columns[1])
+
+    @property
+    def success_rate(self) -> float:
+        """Calculate success rate percentage"""
+        if not self.operations:
+            return 0.0
+        return (self.success_count / len(self.operations)) * 100
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert branch report to dictionary, including its operations"""
+        return {
+            "branch_name": self.branch_name,
+            "repository": self.repository,
+            "operations": [
+                {
+                    "success": op.success,
+                    "branch_name": op.branch_name,
+                    "operation": op.operation,
+                    "message": op.message,
+                    "timestamp": op.timestamp,
+                    "error": op.error
+                }
+                for op in self.operations
+            ],
+            "status": dict(self.status),
+            "success": self.success
+        }
+
 
 @dataclass
 class Report:
     """Complete report structure"""
+
+    __slots__ = ('summary', 'branch_reports', 'errors', 'timestamp', '_branches_by_repository')
+
     summary: ReportSummary
     branch_reports: List[BranchReport]
     errors: List[str]
     timestamp: datetime
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert report to dictionary, properly handling nested dataclasses"""
-        return asdict(self)
+        """
+        Convert report to dictionary, properly handling nested dataclasses
+
+        Built field by field rather than with dataclasses.asdict(), which
+        deep-copies every nested value; datetimes are left as they are for
+        the serializer to convert.
+        """
+        return {
+            "summary": self.summary.to_dict(),
+            "branch_reports": [br.to_dict() for br in self.branch_reports],
+            "errors": list(self.errors),
+            "timestamp": self.timestamp
+        }
+
+    @property
+    def branches_by_repository(self) -> Dict[str, List[BranchReport]]:
+        """Branch reports grouped by repository, in report order (computed once)"""
+        try:
+            return self._branches_by_repository
+        except AttributeError:
+            repo_branches = defaultdict(list)
+            for br in self.branch_reports:
+                repo_branches[br.repository].append(br)
+            self._branches_by_repository = dict(repo_branches)
+            return self._branches_by_repository
+
+
+class ReportBuilder:
+    """
+    Incrementally assembles a Report as branch reports arrive
+
+    Summary counters are updated as reports are added, so finishing the
+    report doesn't need another pass over every operation.
+    """
+
+    def __init__(self, start_time: datetime):
+        """
+        Start a report
+
+        Args:
+            start_time: Operation start time
+        """
+        self.start_time = start_time
+        self._started_ns = time.perf_counter_ns()
+        self.branch_reports: List[BranchReport] = []
+        self._total_ops = 0
+        self._successful_ops = 0
+        self._repositories = set()
+
+    def add_branch_reports(self, branch_reports: List[BranchReport]):
+        """
+        Add finished branch reports
+
+        Args:
+            branch_reports: Branch reports to include
+        """
+        for br in branch_reports:
+            self._total_ops += len(br.operations)
+            self._successful_ops += br.success_count
+            self._repositories.add(br.repository)
+        self.branch_reports.extend(branch_reports)
+
+    def finish(
+        self,
+        end_time: Optional[datetime] = None,
+        errors: Optional[List[str]] = None,
+        duration_ns: Optional[int] = None
+    ) -> Report:
+        """
+        Complete the report
+
+        Without an end_time the duration is measured on the monotonic
+        perf_counter_ns() clock since the builder was created, and the end
+        time is derived from it rather than read from the wall clock again.
+
+        Args:
+            end_time: Operation end time (None to measure it)
+            errors: List of errors encountered
+            duration_ns: Measured duration in nanoseconds, if known
+
+        Returns:
+            Complete Report object
+        """
+        if end_time is None:
+            if duration_ns is None:
+                duration_ns = time.perf_counter_ns() - self._started_ns
+            end_time = self.start_time + timedelta(microseconds=duration_ns // 1000)
+
+        if duration_ns is not None:
+            duration_seconds = duration_ns / 1e9
+        else:
+            duration_seconds = (end_time - self.start_time).total_seconds()
+
+        summary = ReportSummary(
+            total_operations=self._total_ops,
+            successful_operations=self._successful_ops,
+            failed_operations=self._total_ops - self._successful_ops,
+            total_branches=len(self.branch_reports),
+            total_repositories=len(self._repositories),
+            start_time=self.start_time,
+            end_time=end_time,
+            duration_seconds=duration_seconds
+        )
+
+        return Report(
+            summary=summary,
+            branch_reports=self.branch_reports,
+            errors=errors or [],
+            timestamp=datetime.now()
+        )
 
 
 class ReportGenerator:
@@ -99,7 +488,8 @@ class ReportGenerator:
         branch_reports: List[BranchReport],
         start_time: datetime,
         end_time: datetime,
-        errors: Optional[List[str]] = None
+        errors: Optional[List[str]] = None,
+        duration_ns: Optional[int] = None
     ) -> Report:
         """
         Create a comprehensive report
@@ -109,37 +499,28 @@ class ReportGenerator:
             start_time: Operation start time
             end_time: Operation end time
             errors: List of errors encountered
+            duration_ns: Duration measured with time.perf_counter_ns(); when
+                omitted it is computed from start_time and end_time
 
         Returns:
             Complete Report object
         """
-        # Calculate summary statistics
-        total_ops = sum(len(br.operations) for br in branch_reports)
-        successful_ops = sum(
-            sum(1 for op in br.operations if op.success)
-            for br in branch_reports
-        )
+        builder = self.begin_report(start_time)
+        builder.add_branch_reports(branch_reports)
+        return builder.finish(end_time, errors, duration_ns)
 
-        # Count unique repositories
-        repos = set(br.repository for br in branch_reports)
+    def begin_report(self, start_time: datetime) -> ReportBuilder:
+        """
+        Start a report that branch reports can be streamed into
 
-        summary = ReportSummary(
-            total_operations=total_ops,
-            successful_operations=successful_ops,
-            failed_operations=total_ops - successful_ops,
-            total_branches=len(branch_reports),
-            total_repositories=len(repos),
-            start_time=start_time,
-            end_time=end_time,
-            duration_seconds=(end_time - start_time).total_seconds()
-        )
+        Args:
+            start_time: Operation start time
 
-        return Report(
-            summary=summary,
-            branch_reports=branch_reports,
-            errors=errors or [],
-            timestamp=datetime.now()
-        )
+        Returns:
+            ReportBuilder; call finish() on it to get the Report, timed
+            from this call
+        """
+        return ReportBuilder(start_time)
 
     def export_json(self, report: Report, filename: Optional[str] = None) -> str:
         """
@@ -194,8 +575,12 @@ class ReportGenerator:
             "timestamp": report.timestamp.isoformat()
         }
 
-        with open(filepath, 'w') as f:
-            json.dump(report_dict, f, indent=2)
+        # orjson's C encoder writes UTF-8 bytes directly when installed
+        if orjson is not None:
+            content = orjson.dumps(report_dict, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            content = json.dumps(report_dict, indent=2)
+        _write_report_file(filepath, content)
 
         return filepath
 
@@ -240,12 +625,13 @@ class ReportGenerator:
         lines.append("| Repository | Branch | Operations | Status | Success Rate |")
         lines.append("|------------|--------|------------|--------|--------------|")
 
-        for br in report.branch_reports:
-            status_icon = "✅" if br.success else "❌"
-            op_count = len(br.operations)
-            success_count = sum(1 for op in br.operations if op.success)
-            success_rate = (success_count / op_count * 100) if op_count > 0 else 0
-            lines.append(f"| {br.repository} | `{br.branch_name}` | {op_count} | {status_icon} | {success_rate:.1f}% |")
+        lines.extend(
+            "| %s | `%s` | %d | %s | %.1f%% |" % (
+                br.repository, br.branch_name, len(br.operations),
+                "✅" if br.success else "❌", br.success_rate
+            )
+            for br in report.branch_reports
+        )
 
         lines.append("")
 
@@ -253,12 +639,7 @@ class ReportGenerator:
         lines.append("## Detailed Branch Operations")
         lines.append("")
 
-        # Group by repository
-        repo_branches = defaultdict(list)
-        for br in report.branch_reports:
-            repo_branches[br.repository].append(br)
-
-        for repo, branches in repo_branches.items():
+        for repo, branches in report.branches_by_repository.items():
             lines.append(f"### Repository: {repo}")
             lines.append("")
 
@@ -270,11 +651,15 @@ class ReportGenerator:
                 if br.operations:
                     lines.append("| Operation | Status | Message | Timestamp |")
                     lines.append("|-----------|--------|---------|-----------|")
-                    for op in br.operations:
-                        op_icon = "✅" if op.success else "❌"
-                        timestamp = op.timestamp.strftime('%H:%M:%S')
-                        message = op.message.replace('|', '\\|')[:50]  # Escape pipes and limit length
-                        lines.append(f"| {op.operation} | {op_icon} | {message} | {timestamp} |")
+                    # Messages have pipes escaped and are limited in length
+                    lines.extend(
+                        "| %s | %s | %s | %s |" % (
+                            op.operation, "✅" if op.success else "❌",
+                            _escape_markdown_cell(op.message)[:50],
+                            _format_clock(op.timestamp)
+                        )
+                        for op in br.operations
+                    )
                     lines.append("")
 
                     # Add errors if any
@@ -303,8 +688,7 @@ class ReportGenerator:
             lines.append("")
 
         # Write to file
-        with open(filepath, 'w') as f:
-            f.write('\n'.join(lines))
+        _write_report_file(filepath, _join_lines_chunked(lines))
 
         return filepath
 
@@ -325,133 +709,8 @@ class ReportGenerator:
 
         filepath = os.path.join(self.config.output_dir, filename)
 
-        # Build HTML content
-        html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Multi-Branch Operations Report</title>
-    <style>
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }}
-        .header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 30px;
-            border-radius: 10px;
-            margin-bottom: 30px;
-        }}
-        .summary {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-            margin-bottom: 30px;
-        }}
-        .summary-card {{
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        .summary-card h3 {{
-            margin: 0 0 10px 0;
-            color: #666;
-            font-size: 14px;
-            text-transform: uppercase;
-        }}
-        .summary-card .value {{
-            font-size: 32px;
-            font-weight: bold;
-            color: #333;
-        }}
-        .repo-section {{
-            background: white;
-            padding: 25px;
-            border-radius: 8px;
-            margin-bottom: 20px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        .branch {{
-            border-left: 4px solid #667eea;
-            padding-left: 20px;
-            margin: 20px 0;
-        }}
-        .branch.failed {{
-            border-left-color: #e74c3c;
-        }}
-        .operation {{
-            padding: 10px;
-            margin: 10px 0;
-            background: #f8f9fa;
-            border-radius: 4px;
-        }}
-        .operation.success {{
-            border-left: 3px solid #2ecc71;
-        }}
-        .operation.failed {{
-            border-left: 3px solid #e74c3c;
-        }}
-        .error {{
-            background: #ffe6e6;
-            padding: 10px;
-            border-left: 3px solid #e74c3c;
-            margin: 5px 0;
-            border-radius: 4px;
-            font-family: monospace;
-            font-size: 12px;
-        }}
-        .badge {{
-            display: inline-block;
-            padding: 4px 8px;
-            border-radius: 4px;
-            font-size: 12px;
-            font-weight: bold;
-        }}
-        .badge.success {{
-            background: #d4edda;
-            color: #155724;
-        }}
-        .badge.failed {{
-            background: #f8d7da;
-            color: #721c24;
-        }}
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin: 20px 0;
-            background: white;
-            box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-        }}
-        th {{
-            background: #667eea;
-            color: white;
-            padding: 12px;
-            text-align: left;
-            font-weight: 600;
-        }}
-        td {{
-            padding: 10px 12px;
-            border-bottom: 1px solid #e0e0e0;
-        }}
-        tr:hover {{
-            background: #f8f9fa;
-        }}
-        .table-container {{
-            overflow-x: auto;
-            background: white;
-            border-radius: 8px;
-            margin: 20px 0;
-        }}
-    </style>
-</head>
-<body>
-    <div class="header">
+        # Build HTML content as a list of fragments
+        parts = [_HTML_HEAD, f"""    <div class="header">
         <h1>Multi-Branch Operations Report</h1>
         <p>Generated: {report.timestamp.strftime('%Y-%m-%d %H:%M:%S')}</p>
     </div>
@@ -489,85 +748,76 @@ class ReportGenerator:
                     </tr>
                 </thead>
                 <tbody>
-"""
+"""]
 
         # Add summary table rows
         for br in report.branch_reports:
-            status_badge = '<span class="badge success">Success</span>' if br.success else '<span class="badge failed">Failed</span>'
-            op_count = len(br.operations)
-            success_count = sum(1 for op in br.operations if op.success)
-            success_rate = (success_count / op_count * 100) if op_count > 0 else 0
+            status_badge = _BADGE_SUCCESS if br.success else _BADGE_FAILED
 
-            html += f"""
+            parts.append(f"""
                     <tr>
-                        <td>{br.repository}</td>
-                        <td><code>{br.branch_name}</code></td>
-                        <td>{op_count}</td>
+                        <td>{_escape_html(br.repository)}</td>
+                        <td><code>{_escape_html(br.branch_name)}</code></td>
+                        <td>{len(br.operations)}</td>
                         <td>{status_badge}</td>
-                        <td>{success_rate:.1f}%</td>
+                        <td>{br.success_rate:.1f}%</td>
                     </tr>
-"""
+""")
 
-        html += """
+        parts.append("""
                 </tbody>
             </table>
         </div>
     </div>
-"""
-
-        # Group by repository
-        repo_branches = defaultdict(list)
-        for br in report.branch_reports:
-            repo_branches[br.repository].append(br)
+""")
 
-        for repo, branches in repo_branches.items():
-            html += f"""
+        for repo, branches in report.branches_by_repository.items():
+            parts.append(f"""
     <div class="repo-section">
-        <h2>Repository: {repo}</h2>
-"""
+        <h2>Repository: {_escape_html(repo)}</h2>
+""")
 
             for br in branches:
                 branch_class = "" if br.success else "failed"
-                status_badge = f'<span class="badge success">Success</span>' if br.success else '<span class="badge failed">Failed</span>'
+                status_badge = _BADGE_SUCCESS if br.success else _BADGE_FAILED
 
-                html += f"""
+                parts.append(f"""
         <div class="branch {branch_class}">
-            <h3>{br.branch_name} {status_badge}</h3>
-"""
+            <h3>{_escape_html(br.branch_name)} {status_badge}</h3>
+""")
 
                 if br.operations:
-                    html += "            <h4>Operations:</h4>\n"
+                    parts.append("            <h4>Operations:</h4>\n")
                     for op in br.operations:
                         op_class = "success" if op.success else "failed"
-                        html += f"""
+                        parts.append(f"""
             <div class="operation {op_class}">
-                <strong>{op.operation}</strong>: {op.message}
-"""
+                <strong>{_escape_html(op.operation)}</strong>: {_escape_html(op.message)}
+""")
                         if op.error:
-                            html += f'                <div class="error">{op.error}</div>\n'
-                        html += "            </div>\n"
+                            parts.append(f'                <div class="error">{_escape_html(op.error)}</div>\n')
+                        parts.append("            </div>\n")
 
-                html += "        </div>\n"
+                parts.append("        </div>\n")
 
-            html += "    </div>\n"
+            parts.append("    </div>\n")
 
         # Add errors if any
         if report.errors:
-            html += """
+            parts.append("""
     <div class="repo-section">
         <h2>Errors</h2>
-"""
+""")
             for error in report.errors:
-                html += f'        <div class="error">{error}</div>\n'
-            html += "    </div>\n"
+                parts.append(f'        <div class="error">{_escape_html(error)}</div>\n')
+            parts.append("    </div>\n")
 
-        html += """
+        parts.append("""
 </body>
 </html>
-"""
+""")
 
-        with open(filepath, 'w') as f:
-            f.write(html)
+        _write_report_file(filepath, parts)
 
         return filepath
 
@@ -613,20 +863,21 @@ class ReportGenerator:
             "by_repository": {}
         }
 
-        # Analyze by operation type
-        op_types = defaultdict(lambda: {"total": 0, "success": 0, "failed": 0})
+        # Analyze by operation type; Counter.update counts whole columns in C
+        totals = Counter()
+        successes = Counter()
         for br in report.branch_reports:
-            for op in br.operations:
-                op_types[op.operation]["total"] += 1
-                if op.success:
-                    op_types[op.operation]["success"] += 1
-                else:
-                    op_types[op.operation]["failed"] += 1
-
-        for op_type, counts in op_types.items():
+            operations, flags = br.operation_columns
+            totals.update(operations)
+            successes.update(compress(operations, flags))
+
+        for op_type, total in totals.items():
+            success = successes[op_type]
             stats["by_operation_type"][op_type] = {
-                **counts,
-                "success_rate": (counts["success"] / counts["total"] * 100) if counts["total"] > 0 else 0
+                "total": total,
+                "success": success,
+                "failed": total - success,
+                "success_rate": success / total * 100
             }
 
         # Analyze by repository
@@ -634,7 +885,7 @@ class ReportGenerator:
         for br in report.branch_reports:
             repo_stats[br.repository]["branches"] += 1
             repo_stats[br.repository]["operations"] += len(br.operations)
-            repo_stats[br.repository]["success"] += sum(1 for op in br.operations if op.success)
+            repo_stats[br.repository]["success"] += br.success_count
 
         stats["by_repository"] = dict(repo_stats)
 
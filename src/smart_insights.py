@@ -13,6 +13,7 @@ Provides AI-powered recommendations and insights for Git operations:
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from itertools import islice
 
 
 def safe_get(obj: Any, key: str, default: Any = None) -> Any:
@@ -135,7 +136,7 @@ class SmartInsightsEngine:
 
         # Declining trend
         if history and len(history) >= 2:
-            recent_rates = [safe_get(safe_get(h, 'summary', {}), 'success_rate', 0) for h in history[-5:]]
+            recent_rates = [safe_get(safe_get(h, 'summary', {}), 'success_rate', 0) for h in islice(history, max(len(history) - 5, 0), None)]
             if len(recent_rates) >= 3:
                 first_half_avg = sum(recent_rates[:len(recent_rates)//2]) / (len(recent_rates)//2)
                 second_half_avg = sum(recent_rates[len(recent_rates)//2:]) / (len(recent_rates) - len(recent_rates)//2)
@@ -11,6 +11,7 @@ Key responsibilities:
 - Handle subprocess execution and output parsing
 """
 
+import asyncio
 import subprocess
 import time
 import logging
@@ -117,6 +118,90 @@ def execute_git_command(
     return result
 
 
+async def execute_command_async(
+    command: List[str],
+    cwd: Optional[str] = None,
+    timeout: int = 30
+) -> CommandResult:
+    """
+    Execute a command on the running event loop and return the result
+
+    Async counterpart of execute_command(); waiting on the process doesn't
+    tie up a thread.
+
+    Args:
+        command: Command to execute as a list of strings
+        cwd: Working directory for the command
+        timeout: Command timeout in seconds
+
+    Returns:
+        CommandResult with execution details
+    """
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            cwd=cwd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+    except Exception as e:
+        logger.error(f"Error executing command: {e}")
+        return CommandResult(
+            success=False,
+            stdout="",
+            stderr=str(e),
+            returncode=-1
+        )
+
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        logger.error(f"Command timed out: {' '.join(command)}")
+        return CommandResult(
+            success=False,
+            stdout="",
+            stderr=f"Command timed out after {timeout} seconds",
+            returncode=-1
+        )
+
+    return CommandResult(
+        success=process.returncode == 0,
+        stdout=stdout.decode(errors="replace").strip(),
+        stderr=stderr.decode(errors="replace").strip(),
+        returncode=process.returncode
+    )
+
+
+async def execute_git_command_async(
+    args: List[str],
+    repo_path: str,
+    timeout: int = 30
+) -> CommandResult:
+    """
+    Execute a Git command in a repository on the running event loop
+
+    Args:
+        args: Git command arguments (without 'git')
+        repo_path: Path to the Git repository
+        timeout: Command timeout in seconds
+
+    Returns:
+        CommandResult with execution details
+    """
+    command = ["git"] + args
+    logger.debug(f"Executing: {' '.join(command)} in {repo_path}")
+
+    result = await execute_command_async(command, cwd=repo_path, timeout=timeout)
+
+    if not result.success:
+        error_msg = f"Git command failed: {' '.join(command)}\nError: {result.stderr}"
+        logger.error(error_msg)
+
+    return result
+
+
 def retry_with_backoff(
     func,
     max_attempts: int = 3,
@@ -186,6 +271,62 @@ def retry_with_backoff(
     raise RuntimeError("Retry logic failed unexpectedly")
 
 
+async def retry_with_backoff_async(
+    func,
+    max_attempts: int = 3,
+    initial_delay: float = 2.0,
+    exponential_base: float = 2.0
+) -> CommandResult:
+    """
+    Retry a coroutine function with exponential backoff
+
+    Async counterpart of retry_with_backoff(); waits with asyncio.sleep so
+    other operations keep running between attempts.
+
+    Args:
+        func: Coroutine function returning a CommandResult
+        max_attempts: Maximum number of retry attempts
+        initial_delay: Initial delay in seconds
+        exponential_base: Base for exponential backoff calculation
+
+    Returns:
+        Result from the function
+
+    Raises:
+        Exception: If all retry attempts fail
+    """
+    delay = initial_delay
+
+    for attempt in range(1, max_attempts + 1):
+        try:
+            result = await func()
+        except Exception:
+            if attempt < max_attempts:
+                logger.warning(f"Attempt {attempt} raised exception, retrying in {delay:.1f}s...")
+                await asyncio.sleep(delay)
+                delay *= exponential_base
+                continue
+            logger.error(f"All {max_attempts} attempts failed with exception")
+            raise
+
+        if result.success or attempt == max_attempts:
+            if result.success and attempt > 1:
+                logger.info(f"Operation succeeded on attempt {attempt}")
+            elif not result.success:
+                logger.error(f"All {max_attempts} attempts failed")
+            return result
+
+        logger.warning(
+            f"Attempt {attempt} failed, retrying in {delay:.1f}s... "
+            f"Error: {result.stderr}"
+        )
+        await asyncio.sleep(delay)
+        delay *= exponential_base
+
+    # Should not reach here, but just in case
+    raise RuntimeError("Retry logic failed unexpectedly")
+
+
 def validate_branch_name(branch_name: str) -> bool:
     """
     Validate a Git branch name
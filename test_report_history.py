@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""
+Tests for the report history file: appends, reloads, compaction, repair of a
+torn last line, legacy migration, batched writes and the lazy latest report
+"""
+
+import sys
+import os
+import json
+import tempfile
+import traceback
+from datetime import datetime
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+from src.report_history import ReportHistoryManager
+
+# Test results storage
+test_results = {
+    "passed": [],
+    "failed": [],
+    "errors": []
+}
+
+
+def log_test(name, status, error=None):
+    """Log test result"""
+    if status == "passed":
+        test_results["passed"].append(name)
+        print(f"✅ {name}")
+    else:
+        test_results["failed"].append(name)
+        test_results["errors"].append({
+            "test": name,
+            "error": str(error),
+            "traceback": traceback.format_exc() if error else None
+        })
+        print(f"❌ {name}")
+        if error:
+            print(f"   Error: {error}")
+
+
+class SmallHistoryManager(ReportHistoryManager):
+    """History manager retaining few entries, so compaction is quick to reach"""
+    _MAX_ENTRIES = 5
+
+
+def make_report(index):
+    """Minimal report dict as produced by Report.to_dict()"""
+    return {
+        "summary": {
+            "success_rate": float(index),
+            "duration_seconds": index / 10,
+            "total_operations": index
+        },
+        "branch_reports": [{}] * index,
+        "errors": []
+    }
+
+
+def read_lines(history_dir):
+    """Parsed entries of the history file; fails on any unreadable line"""
+    path = Path(history_dir) / "report_history.jsonl"
+    if not path.exists():
+        return []
+    data = path.read_bytes()
+    assert not data or data.endswith(b"\n"), "history file doesn't end with a newline"
+    return [json.loads(line) for line in data.splitlines()]
+
+
+def test_append_and_reload():
+    """Test that reports are appended and read back"""
+    print("\n" + "="*70)
+    print("TEST 1: Append & Reload")
+    print("="*70)
+
+    with tempfile.TemporaryDirectory() as history_dir:
+        # Test 1: Each added report appends one line
+        try:
+            manager = ReportHistoryManager(history_dir)
+            for i in range(3):
+                manager.add_report(make_report(i))
+                assert len(read_lines(history_dir)) == i + 1
+            log_test("Append one line per report", "passed")
+        except Exception as e:
+            log_test("Append one line per report", "failed", e)
+
+        # Test 2: A new manager loads the same entries
+        try:
+            reloaded = ReportHistoryManager(history_dir)
+            assert len(reloaded.history) == 3
+            assert [r["timestamp"] for r in reloaded.history] == \
+                [r["timestamp"] for r in manager.history]
+            assert [r["total_operations"] for r in reloaded.history] == [0, 1, 2]
+            assert list(reloaded._metrics["success_rate"]) == [0.0, 1.0, 2.0]
+            log_test("Reload history", "passed")
+        except Exception as e:
+            log_test("Reload history", "failed", e)
+
+        # Test 3: Appending after a reload keeps earlier entries
+        try:
+            reloaded.add_report(make_report(3))
+            assert [r["total_operations"] for r in read_lines(history_dir)] == [0, 1, 2, 3]
+            log_test("Append after reload", "passed")
+        except Exception as e:
+            log_test("Append after reload", "failed", e)
+
+
+def test_compaction():
+    """Test that the history file is compacted to the retained entries"""
+    print("\n" + "="*70)
+    print("TEST 2: Compaction")
+    print("="*70)
+
+    limit = SmallHistoryManager._MAX_ENTRIES
+
+    with tempfile.TemporaryDirectory() as history_dir:
+        # Test 1: The file grows to twice the retained history
+        try:
+            manager = SmallHistoryManager(history_dir)
+            for i in range(2 * limit):
+                manager.add_report(make_report(i))
+            assert len(read_lines(history_dir)) == 2 * limit
+            assert len(manager.history) == limit
+            log_test("Append up to twice the retained history", "passed")
+        except Exception as e:
+            log_test("Append up to twice the retained history", "failed", e)
+
+        # Test 2: The next write rewrites it with only the retained entries
+        try:
+            manager.add_report(make_report(2 * limit))
+            entries = read_lines(history_dir)
+            assert len(entries) == limit
+            assert [r["total_operations"] for r in entries] == \
+                list(range(limit + 1, 2 * limit + 1))
+            assert [r["timestamp"] for r in entries] == \
+                [r["timestamp"] for r in manager.history]
+            log_test("Compact history file", "passed")
+        except Exception as e:
+            log_test("Compact history file", "failed", e)
+
+        # Test 3: A reload sees the compacted file
+        try:
+            reloaded = SmallHistoryManager(history_dir)
+            assert len(reloaded.history) == limit
+            assert reloaded._file_entries == limit
+            log_test("Reload compacted history", "passed")
+        except Exception as e:
+            log_test("Reload compacted history", "failed", e)
+
+
+def test_torn_last_line():
+    """Test recovery from a write cut short"""
+    print("\n" + "="*70)
+    print("TEST 3: Torn Last Line")
+    print("="*70)
+
+    with tempfile.TemporaryDirectory() as history_dir:
+        manager = ReportHistoryManager(history_dir)
+        for i in range(2):
+            manager.add_report(make_report(i))
+        history_file = Path(history_dir) / "report_history.jsonl"
+        with open(history_file, "ab") as f:
+            f.write(b'{"timestamp": "2024-01-01T00:00')
+
+        # Test 1: Intact entries load and the partial line is dropped
+        try:
+            reloaded = ReportHistoryManager(history_dir)
+            assert len(reloaded.history) == 2
+            assert [r["total_operations"] for r in read_lines(history_dir)] == [0, 1]
+            log_test("Repair torn last line", "passed")
+        except Exception as e:
+            log_test("Repair torn last line", "failed", e)
+
+        # Test 2: Later appends start on a fresh line
+        try:
+            reloaded.add_report(make_report(2))
+            assert [r["total_operations"] for r in read_lines(history_dir)] == [0, 1, 2]
+            log_test("Append after repair", "passed")
+        except Exception as e:
+            log_test("Append after repair", "failed", e)
+
+
+def test_legacy_migration():
+    """Test migration of history written as a single JSON array"""
+    print("\n" + "="*70)
+    print("TEST 4: Legacy Migration")
+    print("="*70)
+
+    with tempfile.TemporaryDirectory() as history_dir:
+        legacy = [
+            {
+                "timestamp": f"2024-01-0{i + 1}T12:00:00",
+                "summary": make_report(i)["summary"],
+                "analytics": {},
+                "branch_count": i,
+                "error_count": 0
+            }
+            for i in range(3)
+        ]
+        (Path(history_dir) / "report_history.json").write_text(json.dumps(legacy))
+
+        # Test 1: Entries load with their metrics promoted
+        try:
+            manager = ReportHistoryManager(history_dir)
+            assert len(manager.history) == 3
+            assert [r["success_rate"] for r in manager.history] == [0.0, 1.0, 2.0]
+            log_test("Load legacy history", "passed")
+        except Exception as e:
+            log_test("Load legacy history", "failed", e)
+
+        # Test 2: They are rewritten as JSON lines
+        try:
+            entries = read_lines(history_dir)
+            assert [r["timestamp"] for r in entries] == [r["timestamp"] for r in legacy]
+            log_test("Migrate to JSON lines", "passed")
+        except Exception as e:
+            log_test("Migrate to JSON lines", "failed", e)
+
+        # Test 3: Range queries work on the migrated entries
+        try:
+            in_range = manager.get_reports_in_range(
+                datetime(2024, 1, 2), datetime(2024, 1, 3, 23, 59)
+            )
+            assert [r["total_operations"] for r in in_range] == [1, 2]
+            log_test("Query migrated history", "passed")
+        except Exception as e:
+            log_test("Query migrated history", "failed", e)
+
+
+def test_batched_writes():
+    """Test flush_every and autosave=False"""
+    print("\n" + "="*70)
+    print("TEST 5: Batched Writes")
+    print("="*70)
+
+    # Test 1: flush_every batches reports into one write
+    with tempfile.TemporaryDirectory() as history_dir:
+        try:
+            manager = ReportHistoryManager(history_dir, flush_every=3)
+            manager.add_report(make_report(0))
+            manager.add_report(make_report(1))
+            assert read_lines(history_dir) == []
+            manager.add_report(make_report(2))
+            assert len(read_lines(history_dir)) == 3
+            manager.add_report(make_report(3))
+            manager.close()
+            assert len(read_lines(history_dir)) == 4
+            log_test("flush_every batching", "passed")
+        except Exception as e:
+            log_test("flush_every batching", "failed", e)
+
+    # Test 2: Without autosave nothing is written until flush()
+    with tempfile.TemporaryDirectory() as history_dir:
+        try:
+            manager = ReportHistoryManager(history_dir, autosave=False)
+            for i in range(4):
+                manager.add_report(make_report(i))
+            assert read_lines(history_dir) == []
+            assert len(manager.history) == 4
+            manager.flush()
+            assert len(read_lines(history_dir)) == 4
+            manager.flush()
+            manager.close()
+            assert len(read_lines(history_dir)) == 4
+            log_test("autosave=False batching", "passed")
+        except Exception as e:
+            log_test("autosave=False batching", "failed", e)
+
+
+def test_lazy_latest_report():
+    """Test that the latest report is read without loading the history"""
+    print("\n" + "="*70)
+    print("TEST 6: Lazy Latest Report")
+    print("="*70)
+
+    with tempfile.TemporaryDirectory() as history_dir:
+        # Test 1: No history
+        try:
+            assert ReportHistoryManager(history_dir).get_latest_report() is None
+            log_test("Latest report of empty history", "passed")
+        except Exception as e:
+            log_test("Latest report of empty history", "failed", e)
+
+        writer = ReportHistoryManager(history_dir)
+        for i in range(3):
+            writer.add_report(make_report(i))
+
+        # Test 2: Only the last line is parsed
+        try:
+            manager = ReportHistoryManager(history_dir)
+            latest = manager.get_latest_report()
+            assert latest["total_operations"] == 2
+            assert latest["timestamp"] == writer.history[-1]["timestamp"]
+            assert manager._history is None
+            log_test("Latest report without loading history", "passed")
+        except Exception as e:
+            log_test("Latest report without loading history", "failed", e)
+
+        # Test 3: A torn last line falls back to loading the history
+        try:
+            with open(Path(history_dir) / "report_history.jsonl", "ab") as f:
+                f.write(b'{"timestamp"')
+            manager = ReportHistoryManager(history_dir)
+            assert manager.get_latest_report()["total_operations"] == 2
+            assert manager._history is not None
+            log_test("Latest report after torn last line", "passed")
+        except Exception as e:
+            log_test("Latest report after torn last line", "failed", e)
+
+
+def test_non_numeric_metrics():
+    """Test reports whose summary metrics aren't numbers"""
+    print("\n" + "="*70)
+    print("TEST 7: Non-numeric Metrics")
+    print("="*70)
+
+    odd_report = {
+        "summary": {"success_rate": "95.00%", "duration_seconds": None},
+        "branch_reports": [],
+        "errors": []
+    }
+
+    with tempfile.TemporaryDirectory() as history_dir:
+        # Test 1: Adding one stores zeros and keeps the columns aligned
+        try:
+            manager = ReportHistoryManager(history_dir)
+            manager.add_report(make_report(1))
+            manager.add_report(odd_report)
+            manager.add_report(make_report(2))
+            assert [r["success_rate"] for r in manager.history] == [1.0, 0.0, 2.0]
+            assert list(manager._metrics["duration_seconds"]) == [0.1, 0.0, 0.2]
+            log_test("Add report with non-numeric metrics", "passed")
+        except Exception as e:
+            log_test("Add report with non-numeric metrics", "failed", e)
+
+        # Test 2: A history file containing one still loads
+        try:
+            reloaded = ReportHistoryManager(history_dir)
+            assert len(reloaded.history) == 3
+            assert reloaded.get_latest_report()["success_rate"] == 2.0
+            reloaded.add_report(make_report(3))
+            assert len(reloaded._metrics["success_rate"]) == 4
+            log_test("Load history with non-numeric metrics", "passed")
+        except Exception as e:
+            log_test("Load history with non-numeric metrics", "failed", e)
+
+
+def print_summary():
+    """Print test summary"""
+    print("\n" + "="*70)
+    print("TEST SUMMARY")
+    print("="*70)
+    print(f"\n✅ Passed: {len(test_results['passed'])}")
+    print(f"❌ Failed: {len(test_results['failed'])}")
+
+    if test_results['failed']:
+        print("\nFailed Tests:")
+        for error in test_results['errors']:
+            print(f"\n❌ {error['test']}")
+            print(f"   Error: {error['error']}")
+            if error['traceback']:
+                print(f"   Traceback:\n{error['traceback']}")
+
+    return len(test_results['failed']) == 0
+
+
+def main():
+    """Run all tests"""
+    print("="*70)
+    print("NAVA OPS - REPORT HISTORY TESTS")
+    print("="*70)
+
+    test_append_and_reload()
+    test_compaction()
+    test_torn_last_line()
+    test_legacy_migration()
+    test_batched_writes()
+    test_lazy_latest_report()
+    test_non_numeric_metrics()
+
+    success = print_summary()
+    sys.exit(0 if success else 1)
+
+
+if __name__ == "__main__":
+    main()